@@ -2,6 +2,8 @@ import os
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from api.routes import triage, conversation, feedback, mlflow_routes, debug_mlflow, simulation, history, benchmark
 
@@ -13,6 +15,25 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Routes en flux (NDJSON) : la compression bufferiserait les lignes jusqu'à la fin du flux
+UNCOMPRESSED_STREAM_PATHS = frozenset({"/simulation/turn/stream"})
+
+
+class StreamingAwareGZipMiddleware:
+    """GZipMiddleware, sauf pour les routes en flux qui doivent partir ligne par ligne."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, excluded_paths: frozenset = frozenset()):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.excluded_paths = excluded_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+
 app = FastAPI(
     title="RedFlag API",
     description="API de Triage Medical Intelligent avec MLflow - Hugging Face Spaces",
@@ -28,6 +49,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compression des réponses volumineuses (historique, audits, conversations) :
+# requests envoie Accept-Encoding: gzip et décompresse à la volée
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1000, excluded_paths=UNCOMPRESSED_STREAM_PATHS)
+
 # Inclusion des routers
 app.include_router(triage.router, prefix="/triage", tags=["Triage"])
 app.include_router(conversation.router, prefix="/conversation", tags=["Conversation"])
@@ -8,6 +8,7 @@ import time
 from pathlib import Path
 from typing import Tuple, Optional
 import numpy as np
+import pandas as pd
 from xgboost import XGBClassifier
 
 from .preprocessor import TriagePreprocessor
@@ -69,11 +70,11 @@ class TriageClassifier:
             y_train: Labels d'entraînement
         """
         print("Entrainement du modele XGBoost...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         self.model.fit(X_train, y_train)
 
-        elapsed_time = time.time() - start_time
+        elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
         print(f"Entrainement termine en {elapsed_time:.2f}s")
 
         self.is_trained = True
@@ -94,12 +95,12 @@ class TriageClassifier:
         if not self.is_trained:
             raise ValueError("Le modèle n'est pas encore entraîné.")
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         predictions = self.model.predict(X)
         probabilities = self.model.predict_proba(X)
 
-        latency = time.time() - start_time
+        latency = (time.perf_counter_ns() - start_time) / 1e9
 
         return predictions, probabilities, latency
 
@@ -120,8 +121,6 @@ class TriageClassifier:
                 - latency: Temps de prédiction (en secondes)
         """
         # Conversion en DataFrame pour le préprocesseur
-        import pandas as pd
-
         df = pd.DataFrame([features])
 
         # Préparation des features
@@ -6,9 +6,7 @@ import numpy as np
 from typing import Dict
 from sklearn.metrics import (
     accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
+    precision_recall_fscore_support,
     classification_report,
     confusion_matrix,
 )
@@ -49,18 +47,42 @@ class ModelEvaluator:
         # Métriques globales
         metrics = {
             "accuracy": accuracy_score(y_test, y_pred),
-            "precision_macro": precision_score(y_test, y_pred, average="macro"),
-            "recall_macro": recall_score(y_test, y_pred, average="macro"),
-            "f1_macro": f1_score(y_test, y_pred, average="macro"),
-            "precision_weighted": precision_score(y_test, y_pred, average="weighted"),
-            "recall_weighted": recall_score(y_test, y_pred, average="weighted"),
-            "f1_weighted": f1_score(y_test, y_pred, average="weighted"),
+            **ModelEvaluator._average_scores(y_test, y_pred),
             "latency_total": latency,
             "latency_per_sample": latency / len(X_test),
         }
 
         return metrics
 
+    @staticmethod
+    def _average_scores(y_test: np.ndarray, y_pred: np.ndarray) -> Dict:
+        """
+        Calcule precision / recall / F1 en moyennes macro et weighted.
+
+        Les scores par classe sont calculés une seule fois, puis moyennés
+        avec NumPy (au lieu d'un appel sklearn par métrique et par moyenne).
+
+        Args:
+            y_test: Labels réels
+            y_pred: Labels prédits
+
+        Returns:
+            Dict: Scores macro et weighted
+        """
+        labels = np.unique(np.concatenate([np.asarray(y_test), np.asarray(y_pred)]))
+        precision, recall, f1, support = precision_recall_fscore_support(
+            y_test, y_pred, labels=labels, average=None, zero_division=0
+        )
+
+        return {
+            "precision_macro": float(precision.mean()),
+            "recall_macro": float(recall.mean()),
+            "f1_macro": float(f1.mean()),
+            "precision_weighted": float(np.average(precision, weights=support)),
+            "recall_weighted": float(np.average(recall, weights=support)),
+            "f1_weighted": float(np.average(f1, weights=support)),
+        }
+
     @staticmethod
     def print_evaluation(
         classifier: TriageClassifier,
@@ -155,24 +177,19 @@ class ModelEvaluator:
         # Noms des classes
         class_names = classifier.preprocessor.get_class_names()
 
-        # Métriques par classe
-        precision_per_class = precision_score(
-            y_test, y_pred, average=None, labels=range(len(class_names))
-        )
-        recall_per_class = recall_score(
-            y_test, y_pred, average=None, labels=range(len(class_names))
-        )
-        f1_per_class = f1_score(
-            y_test, y_pred, average=None, labels=range(len(class_names))
+        # Métriques par classe (un seul calcul pour les trois scores)
+        precision_per_class, recall_per_class, f1_per_class, _ = precision_recall_fscore_support(
+            y_test, y_pred, average=None, labels=range(len(class_names)), zero_division=0
         )
+        averages = ModelEvaluator._average_scores(y_test, y_pred)
 
         # Construction du dictionnaire
         metrics = {
             "global": {
                 "accuracy": float(accuracy_score(y_test, y_pred)),
-                "precision_macro": float(precision_score(y_test, y_pred, average="macro")),
-                "recall_macro": float(recall_score(y_test, y_pred, average="macro")),
-                "f1_macro": float(f1_score(y_test, y_pred, average="macro")),
+                "precision_macro": averages["precision_macro"],
+                "recall_macro": averages["recall_macro"],
+                "f1_macro": averages["f1_macro"],
                 "latency_total": float(latency),
                 "latency_per_sample": float(latency / len(X_test)),
             },
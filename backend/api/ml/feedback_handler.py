@@ -9,12 +9,14 @@ Ce module gere:
 
 import json
 import logging
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 import pandas as pd
 
+from api.routes.history import load_history, save_history
 from api.schemas.feedback import (
     NurseFeedback,
     FeedbackStats,
@@ -35,6 +37,14 @@ class FeedbackHandler:
     RETRAINING_THRESHOLD = 100  # Minimum de feedbacks avant reentrainement
     ERROR_RATE_THRESHOLD = 0.15  # Seuil d'erreur pour alerte
 
+    # Type de feedback -> compteur des stats par niveau de gravite
+    GRAVITY_STAT_KEYS = {
+        FeedbackType.CORRECT.value: "correct",
+        FeedbackType.UPGRADE.value: "upgraded",
+        FeedbackType.DOWNGRADE.value: "downgraded",
+        FeedbackType.DISAGREE.value: "disagreed",
+    }
+
     def __init__(self):
         """Initialise le gestionnaire de feedback."""
         self.feedback_dir = Path(self.FEEDBACK_DIR)
@@ -43,6 +53,9 @@ class FeedbackHandler:
         # Creer le dossier si necessaire
         self.feedback_dir.mkdir(parents=True, exist_ok=True)
 
+        # Dernier comptage : ((mtime_ns, taille) du fichier, nombre de feedbacks valides)
+        self._count_cache = None
+
     def record_feedback(self, feedback: NurseFeedback) -> str:
         """
         Enregistre un feedback.
@@ -83,8 +96,6 @@ class FeedbackHandler:
         Met à jour les champs feedback_given, feedback_type et corrected_gravity
         dans l'entrée correspondante de history.json.
         """
-        from api.routes.history import load_history, save_history
-
         try:
             history = load_history()
 
@@ -112,8 +123,6 @@ class FeedbackHandler:
 
     def _create_history_entry_from_feedback(self, feedback: NurseFeedback, history: list) -> None:
         """Crée une entrée dans history.json à partir d'un feedback."""
-        from api.routes.history import save_history
-
         # Construire les constantes à partir des features patient
         features = feedback.patient_features or {}
         constantes = {
@@ -181,8 +190,21 @@ class FeedbackHandler:
         return feedback_list
 
     def get_feedback_count(self) -> int:
-        """Retourne le nombre total de feedbacks."""
-        return len(self.get_all_feedback())
+        """
+        Retourne le nombre total de feedbacks.
+
+        Même décompte que get_all_feedback() (lignes JSON valides), mis en cache
+        tant que le fichier n'a pas changé : /feedback/count, sondé par le
+        frontend, ne redésérialise pas tout le JSONL à chaque appel.
+        """
+        if not self.feedback_path.exists():
+            return 0
+
+        stat = self.feedback_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._count_cache is None or self._count_cache[0] != signature:
+            self._count_cache = (signature, len(self.get_all_feedback()))
+        return self._count_cache[1]
 
     def get_stats(
         self,
@@ -214,11 +236,12 @@ class FeedbackHandler:
 
         total = len(feedback_list)
 
-        # Compter par type
-        correct = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.CORRECT.value)
-        upgrades = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.UPGRADE.value)
-        downgrades = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.DOWNGRADE.value)
-        disagrees = sum(1 for f in feedback_list if f["feedback_type"] == FeedbackType.DISAGREE.value)
+        # Compter par type (un seul passage sur la liste)
+        by_type = Counter(f["feedback_type"] for f in feedback_list)
+        correct = by_type[FeedbackType.CORRECT.value]
+        upgrades = by_type[FeedbackType.UPGRADE.value]
+        downgrades = by_type[FeedbackType.DOWNGRADE.value]
+        disagrees = by_type[FeedbackType.DISAGREE.value]
 
         # Stats par niveau de gravite
         by_gravity = self._compute_stats_by_gravity(feedback_list)
@@ -304,31 +327,26 @@ class FeedbackHandler:
         feedback_list: List[Dict[str, Any]]
     ) -> Dict[str, Dict[str, int]]:
         """Calcule les stats par niveau de gravite."""
-        stats: Dict[str, Dict[str, int]] = {}
-
-        for fb in feedback_list:
-            level = fb.get("original_gravity", "UNKNOWN")
-
-            if level not in stats:
-                stats[level] = {
-                    "total": 0,
-                    "correct": 0,
-                    "upgraded": 0,
-                    "downgraded": 0,
-                    "disagreed": 0,
-                }
-
-            stats[level]["total"] += 1
+        # Un seul comptage des couples (niveau, type) puis report par niveau
+        counts = Counter(
+            (fb.get("original_gravity", "UNKNOWN"), fb.get("feedback_type"))
+            for fb in feedback_list
+        )
 
-            fb_type = fb.get("feedback_type")
-            if fb_type == FeedbackType.CORRECT.value:
-                stats[level]["correct"] += 1
-            elif fb_type == FeedbackType.UPGRADE.value:
-                stats[level]["upgraded"] += 1
-            elif fb_type == FeedbackType.DOWNGRADE.value:
-                stats[level]["downgraded"] += 1
-            elif fb_type == FeedbackType.DISAGREE.value:
-                stats[level]["disagreed"] += 1
+        stats: Dict[str, Dict[str, int]] = {}
+        for (level, fb_type), count in counts.items():
+            level_stats = stats.setdefault(level, {
+                "total": 0,
+                "correct": 0,
+                "upgraded": 0,
+                "downgraded": 0,
+                "disagreed": 0,
+            })
+            level_stats["total"] += count
+
+            stat_key = self.GRAVITY_STAT_KEYS.get(fb_type)
+            if stat_key:
+                level_stats[stat_key] += count
 
         return stats
 
@@ -380,8 +398,6 @@ class FeedbackHandler:
         Returns:
             Dictionnaire avec le nombre de feedbacks synchronisés/créés/erreurs
         """
-        from api.routes.history import load_history, save_history
-
         feedback_list = self.get_all_feedback()
         history = load_history()
 
@@ -43,6 +43,12 @@ MODEL_PRICES = {
 }
 
 
+# Prompt systeme d'extraction : le schema JSON est statique, on le genere une seule fois
+EXTRACTION_SYSTEM_PROMPT = f"""Tu es un expert medical. Extrais les infos au format JSON STRICT.
+Schema : {ExtractedPatient.model_json_schema()}
+Regles : Cles exactes, null si absent, entiers pour chiffres."""
+
+
 class BenchmarkExtractionRequest(BaseModel):
     """Requete pour le benchmark d'extraction."""
     text: str
@@ -107,19 +113,15 @@ async def benchmark_extraction(request: BenchmarkExtractionRequest) -> Dict:
         raise HTTPException(status_code=400, detail=f"Modele non supporte: {model_name}")
 
     full_model = AVAILABLE_MODELS[model_name]
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
         # Prompt d'extraction
-        schema_json = ExtractedPatient.model_json_schema()
-
-        system_prompt = f"""Tu es un expert medical. Extrais les infos au format JSON STRICT.
-Schema : {schema_json}
-Regles : Cles exactes, null si absent, entiers pour chiffres."""
+        system_prompt = EXTRACTION_SYSTEM_PROMPT
 
         user_prompt = f"Transcription :\n---\n{request.text}\n---\nGenere le JSON."
 
-        response = litellm.completion(
+        response = await litellm.acompletion(
             model=full_model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -129,7 +131,7 @@ Regles : Cles exactes, null si absent, entiers pour chiffres."""
             temperature=0
         )
 
-        latency_s = time.time() - start_time
+        latency_s = (time.perf_counter_ns() - start_time) / 1e9
         usage = response.usage
         input_tokens = usage.prompt_tokens
         output_tokens = usage.completion_tokens
@@ -175,7 +177,7 @@ async def benchmark_simulation(request: BenchmarkSimulationRequest) -> Dict:
         raise HTTPException(status_code=400, detail=f"Modele non supporte: {model_name}")
 
     full_model = AVAILABLE_MODELS[model_name]
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
     try:
         history_text = "\n".join([
@@ -201,7 +203,7 @@ L'infirmier demande: "{request.nurse_message}"
 
 Ta reponse en tant que patient:"""
 
-        response = litellm.completion(
+        response = await litellm.acompletion(
             model=full_model,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -211,7 +213,7 @@ Ta reponse en tant que patient:"""
             max_tokens=150
         )
 
-        latency_s = time.time() - start_time
+        latency_s = (time.perf_counter_ns() - start_time) / 1e9
         usage = response.usage
         input_tokens = usage.prompt_tokens
         output_tokens = usage.completion_tokens
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Response
+from fastapi.routing import APIRoute
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 import pandas as pd
 import io
 import time
 import uuid
+import zlib
 
 # Schemas
 from api.schemas.conversation import ConversationUploadResponse, DialogueMessage
@@ -16,7 +18,55 @@ from api.services.triage_service import get_triage_service
 from api.services.extraction_service import PatientExtractor
 from api.services.agent_service import get_agent_service
 
-router = APIRouter()
+# Taille maximale d'un corps gzip une fois décompressé (octets)
+MAX_DECOMPRESSED_BODY_SIZE = 10 * 1024 * 1024
+
+
+def decompress_gzip_body(body: bytes) -> bytes:
+    """
+    Décompresse un corps gzip avec une taille de sortie bornée.
+
+    Raises:
+        HTTPException: 413 si le corps décompressé dépasse MAX_DECOMPRESSED_BODY_SIZE,
+            400 si le flux gzip est corrompu ou tronqué
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        data = decompressor.decompress(body, MAX_DECOMPRESSED_BODY_SIZE + 1)
+    except zlib.error:
+        raise HTTPException(status_code=400, detail="Corps gzip invalide")
+    if len(data) > MAX_DECOMPRESSED_BODY_SIZE:
+        raise HTTPException(status_code=413, detail="Corps décompressé trop volumineux")
+    if not decompressor.eof:
+        raise HTTPException(status_code=400, detail="Corps gzip tronqué")
+    return data
+
+
+class GzipRequest(Request):
+    """Requête dont le corps est décompressé s'il est envoyé en Content-Encoding: gzip."""
+
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if "gzip" in self.headers.getlist("Content-Encoding"):
+                body = decompress_gzip_body(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Route acceptant les corps JSON compressés (transcriptions volumineuses du frontend)."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            return await original_route_handler(GzipRequest(request.scope, request.receive))
+
+        return custom_route_handler
+
+
+router = APIRouter(route_class=GzipRoute)
 
 # Chemin vers les conversations (dans le conteneur: /app/data/raw/conversations)
 CONVERSATIONS_PATH = Path(__file__).parent.parent.parent / "data" / "raw" / "conversations"
@@ -35,9 +85,21 @@ CONVERSATION_DESCRIPTIONS = {
 }
 
 
+# Liste des conversations mise en cache, invalidée par le mtime du dossier
+_conversations_cache = {"key": None, "data": []}
+
+
 @router.get("/list")
 async def list_conversations():
     """Liste les conversations disponibles."""
+    try:
+        cache_key = CONVERSATIONS_PATH.stat().st_mtime_ns
+    except OSError:
+        cache_key = None
+
+    if cache_key is not None and _conversations_cache["key"] == cache_key:
+        return _conversations_cache["data"]
+
     conversations = []
 
     if CONVERSATIONS_PATH.exists():
@@ -56,7 +118,10 @@ async def list_conversations():
                 **desc
             })
 
-    return sorted(conversations, key=lambda x: x["filename"])
+    conversations = sorted(conversations, key=lambda x: x["filename"])
+    _conversations_cache["key"] = cache_key
+    _conversations_cache["data"] = conversations
+    return conversations
 
 
 @router.get("/load/{filename}", response_model=ConversationUploadResponse)
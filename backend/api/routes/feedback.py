@@ -9,7 +9,7 @@ Endpoints:
 
 import logging
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, HTTPException, Query
 
@@ -82,7 +82,6 @@ async def get_feedback_stats(
         # Calculer la date de debut si specifie
         since = None
         if since_days is not None:
-            from datetime import timedelta
             since = datetime.now() - timedelta(days=since_days)
 
         stats = handler.get_stats(since=since)
@@ -8,8 +8,10 @@ Endpoints:
 - GET /history/stats : Statistiques globales
 """
 
+import heapq
 import json
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -25,6 +27,9 @@ router = APIRouter(prefix="/history", tags=["Triage History"])
 # Chemin vers le fichier d'historique
 HISTORY_PATH = Path(__file__).parent.parent.parent / "data" / "history.json"
 
+# Cache mémoire de l'historique, invalidé par (mtime, taille) du fichier
+_history_cache: Dict = {"key": None, "data": []}
+
 
 # =============================================================================
 # SCHEMAS
@@ -114,13 +119,36 @@ class HistoryStats(BaseModel):
 # HELPERS
 # =============================================================================
 
+def _file_key() -> Optional[tuple]:
+    """Clé de cache du fichier d'historique (mtime, taille), None si absent."""
+    try:
+        stat = HISTORY_PATH.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def load_history() -> List[Dict]:
-    """Charge l'historique depuis le fichier JSON."""
+    """
+    Charge l'historique depuis le fichier JSON.
+
+    Le contenu parsé est conservé en mémoire tant que le fichier n'a pas
+    changé sur disque : les appels répétés (liste, stats, feedback) évitent
+    ainsi de relire et re-parser tout le JSON.
+    """
+    key = _file_key()
+    if key is None:
+        return []
+    if _history_cache["key"] == key:
+        return list(_history_cache["data"])
+
     try:
-        if HISTORY_PATH.exists():
-            with open(HISTORY_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
+        with open(HISTORY_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data = data if isinstance(data, list) else []
+        _history_cache["key"] = key
+        _history_cache["data"] = data
+        return list(data)
     except Exception as e:
         logger.error(f"Erreur lors du chargement de l'historique: {e}")
     return []
@@ -133,9 +161,15 @@ def save_history(history: List[Dict]) -> bool:
         HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
 
         with open(HISTORY_PATH, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+            # Format compact : fichier ~2x plus petit, écriture et relecture plus rapides
+            json.dump(history, f, ensure_ascii=False, separators=(",", ":"))
+
+        _history_cache["key"] = _file_key()
+        _history_cache["data"] = list(history)
         return True
     except Exception as e:
+        # Les entrées ont pu être modifiées en place : on invalide le cache
+        _history_cache["key"] = None
         logger.error(f"Erreur lors de la sauvegarde de l'historique: {e}")
         return False
 
@@ -154,16 +188,16 @@ async def list_history(limit: int = 50, offset: int = 0) -> Dict:
         offset: Décalage pour la pagination
     """
     history = load_history()
+    total = len(history)
 
-    # Trier par date décroissante
-    history_sorted = sorted(
+    # Seules les offset + limit entrées les plus récentes sont nécessaires :
+    # sélection partielle plutôt que tri complet de l'historique
+    most_recent = heapq.nlargest(
+        max(offset + limit, 0),
         history,
-        key=lambda x: x.get('timestamp', ''),
-        reverse=True
+        key=lambda x: x.get('timestamp', '')
     )
-
-    total = len(history_sorted)
-    entries = history_sorted[offset:offset + limit]
+    entries = most_recent[offset:offset + limit]
 
     return {
         "total": total,
@@ -198,24 +232,13 @@ async def save_triage(request: SaveTriageRequest) -> Dict:
     prediction_id = str(uuid4())
     timestamp = datetime.utcnow().isoformat() + "Z"
 
+    # Copie de tous les champs de la requête en un seul model_dump
+    # (métriques imbriquées incluses)
     entry = {
         "prediction_id": prediction_id,
         "timestamp": timestamp,
-        "source": request.source,
-        "filename": request.filename,
-        "gravity_level": request.gravity_level,
-        "french_triage_level": request.french_triage_level,
-        "confidence_score": request.confidence_score,
-        "orientation": request.orientation,
-        "delai_prise_en_charge": request.delai_prise_en_charge,
-        "patient_input": request.patient_input,
-        "extracted_data": request.extracted_data,
+        **request.model_dump(),
         "model_version": request.model_version or "hybrid-v1",
-        "ml_available": request.ml_available,
-        "justification": request.justification,
-        "red_flags": request.red_flags,
-        "recommendations": request.recommendations,
-        "metrics": request.metrics.model_dump() if request.metrics else None,
         "feedback_given": False,
         "feedback_type": None,
         "corrected_gravity": None
@@ -263,8 +286,9 @@ async def get_stats() -> HistoryStats:
     """Retourne les statistiques de l'historique."""
     history = load_history()
 
-    by_gravity = {}
-    by_source = {}
+    # Répartitions comptées en C par Counter plutôt qu'incréments de dict
+    by_gravity = Counter(entry.get('gravity_level', 'GRIS') for entry in history)
+    by_source = Counter(entry.get('source', 'unknown') for entry in history)
     feedbacks_given = 0
     last_date = None
 
@@ -277,14 +301,6 @@ async def get_stats() -> HistoryStats:
     requests_with_metrics = 0
 
     for entry in history:
-        # Par gravité
-        gravity = entry.get('gravity_level', 'GRIS')
-        by_gravity[gravity] = by_gravity.get(gravity, 0) + 1
-
-        # Par source
-        source = entry.get('source', 'unknown')
-        by_source[source] = by_source.get(source, 0) + 1
-
         # Feedbacks
         if entry.get('feedback_given'):
             feedbacks_given += 1
@@ -315,8 +331,8 @@ async def get_stats() -> HistoryStats:
 
     return HistoryStats(
         total_triages=len(history),
-        by_gravity=by_gravity,
-        by_source=by_source,
+        by_gravity=dict(by_gravity),
+        by_source=dict(by_source),
         feedbacks_given=feedbacks_given,
         last_triage_date=last_date,
         metrics_stats=metrics_stats
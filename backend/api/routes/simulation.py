@@ -8,21 +8,32 @@ des infirmiers IOA au processus de triage.
 Endpoints:
     - POST /patient-response : Génère une réponse de patient simulé via LLM
     - POST /suggest-questions : Propose des questions pertinentes pour le triage
+    - POST /turn : Réponse du patient simulé + analyse de l'agent en un seul appel
+    - POST /turn/stream : Même tour, réponse du patient diffusée au fil de la génération
 """
 
+import json
+import logging
 import os
 import time
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import litellm
 from fastapi import APIRouter, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from api.services.extraction_service import PatientExtractor
 from api.services.agent_service import get_agent_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# En-têtes du flux NDJSON (route exclue de la compression dans main.py)
+STREAM_HEADERS = {"Cache-Control": "no-cache"}
+
 
 class PatientResponseRequest(BaseModel):
     """
@@ -39,6 +50,19 @@ class PatientResponseRequest(BaseModel):
     nurse_message: str
 
 
+class SimulationTurnRequest(PatientResponseRequest):
+    """
+    Requête d'un tour complet de simulation (patient + agent).
+
+    Attributes:
+        extracted_data: Données déjà extraites aux tours précédents (None : tout analyser)
+        new_messages: Nombre de messages en fin d'historique pas encore analysés par l'agent
+    """
+
+    extracted_data: Optional[Dict[str, Any]] = None
+    new_messages: int = Field(default=0, ge=0)
+
+
 class QuestionSuggestionRequest(BaseModel):
     """
     Requête pour la génération de suggestions de questions.
@@ -63,27 +87,16 @@ class TextAnalysisRequest(BaseModel):
     text: str
 
 
-@router.post("/patient-response")
-async def generate_patient_response(request: PatientResponseRequest) -> Dict:
+def build_patient_messages(request: PatientResponseRequest) -> List[Dict[str, str]]:
     """
-    Génère une réponse réaliste du patient simulé.
-
-    Le patient simulé répond en fonction de son persona défini et
-    du contexte de la conversation. Le comportement est calibré pour
-    reproduire des interactions réalistes aux urgences.
+    Construit les messages (system + user) envoyés au LLM pour le patient simulé.
 
     Args:
         request: Requête contenant le persona, l'historique et le message infirmier
 
     Returns:
-        Dict contenant la réponse du patient et la latence de génération
-
-    Raises:
-        HTTPException: En cas d'erreur lors de l'appel au LLM
+        Liste de messages au format chat
     """
-    start_time = time.time()
-    model = os.getenv("LLM_MODEL", "mistral/mistral-small-latest")
-
     history_text = "\n".join([
         f"{'Infirmier' if m.get('role') == 'user' else 'Patient'}: {m.get('content', '')}"
         for m in request.history[-6:]
@@ -113,19 +126,109 @@ L'infirmier demande: "{request.nurse_message}"
 
 Ta réponse en tant que patient:"""
 
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+
+def conversation_text(messages: List[Dict[str, str]]) -> str:
+    """Transcription « Infirmier: / Patient: » d'un historique de messages."""
+    return "\n".join(
+        f"{'Infirmier' if m.get('role') == 'user' else 'Patient'}: {m.get('content', '')}"
+        for m in messages
+    )
+
+
+def merge_extracted_data(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fusionne récursivement les données extraites d'un tour dans les données existantes.
+
+    Une valeur vide (None, "", []) du nouveau tour ne remplace pas une valeur déjà connue.
+    Les listes (antécédents, traitements...) sont réunies dans l'ordre, sans doublon :
+    l'agent ne voyant que les nouveaux échanges, il peut n'en rapporter qu'une partie.
+    """
+    merged = dict(existing)
+    for key, value in new.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_extracted_data(merged[key], value)
+        elif isinstance(value, list) and isinstance(merged.get(key), list):
+            merged[key] = merged[key] + [item for item in value if item not in merged[key]]
+        elif value not in (None, "", []):
+            merged[key] = value
+        else:
+            merged.setdefault(key, value)
+    return merged
+
+
+async def analyze_turn(request: SimulationTurnRequest, patient_response: Optional[str]) -> Dict:
+    """
+    Lance l'agent sur un tour de simulation.
+
+    Avec des données déjà extraites, l'agent ne reçoit que ces données (JSON
+    compact) et les échanges pas encore analysés, au lieu de toute la
+    transcription : le coût par tour ne croît plus avec la longueur de
+    l'entretien. Son extraction est ensuite fusionnée dans les données existantes.
+
+    En mode incrémental, la criticité (et les informations manquantes) est donc
+    décidée à partir du JSON des tours précédents et des seuls nouveaux
+    échanges, et non de la transcription complète.
+
+    Args:
+        request: Requête du tour (historique, données déjà extraites)
+        patient_response: Réponse du patient à ce tour (None si la génération a échoué)
+
+    Returns:
+        Résultat de l'agent (extracted_data fusionné en mode incrémental)
+    """
+    reply = {"role": "assistant", "content": patient_response or "..."}
+    if not (request.extracted_data and request.new_messages):
+        return await get_agent_service().analyze_with_reasoning(conversation_text(request.history + [reply]))
+
+    delta = request.history[-request.new_messages:] + [reply]
+    full_text = (
+        "Données déjà extraites aux échanges précédents :\n"
+        f"{json.dumps(request.extracted_data, ensure_ascii=False, separators=(',', ':'))}\n\n"
+        "Nouveaux échanges :\n"
+        f"{conversation_text(delta)}"
+    )
+    agent_result = await get_agent_service().analyze_with_reasoning(full_text)
+    if agent_result.get("extracted_data") is not None:
+        agent_result["extracted_data"] = merge_extracted_data(request.extracted_data, agent_result["extracted_data"])
+    return agent_result
+
+
+@router.post("/patient-response")
+async def generate_patient_response(request: PatientResponseRequest) -> Dict:
+    """
+    Génère une réponse réaliste du patient simulé.
+
+    Le patient simulé répond en fonction de son persona défini et
+    du contexte de la conversation. Le comportement est calibré pour
+    reproduire des interactions réalistes aux urgences.
+
+    Args:
+        request: Requête contenant le persona, l'historique et le message infirmier
+
+    Returns:
+        Dict contenant la réponse du patient et la latence de génération
+
+    Raises:
+        HTTPException: En cas d'erreur lors de l'appel au LLM
+    """
+    start_time = time.perf_counter_ns()
+    model = os.getenv("LLM_MODEL", "mistral/mistral-small-latest")
+
     try:
-        response = litellm.completion(
+        response = await litellm.acompletion(
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=build_patient_messages(request),
             temperature=0.7,
             max_tokens=150
         )
 
         patient_response = response.choices[0].message.content.strip()
-        latency_ms = (time.time() - start_time) * 1000
+        latency_ms = (time.perf_counter_ns() - start_time) / 1e6
 
         return {
             "response": patient_response,
@@ -222,4 +325,97 @@ async def interact_with_agent(request: TextAnalysisRequest): # <--- Correction i
     """
     # Appel direct au service Agent qui fait Extraction + Triage + Raisonnement
     result = await get_agent_service().analyze_with_reasoning(request.text)
-    return result
\ No newline at end of file
+    return result
+
+
+@router.post("/turn")
+async def simulation_turn(request: SimulationTurnRequest) -> Dict:
+    """
+    Enchaîne un tour complet de simulation côté serveur.
+
+    Génère la réponse du patient simulé puis lance l'agent sur la
+    conversation complétée : le frontend fait un seul aller-retour
+    par question au lieu de deux appels successifs.
+
+    Args:
+        request: Persona, historique (message infirmier inclus), message infirmier
+            et, en mode incrémental, données déjà extraites
+
+    Returns:
+        Dict contenant la réponse du patient (None si la génération a échoué)
+        et le résultat de l'agent
+    """
+    try:
+        patient = await generate_patient_response(request)
+        patient_response = patient["response"]
+    except HTTPException:
+        patient_response = None
+
+    agent_result = await analyze_turn(request, patient_response)
+
+    return {
+        "response": patient_response,
+        "agent": agent_result
+    }
+
+
+def _ndjson(event: Dict) -> str:
+    """Sérialise un événement du flux en une ligne JSON."""
+    return json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n"
+
+
+async def _stream_turn_events(request: SimulationTurnRequest) -> AsyncIterator[str]:
+    """
+    Événements d'un tour de simulation, une ligne JSON par événement.
+
+    - {"type": "token", "content": ...} : morceau de la réponse du patient
+    - {"type": "response", "response": ...} : réponse complète (None si la génération a échoué)
+    - {"type": "done", "agent": ...} : résultat de l'agent sur la conversation complétée
+    """
+    model = os.getenv("LLM_MODEL", "mistral/mistral-small-latest")
+    parts = []
+    try:
+        stream = await litellm.acompletion(
+            model=model,
+            messages=build_patient_messages(request),
+            temperature=0.7,
+            max_tokens=150,
+            stream=True
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield _ndjson({"type": "token", "content": delta})
+    except Exception:
+        # Même comportement que /turn : l'agent analyse quand même la conversation
+        logger.exception("Échec de la génération de la réponse du patient (flux)")
+
+    patient_response = "".join(parts).strip() or None
+    yield _ndjson({"type": "response", "response": patient_response})
+
+    agent_result = await analyze_turn(request, patient_response)
+
+    yield _ndjson({"type": "done", "agent": agent_result})
+
+
+@router.post("/turn/stream")
+async def simulation_turn_stream(request: SimulationTurnRequest) -> StreamingResponse:
+    """
+    Tour complet de simulation en flux NDJSON.
+
+    La réponse du patient est envoyée morceau par morceau dès sa génération
+    (le premier mot s'affiche sans attendre la fin), puis complète, et un
+    dernier événement porte l'analyse de l'agent.
+
+    Args:
+        request: Requête du tour (voir simulation_turn)
+
+    Returns:
+        StreamingResponse application/x-ndjson (voir _stream_turn_events)
+    """
+    return StreamingResponse(
+        _stream_turn_events(request),
+        media_type="application/x-ndjson",
+        headers=STREAM_HEADERS
+    )
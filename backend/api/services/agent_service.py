@@ -1,5 +1,6 @@
 import os
 import time
+from functools import lru_cache
 from pydantic_ai import Agent
 from pydantic_ai.models.mistral import MistralModel
 
@@ -121,7 +122,7 @@ class MedicalAgentService:
 
     async def analyze_with_reasoning(self, full_text: str):
         try:
-            start_time = time.time()
+            start_time = time.perf_counter_ns()
             
             # --- SECURITY LAYER 1: Sandwich Defense ---
             # We wrap the user content in XML tags and explicitly instruct the model 
@@ -139,8 +140,8 @@ class MedicalAgentService:
 
             result = await self.agent.run(prompt_content)
             
-            end_time = time.time()
-            latency_s = end_time - start_time
+            end_time = time.perf_counter_ns()
+            latency_s = (end_time - start_time) / 1e9
 
             # Récupération Logs Outils
             steps = []
@@ -213,12 +214,19 @@ def get_agent_service():
     return _agent_instance
 
 
+# Nombre maximal d'instances de benchmark gardées (une par modèle, les plus anciennes évincées)
+BENCHMARK_AGENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=BENCHMARK_AGENT_CACHE_SIZE)
 def create_benchmark_agent(model_name: str) -> MedicalAgentService:
     """
     Factory pour créer un agent avec un modèle spécifique (benchmark).
 
-    Cette fonction crée une nouvelle instance de MedicalAgentService
-    avec le modèle demandé, sans affecter le singleton de production.
+    L'instance de MedicalAgentService est créée une seule fois par modèle
+    puis réutilisée, sans affecter le singleton de production. Le cache est
+    borné : un nom de modèle fourni par le client ne peut pas le faire croître
+    indéfiniment.
 
     Args:
         model_name: Nom du modèle Mistral (ex: "ministral-3b-latest", "mistral-large-latest")
@@ -226,4 +234,4 @@ def create_benchmark_agent(model_name: str) -> MedicalAgentService:
     Returns:
         Une instance de MedicalAgentService configurée avec le modèle spécifié.
     """
-    return MedicalAgentService(model_name=model_name)
\ No newline at end of file
+    return MedicalAgentService(model_name=model_name)
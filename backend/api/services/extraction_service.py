@@ -41,7 +41,7 @@ class PatientExtractor:
 
     def extract_from_conversation(self, full_text: str) -> tuple[ExtractedPatient, LLMMetrics]:
         print(f"🧠 Appel LLM ({self.model})...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         schema_json = json.dumps(ExtractedPatient.model_json_schema(), indent=2)
 
@@ -77,7 +77,7 @@ class PatientExtractor:
             extracted_data = ExtractedPatient.model_validate_json(content)
             
             # 2. Parsing Métriques
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_time) / 1e6
             usage = response.usage
             input_tok = usage.prompt_tokens
             output_tok = usage.completion_tokens
@@ -40,6 +40,16 @@ FRENCH_TO_GRAVITY = {
     FrenchTriageLevel.TRI_5: GravityLevel.GRIS,
 }
 
+# Ordre de gravité (1 = le plus grave), construit une fois au chargement du module
+FRENCH_PRIORITY = {
+    FrenchTriageLevel.TRI_1: 1,
+    FrenchTriageLevel.TRI_2: 2,
+    FrenchTriageLevel.TRI_3A: 3,
+    FrenchTriageLevel.TRI_3B: 4,
+    FrenchTriageLevel.TRI_4: 5,
+    FrenchTriageLevel.TRI_5: 6,
+}
+
 # Délais de prise en charge par niveau
 DELAI_PRISE_EN_CHARGE = {
     FrenchTriageLevel.TRI_1: "Sans délai (IDE et Médecin)",
@@ -60,6 +70,33 @@ ORIENTATION = {
     FrenchTriageLevel.TRI_5: "Box, salle d'attente ou maison médicale de garde",
 }
 
+# Règles de motif par ordre de priorité : (catégorie de mots-clés, niveau, catégorie, recommandations).
+# La première règle dont un mot-clé apparaît dans le motif l'emporte.
+MOTIF_RULES = (
+    # === TRI 1 - Détresse vitale majeure ===
+    ("arret_cardiaque", FrenchTriageLevel.TRI_1, "CARDIO-CIRCULATOIRE", ("Réanimation immédiate", "Appel réanimateur")),
+    ("amputation", FrenchTriageLevel.TRI_1, "TRAUMATOLOGIE", ("Conservation du membre", "Hémostase")),
+    # === TRI 2 ===
+    ("coma", FrenchTriageLevel.TRI_2, "NEUROLOGIE", ("Protection voies aériennes", "Glycémie capillaire")),
+    ("avc", FrenchTriageLevel.TRI_2, "NEUROLOGIE", ("Alerte thrombolyse", "Heure début symptômes", "Glycémie")),
+    ("suicidaire", FrenchTriageLevel.TRI_2, "PSYCHIATRIE", ("Surveillance rapprochée", "Retrait objets dangereux")),
+    ("hematemese", FrenchTriageLevel.TRI_2, "ABDOMINAL", ("2 VVP gros calibre", "Groupe sanguin RAI")),
+    # === TRI 3A/3B ===
+    ("douleur_thoracique", FrenchTriageLevel.TRI_3B, "CARDIO-CIRCULATOIRE", ("ECG immédiat", "Monitoring", "Voie veineuse")),
+    ("convulsions", FrenchTriageLevel.TRI_3B, "NEUROLOGIE", ("Position latérale sécurité", "Protection")),
+    ("asthme", FrenchTriageLevel.TRI_3B, "RESPIRATOIRE", ("Mesure DEP", "Nébulisation", "SpO2")),
+    ("douleur_abdo", FrenchTriageLevel.TRI_3B, "ABDOMINAL", ("Évaluation chirurgicale si défense",)),
+    ("intoxication", FrenchTriageLevel.TRI_3B, "INTOXICATION", ("Identification toxique", "Appel centre antipoison")),
+    # === TRI 4 ===
+    ("fracture", FrenchTriageLevel.TRI_4, "TRAUMATOLOGIE", ("Immobilisation", "Antalgie", "Radio")),
+    ("plaie", FrenchTriageLevel.TRI_4, "TRAUMATOLOGIE", ("Hémostase", "Désinfection", "VAT")),
+    ("anxiete", FrenchTriageLevel.TRI_4, "PSYCHIATRIE", ("Environnement calme", "Réassurance")),
+    # === TRI 5 ===
+    ("fievre", FrenchTriageLevel.TRI_5, "INFECTIOLOGIE", ("Paracétamol si besoin",)),
+    # Céphalée sans signe de gravité
+    ("cephalee", FrenchTriageLevel.TRI_5, "NEUROLOGIE", ("Antalgie simple",)),
+)
+
 
 @dataclass
 class ConstantesVitales:
@@ -85,6 +122,11 @@ class FrenchTriageEngine:
     def __init__(self):
         # Mots-clés par catégorie de motif
         self.motif_keywords = self._init_motif_keywords()
+        # Règles de motif aplaties une fois : (mots-clés, niveau, catégorie, recommandations)
+        self.motif_rules = tuple(
+            (tuple(self.motif_keywords[key]), level, categorie, recommendations)
+            for key, level, categorie, recommendations in MOTIF_RULES
+        )
 
     def _init_motif_keywords(self) -> dict:
         """Initialise les mots-clés pour la détection des motifs"""
@@ -220,64 +262,12 @@ class FrenchTriageEngine:
         Retourne le niveau de triage, la catégorie et les recommandations.
         """
         motif_lower = motif.lower()
-        recommendations = []
-
-        # === TRI 1 - Détresse vitale majeure ===
-        if self._match_keywords(motif_lower, self.motif_keywords["arret_cardiaque"]):
-            return FrenchTriageLevel.TRI_1, "CARDIO-CIRCULATOIRE", ["Réanimation immédiate", "Appel réanimateur"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["amputation"]):
-            return FrenchTriageLevel.TRI_1, "TRAUMATOLOGIE", ["Conservation du membre", "Hémostase"]
-
-        # === TRI 2 ===
-        if self._match_keywords(motif_lower, self.motif_keywords["coma"]):
-            return FrenchTriageLevel.TRI_2, "NEUROLOGIE", ["Protection voies aériennes", "Glycémie capillaire"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["avc"]):
-            recommendations = ["Alerte thrombolyse", "Heure début symptômes", "Glycémie"]
-            return FrenchTriageLevel.TRI_2, "NEUROLOGIE", recommendations
-
-        if self._match_keywords(motif_lower, self.motif_keywords["suicidaire"]):
-            return FrenchTriageLevel.TRI_2, "PSYCHIATRIE", ["Surveillance rapprochée", "Retrait objets dangereux"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["hematemese"]):
-            return FrenchTriageLevel.TRI_2, "ABDOMINAL", ["2 VVP gros calibre", "Groupe sanguin RAI"]
-
-        # === TRI 3A/3B ===
-        if self._match_keywords(motif_lower, self.motif_keywords["douleur_thoracique"]):
-            recommendations = ["ECG immédiat", "Monitoring", "Voie veineuse"]
-            return FrenchTriageLevel.TRI_3B, "CARDIO-CIRCULATOIRE", recommendations
 
-        if self._match_keywords(motif_lower, self.motif_keywords["convulsions"]):
-            return FrenchTriageLevel.TRI_3B, "NEUROLOGIE", ["Position latérale sécurité", "Protection"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["asthme"]):
-            recommendations = ["Mesure DEP", "Nébulisation", "SpO2"]
-            return FrenchTriageLevel.TRI_3B, "RESPIRATOIRE", recommendations
-
-        if self._match_keywords(motif_lower, self.motif_keywords["douleur_abdo"]):
-            return FrenchTriageLevel.TRI_3B, "ABDOMINAL", ["Évaluation chirurgicale si défense"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["intoxication"]):
-            return FrenchTriageLevel.TRI_3B, "INTOXICATION", ["Identification toxique", "Appel centre antipoison"]
-
-        # === TRI 4 ===
-        if self._match_keywords(motif_lower, self.motif_keywords["fracture"]):
-            return FrenchTriageLevel.TRI_4, "TRAUMATOLOGIE", ["Immobilisation", "Antalgie", "Radio"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["plaie"]):
-            return FrenchTriageLevel.TRI_4, "TRAUMATOLOGIE", ["Hémostase", "Désinfection", "VAT"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["anxiete"]):
-            return FrenchTriageLevel.TRI_4, "PSYCHIATRIE", ["Environnement calme", "Réassurance"]
-
-        # === TRI 5 ===
-        if self._match_keywords(motif_lower, self.motif_keywords["fievre"]):
-            return FrenchTriageLevel.TRI_5, "INFECTIOLOGIE", ["Paracétamol si besoin"]
-
-        if self._match_keywords(motif_lower, self.motif_keywords["cephalee"]):
-            # Céphalée sans signe de gravité
-            return FrenchTriageLevel.TRI_5, "NEUROLOGIE", ["Antalgie simple"]
+        # Première règle (par priorité) dont un mot-clé apparaît dans le motif
+        for keywords, level, categorie, recommendations in self.motif_rules:
+            for kw in keywords:
+                if kw in motif_lower:
+                    return level, categorie, list(recommendations)
 
         # Par défaut: Tri 4 (consultation non urgente mais justifiée)
         return FrenchTriageLevel.TRI_4, "DIVERS", ["Évaluation médicale standard"]
@@ -327,18 +317,6 @@ class FrenchTriageEngine:
             "motif_level": motif_level.value
         }
 
-    def _match_keywords(self, text: str, keywords: List[str]) -> bool:
-        """Vérifie si le texte contient un des mots-clés"""
-        return any(kw in text for kw in keywords)
-
     def _upgrade_level(self, current: FrenchTriageLevel, new: FrenchTriageLevel) -> FrenchTriageLevel:
         """Retourne le niveau le plus grave entre deux niveaux"""
-        priority = {
-            FrenchTriageLevel.TRI_1: 1,
-            FrenchTriageLevel.TRI_2: 2,
-            FrenchTriageLevel.TRI_3A: 3,
-            FrenchTriageLevel.TRI_3B: 4,
-            FrenchTriageLevel.TRI_4: 5,
-            FrenchTriageLevel.TRI_5: 6,
-        }
-        return current if priority[current] < priority[new] else new
+        return current if FRENCH_PRIORITY[current] < FRENCH_PRIORITY[new] else new
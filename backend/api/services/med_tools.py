@@ -1,4 +1,6 @@
+import asyncio
 import os
+import threading
 import chromadb
 from chromadb.utils import embedding_functions
 from dataclasses import dataclass
@@ -10,25 +12,52 @@ from api.services.triage_service import get_triage_service
 DB_PATH = os.path.join(os.getcwd(), "data", "vector_db")
 COLLECTION_NAME = "medical_knowledge"
 
-# Initialisation Globale (pour la performance)
-print(f"🔌 Chargement du modèle d'embedding et connexion à ChromaDB à {DB_PATH}...")
+# Chargement paresseux : le modèle d'embedding (~500 Mo) et l'index HNSW ne
+# sont montés en mémoire qu'à la première recherche RAG, pas à l'import. Ce
+# chargement est bloquant : il est lancé via asyncio.to_thread depuis l'outil async.
+collection = None
+_collection_loaded = False
+_collection_lock = threading.Lock()
+
+
+def get_collection():
+    """Retourne la collection ChromaDB, chargée au premier appel (None si indisponible)."""
+    global collection, _collection_loaded
+    if _collection_loaded:
+        return collection
+    with _collection_lock:
+        # Un seul chargement si plusieurs recherches arrivent pendant le premier
+        if not _collection_loaded:
+            collection = _load_collection()
+            _collection_loaded = True
+    return collection
+
+
+def _load_collection():
+    """Charge le modèle d'embedding et la collection ChromaDB (None si indisponible)."""
+    print(f"🔌 Chargement du modèle d'embedding et connexion à ChromaDB à {DB_PATH}...")
+    try:
+        # 1. Le modèle doit être STRICTEMENT le même que dans ingest.py
+        ef = embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name="paraphrase-multilingual-MiniLM-L12-v2"
+        )
 
-try:
-    # 1. Le modèle doit être STRICTEMENT le même que dans ingest.py
-    ef = embedding_functions.SentenceTransformerEmbeddingFunction(
-        model_name="paraphrase-multilingual-MiniLM-L12-v2"
-    )
+        # 2. Connexion au client (Mode Persistant)
+        client = chromadb.PersistentClient(path=DB_PATH)
 
-    # 2. Connexion au client (Mode Persistant)
-    client = chromadb.PersistentClient(path=DB_PATH)
+        # 3. Récupération de la collection
+        loaded = client.get_collection(name=COLLECTION_NAME, embedding_function=ef)
+        print("✅ RAG Service: Base de connaissances chargée avec succès.")
+        return loaded
+
+    except Exception as e:
+        print(f"⚠️ RAG Service: Impossible de charger la base vectorielle. Erreur: {e}")
+        return None
 
-    # 3. Récupération de la collection
-    collection = client.get_collection(name=COLLECTION_NAME, embedding_function=ef)
-    print("✅ RAG Service: Base de connaissances chargée avec succès.")
 
-except Exception as e:
-    print(f"⚠️ RAG Service: Impossible de charger la base vectorielle. Erreur: {e}")
-    collection = None
+# Cache des recherches RAG (la base est figée pendant la vie du process)
+_PROTOCOL_CACHE_SIZE = 256
+_protocol_cache = {}
 
 # Liste définie côté Code (Single Source of Truth)
 REQUIRED_FOR_ML = {
@@ -55,12 +84,20 @@ async def search_medical_protocol(symptome: str) -> str:
     Returns:
         Un texte consolidé contenant les règles et contextes trouvés.
     """
+    # Même symptôme déjà cherché : on évite un nouvel embedding + requête
+    cache_key = " ".join(symptome.lower().split())
+    if cache_key in _protocol_cache:
+        return _protocol_cache[cache_key]
+
+    # Chargement du modèle et embedding de la requête hors de la boucle d'événements
+    collection = await asyncio.to_thread(get_collection)
     if collection is None:
         return "ERREUR TECHNIQUE : La base de connaissances est inaccessible."
 
     try:
         # On interroge la base (On récupère les 3 résultats les plus proches)
-        results = collection.query(
+        results = await asyncio.to_thread(
+            collection.query,
             query_texts=[symptome],
             n_results=3
         )
@@ -79,7 +116,10 @@ async def search_medical_protocol(symptome: str) -> str:
             
             context_text += f"\n[SOURCE {i+1} : {source_type} - {titre}]\n{doc}\n"
             # print(context_text)
-            
+
+        if len(_protocol_cache) >= _PROTOCOL_CACHE_SIZE:
+            _protocol_cache.pop(next(iter(_protocol_cache)))
+        _protocol_cache[cache_key] = context_text
         return context_text
 
     except Exception as e:
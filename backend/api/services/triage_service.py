@@ -122,7 +122,7 @@ class TriageService:
         Returns:
             Resultat du triage avec score de confiance
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         prediction_id = str(uuid.uuid4())[:8]
 
         # =========================================================
@@ -219,7 +219,7 @@ class TriageService:
             justif += f" Qualite donnees: {prediction_quality.value}."
 
         # Temps de traitement
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_time) / 1e6
 
         # =========================================================
         # 4. CONSTRUCTION REPONSE
@@ -10,6 +10,18 @@ MD_PATH = "src/data/knowledge_base/medical_knowledge.md"
 JSON_PATH = "src/data/knowledge_base/Ressources_Projet.json" 
 DB_PATH = "data/vector_db"
 
+# Paramètres de l'index HNSW (recherche approximative sous-linéaire)
+# - M : nombre de voisins par noeud (mémoire vs rappel)
+# - construction_ef / search_ef : largeur de la recherche à la construction / à la requête
+# Pas de quantification (int8/fp16) : l'index HNSW local de Chroma stocke des float32
+# et la base (~80 documents x 384 dims) tient dans ~120 Ko, le gain serait négligeable.
+HNSW_CONFIG = {
+    "hnsw:space": "cosine",
+    "hnsw:M": int(os.getenv("RAG_HNSW_M", "16")),
+    "hnsw:construction_ef": int(os.getenv("RAG_HNSW_CONSTRUCTION_EF", "100")),
+    "hnsw:search_ef": int(os.getenv("RAG_HNSW_SEARCH_EF", "50")),
+}
+
 # Modèle d'embedding (transforme le texte en vecteurs)
 ef = embedding_functions.SentenceTransformerEmbeddingFunction(model_name="paraphrase-multilingual-MiniLM-L12-v2")
 
@@ -115,7 +127,11 @@ def main():
     except:
         pass
         
-    collection = client.get_or_create_collection(name="medical_knowledge", embedding_function=ef)
+    collection = client.get_or_create_collection(
+        name="medical_knowledge",
+        embedding_function=ef,
+        metadata=HNSW_CONFIG
+    )
     
     # 1. Traitement Markdown
     docs_md, metas_md, ids_md = parse_markdown(MD_PATH)
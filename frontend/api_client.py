@@ -0,0 +1,143 @@
+"""
+Client HTTP partagé vers l'API backend.
+
+Une seule session requests par process Streamlit : les connexions
+keep-alive sont réutilisées entre les appels et entre les reruns,
+au lieu d'ouvrir une connexion TCP par requête.
+
+Les erreurs transitoires (connexion refusée au démarrage du backend,
+502/503/504 sur les lectures) sont rejouées avec un backoff court
+plutôt que d'attendre le timeout puis un nouveau clic.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Union
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Décodeur JSON natif (optionnel) : plus rapide que json pour les grosses réponses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Rejeu des erreurs transitoires : connexions pour toutes les méthodes (la requête
+# n'est pas partie), codes 5xx de passerelle pour les lectures idempotentes uniquement
+HTTP_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+    raise_on_status=False,
+)
+
+# Délai d'établissement de la connexion (s) : distinct du délai de lecture,
+# une API injoignable échoue vite même pour les appels LLM longs
+CONNECT_TIMEOUT = 5
+
+# Durée de cache de l'état de santé de l'API (s)
+HEALTH_CACHE_TTL = 10
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Retourne la session HTTP partagée (pool de connexions keep-alive)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=HTTP_RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_connection(api_url: str) -> threading.Thread:
+    """
+    Ouvre en arrière-plan une première connexion vers l'API (une fois par process).
+
+    Résolution DNS et handshake TCP/TLS sont faits pendant que la page
+    s'affiche : le premier vrai appel part sur une connexion déjà ouverte.
+    """
+    session = get_http_session()
+
+    def _ping() -> None:
+        try:
+            session.get(f"{api_url}/health", timeout=2)
+        except requests.RequestException:
+            pass
+
+    thread = threading.Thread(target=_ping, name="api-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def api_timeout(read: float) -> Tuple[float, float]:
+    """Timeout (connexion, lecture) pour un appel dont la réponse peut prendre `read` secondes."""
+    return (CONNECT_TIMEOUT, read)
+
+
+def content_digest(data: Union[bytes, memoryview]) -> str:
+    """Empreinte courte d'un contenu (clé des caches indexés par corps de requête)."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class DigestCache:
+    """
+    Cache LRU borné et thread-safe, indexé par empreinte de requête (content_digest).
+
+    Destiné à être partagé entre sessions via st.cache_resource.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[Any]:
+        """Valeur enregistrée pour cette empreinte (None si absente)."""
+        with self._lock:
+            value = self._items.get(digest)
+            if value is not None:
+                self._items.move_to_end(digest)
+            return value
+
+    def put(self, digest: str, value: Any) -> None:
+        """Enregistre une valeur, en évinçant la plus ancienne au-delà de maxsize."""
+        with self._lock:
+            self._items[digest] = value
+            self._items.move_to_end(digest)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+def parse_json(response: requests.Response) -> Any:
+    """Décode le corps JSON d'une réponse (orjson si installé, sinon json standard)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Même exception que response.json() pour les appelants
+            raise requests.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    return response.json()
+
+
+@st.cache_data(ttl=HEALTH_CACHE_TTL, show_spinner=False)
+def get_api_health(api_url: str) -> Optional[bool]:
+    """
+    État de l'API : True si /health répond 200, False sur erreur HTTP, None si injoignable.
+
+    Les échecs sont aussi mis en cache : une API tombée n'est pas re-sondée
+    (avec attente du timeout) à chaque rerun.
+    """
+    try:
+        response = get_http_session().get(f"{api_url}/health", timeout=5)
+    except requests.RequestException:
+        return None
+    return response.status_code == 200
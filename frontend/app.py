@@ -12,7 +12,8 @@ import streamlit as st
 
 # Config Paths
 current_dir = Path(__file__).parent
-sys.path.append(str(current_dir))
+if str(current_dir) not in sys.path:
+    sys.path.append(str(current_dir))
 
 from state import init_session_state
 from style import configure_page, apply_style
@@ -0,0 +1,37 @@
+"""
+Helpers d'affichage partagés entre les pages.
+
+Importés une seule fois par process (module mis en cache par Python),
+au lieu d'être redéfinis dans chaque page à chaque rerun.
+"""
+
+from typing import Dict
+
+# Emoji et couleur (palette du thème) par niveau de gravité
+TRIAGE_EMOJIS = {"ROUGE": "🔴", "JAUNE": "🟡", "VERT": "🟢", "GRIS": "⚪"}
+TRIAGE_COLORS = {
+    "ROUGE": "#DC2626",
+    "JAUNE": "#F59E0B",
+    "VERT": "#10B981",
+    "GRIS": "#6B7280"
+}
+
+
+def get_triage_emoji(level: str) -> str:
+    """Emoji associé à un niveau de gravité (⚪ si inconnu)."""
+    return TRIAGE_EMOJIS.get(level, "⚪")
+
+
+def filter_empty_values(data: Dict) -> Dict:
+    """Nettoie le dictionnaire pour l'affichage (valeurs vides retirées, récursivement)."""
+    if not isinstance(data, dict): return data
+    clean_dict = {}
+    for k, v in data.items():
+        if isinstance(v, dict):
+            nested = filter_empty_values(v)
+            if nested: clean_dict[k] = nested
+        elif isinstance(v, list):
+            if v: clean_dict[k] = v
+        elif v is not None and v != "":
+            clean_dict[k] = v
+    return clean_dict
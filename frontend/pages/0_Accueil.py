@@ -5,10 +5,14 @@ Cette page permet de sélectionner et analyser des conversations
 patient-infirmier depuis la base de données de conversations.
 """
 
+import gzip
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Dict, List, Optional
 
 import requests
 import streamlit as st
@@ -16,10 +20,13 @@ import streamlit as st
 # Config Paths
 current_dir = Path(__file__).parent
 interface_dir = current_dir.parent
-sys.path.append(str(interface_dir))
+if str(interface_dir) not in sys.path:
+    sys.path.append(str(interface_dir))
 
 from state import init_session_state
-from style import configure_page, apply_style, render_triage_badge, render_patient_card
+from style import configure_page, apply_style, render_triage_badge, render_patient_card, render_transcript_details, render_metric_row
+from api_client import api_timeout, content_digest, get_http_session, parse_json, warm_up_connection
+from components import filter_empty_values
 
 # IMPORTANT: configure_page DOIT être appelée EN PREMIER
 configure_page(page_title="Accueil - MedTriage-AI")
@@ -29,6 +36,32 @@ apply_style()
 # URL de l'API Backend
 API_URL = os.getenv("API_URL", "")
 
+# Session HTTP partagée (connexions keep-alive réutilisées entre les appels et les reruns)
+HTTP_SESSION = get_http_session()
+
+# Première connexion ouverte en arrière-plan pendant le rendu de la page
+if API_URL:
+    warm_up_connection(API_URL)
+
+# Durée de cache des conversations prédéfinies (secondes)
+CONVERSATIONS_CACHE_TTL = 3600
+
+# Durée de cache des résultats d'audit agentique (secondes)
+AGENT_AUDIT_CACHE_TTL = 3600
+
+# Audit lancé en arrière-plan dès la sélection d'un dossier (désactivable : coût LLM)
+SPECULATIVE_AUDIT = os.getenv("SPECULATIVE_AUDIT", "1") == "1"
+
+# En-têtes des corps JSON pré-encodés
+JSON_HEADERS = {"Content-Type": "application/json"}
+GZIP_JSON_HEADERS = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Taille à partir de laquelle le corps de l'audit est compressé (octets, comme GZipMiddleware côté API)
+GZIP_MIN_BODY_SIZE = 1000
+
+# Nombre max d'analyses simultanées pour l'analyse groupée des dossiers
+AUDIT_CONCURRENCY = max(1, int(os.getenv("AUDIT_CONCURRENCY", "4")))
+
 # Mapping des icônes (l'API renvoie des noms, on les convertit en emoji)
 ICON_MAP = {
     "heart": "❤️",
@@ -43,30 +76,92 @@ ICON_MAP = {
     "file": "📄"
 }
 
-def filter_empty_values(data: Dict) -> Dict:
-    if not isinstance(data, dict): return data
-    clean_dict = {}
-    for k, v in data.items():
-        if isinstance(v, dict):
-            nested = filter_empty_values(v)
-            if nested: clean_dict[k] = nested
-        elif isinstance(v, list):
-            if v: clean_dict[k] = v
-        elif v is not None and v != "":
-            clean_dict[k] = v
-    return clean_dict
+@st.cache_data(ttl=CONVERSATIONS_CACHE_TTL, show_spinner=False)
+def fetch_conversations() -> List[Dict]:
+    """Liste des conversations prédéfinies (les erreurs ne sont pas mises en cache)."""
+    response = HTTP_SESSION.get(f"{API_URL}/conversation/list", timeout=10)
+    response.raise_for_status()
+    conversations = response.json()
+    # Convertir les icônes texte en emoji
+    for conv in conversations:
+        icon_name = conv.get("icon", "file")
+        conv["icon"] = ICON_MAP.get(icon_name, "📄")
+    return conversations
+
+
+@st.cache_data(ttl=CONVERSATIONS_CACHE_TTL, show_spinner=False)
+def fetch_conversation(filename: str) -> Dict:
+    """Contenu d'une conversation prédéfinie (fichier statique côté backend)."""
+    response = HTTP_SESSION.get(f"{API_URL}/conversation/load/{filename}", timeout=10)
+    response.raise_for_status()
+    return parse_json(response)
+
+
+@st.cache_data(ttl=CONVERSATIONS_CACHE_TTL, show_spinner=False)
+def fetch_conversation_body(filename: str) -> bytes:
+    """Corps JSON de l'audit d'une conversation prédéfinie, encodé une seule fois."""
+    return encode_conversation(fetch_conversation(filename))
+
+
+@st.cache_data(ttl=CONVERSATIONS_CACHE_TTL, max_entries=32, show_spinner=False)
+def upload_conversation(digest: str, filename: str, _file: BinaryIO) -> Dict:
+    """
+    Conversation parsée par l'API à partir d'un fichier uploadé.
+
+    Le cache est indexé sur l'empreinte du contenu (les octets ne sont pas
+    re-hachés par Streamlit) : re-sélectionner le même fichier ne refait
+    ni l'upload ni le parsing côté serveur.
+    """
+    _file.seek(0)
+    files = {"file": (filename, _file, "text/csv")}
+    response = HTTP_SESSION.post(f"{API_URL}/conversation/upload", files=files, timeout=api_timeout(30))
+    response.raise_for_status()
+    return parse_json(response)
+
+
+def post_agent_audit(body: bytes) -> requests.Response:
+    """POST de l'audit agentique, corps compressé en gzip au-delà de GZIP_MIN_BODY_SIZE."""
+    if len(body) >= GZIP_MIN_BODY_SIZE:
+        data, headers = gzip.compress(body, compresslevel=5), GZIP_JSON_HEADERS
+    else:
+        data, headers = body, JSON_HEADERS
+    return HTTP_SESSION.post(f"{API_URL}/conversation/agent-audit", data=data, headers=headers, timeout=api_timeout(120))
+
+
+def encode_conversation(conversation: Dict) -> bytes:
+    """Encode une conversation en corps JSON compact."""
+    return json.dumps(conversation, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def get_conversation_body(conversation: Dict) -> bytes:
+    """
+    Corps de l'audit de la conversation courante.
+
+    Encodé une seule fois par conversation chargée puis gardé en session :
+    prefetch, clic et reruns réutilisent les mêmes octets.
+    """
+    body = st.session_state.get('conversation_body')
+    if body is not None:
+        return body
+    filename = st.session_state.get('selected_conversation')
+    body = None
+    if filename and filename == st.session_state.get('current_filename'):
+        try:
+            body = fetch_conversation_body(filename)
+        except requests.RequestException:
+            pass
+    if body is None:
+        body = encode_conversation(conversation)
+    st.session_state['conversation_body'] = body
+    return body
+
 
 def load_available_conversations():
     """Charge la liste des conversations depuis l'API."""
     try:
-        response = requests.get(f"{API_URL}/conversation/list", timeout=10)
-        if response.status_code == 200:
-            conversations = response.json()
-            # Convertir les icônes texte en emoji
-            for conv in conversations:
-                icon_name = conv.get("icon", "file")
-                conv["icon"] = ICON_MAP.get(icon_name, "📄")
-            return conversations
+        return fetch_conversations()
+    except requests.HTTPError:
+        return []
     except requests.RequestException as e:
         st.error(f"Erreur de connexion à l'API: {e}")
     return []
@@ -75,16 +170,101 @@ def load_available_conversations():
 def load_conversation_from_api(filename: str):
     """Charge une conversation depuis l'API."""
     try:
-        response = requests.get(f"{API_URL}/conversation/load/{filename}", timeout=10)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Erreur: {response.text}")
+        return fetch_conversation(filename)
+    except requests.HTTPError as e:
+        st.error(f"Erreur: {e.response.text}")
     except requests.RequestException as e:
         st.error(f"Erreur de connexion: {e}")
     return None
 
 
+@st.cache_data(ttl=AGENT_AUDIT_CACHE_TTL, max_entries=64, show_spinner=False)
+def fetch_agent_audit(digest: str, _body: bytes) -> Dict:
+    """
+    Audit agentique d'une conversation, mis en cache par empreinte du corps JSON.
+
+    Relancer le copilote sur une conversation déjà analysée ne repaie pas
+    l'appel LLM. Seuls les succès sont mis en cache.
+    """
+    response = post_agent_audit(_body)
+    response.raise_for_status()
+    return parse_json(response)
+
+
+@st.cache_resource
+def get_audit_executor() -> ThreadPoolExecutor:
+    """Pool partagé des audits lancés en arrière-plan dès la sélection d'un dossier."""
+    return ThreadPoolExecutor(max_workers=AUDIT_CONCURRENCY)
+
+
+def prefetch_agent_audit(conversation: Dict) -> None:
+    """
+    Lance l'audit de la conversation sélectionnée en arrière-plan.
+
+    Le résultat alimente le cache de fetch_agent_audit : le clic sur
+    « Lancer le Copilote » n'attend plus que la fin d'un appel déjà parti.
+    """
+    if not SPECULATIVE_AUDIT:
+        return
+    body = get_conversation_body(conversation)
+    digest = content_digest(body)
+    prefetch = st.session_state.get('audit_prefetch')
+    if prefetch and prefetch["digest"] == digest:
+        return
+    future = get_audit_executor().submit(fetch_agent_audit, digest, body)
+    st.session_state['audit_prefetch'] = {"digest": digest, "future": future}
+
+
+def wait_audit_prefetch(digest: str) -> None:
+    """Attend l'audit lancé en arrière-plan pour ce corps, s'il y en a un."""
+    prefetch = st.session_state.pop('audit_prefetch', None)
+    if prefetch and prefetch["digest"] == digest:
+        # Les erreurs sont ignorées ici : l'appel direct qui suit les rejoue et les affiche
+        wait([prefetch["future"]])
+
+
+def audit_conversation(body: bytes) -> Dict:
+    """Lance l'audit agentique d'une conversation pré-encodée (appelé depuis les threads)."""
+    start_time = time.perf_counter()
+    try:
+        response = post_agent_audit(body)
+        result = parse_json(response) if response.status_code == 200 else None
+    except requests.RequestException:
+        result = None
+    return {"result": result, "latency_s": time.perf_counter() - start_time}
+
+
+def run_all_audits(conversations: List[Dict]) -> List[Dict]:
+    """
+    Analyse tous les dossiers prédéfinis en parallèle.
+
+    Les audits sont limités par le réseau et le LLM : les lancer ensemble
+    ramène la durée totale à celle du plus lent au lieu de la somme.
+    """
+    # Corps chargés et encodés dans le thread Streamlit (cache), seuls les POST partent en parallèle
+    bodies = {}
+    for conv in conversations:
+        try:
+            bodies[conv["filename"]] = fetch_conversation_body(conv["filename"])
+        except requests.RequestException:
+            continue
+    to_audit = [conv for conv in conversations if conv["filename"] in bodies]
+
+    with ThreadPoolExecutor(max_workers=AUDIT_CONCURRENCY) as executor:
+        audits = list(executor.map(lambda conv: audit_conversation(bodies[conv["filename"]]), to_audit))
+
+    rows = []
+    for conv, audit in zip(to_audit, audits):
+        result = audit["result"] or {}
+        rows.append({
+            "Dossier": f"{conv['icon']} {conv['name']}",
+            "Niveau attendu": conv.get("niveau", "N/A"),
+            "Triage IA": result.get("criticity", "Erreur"),
+            "Latence (s)": round(audit["latency_s"], 2),
+        })
+    return rows
+
+
 def save_triage_to_history(result: dict, filename: str, extracted_data: dict, metrics: dict = None) -> str:
     """Sauvegarde le triage dans l'historique via l'API."""
     try:
@@ -104,14 +284,180 @@ def save_triage_to_history(result: dict, filename: str, extracted_data: dict, me
             "recommendations": result.get("recommendations"),
             "metrics": metrics
         }
-        response = requests.post(f"{API_URL}/history/save", json=payload, timeout=10)
+        response = HTTP_SESSION.post(f"{API_URL}/history/save", json=payload, timeout=10)
         if response.status_code == 200:
+            st.session_state['history_version'] += 1
             return response.json().get("prediction_id")
     except requests.RequestException as e:
         st.warning(f"Impossible de sauvegarder dans l'historique: {e}")
     return None
 
 
+def run_copilot(conversation: Dict) -> None:
+    """
+    Callback du bouton « Lancer le Copilote ».
+
+    L'audit et la mise à jour de l'état sont faits avant l'exécution de
+    la page : le résultat s'affiche dans le même passage, sans st.rerun().
+    """
+    with st.spinner("Analyse clinique en cours..."):
+        try:
+            body = get_conversation_body(conversation)
+            digest = content_digest(body)
+            wait_audit_prefetch(digest)
+            res = fetch_agent_audit(digest, body)
+        except requests.HTTPError as e:
+            st.session_state['audit_error'] = f"Erreur API: {e.response.text}"
+            return
+        except requests.exceptions.Timeout:
+            st.session_state['audit_error'] = "Timeout - Réessayez"
+            return
+        except Exception as e:
+            st.session_state['audit_error'] = f"Erreur: {e}"
+            return
+
+    st.session_state['agent_result'] = res
+    st.session_state['last_agent_audit'] = res
+    st.session_state['triage_color'] = res.get("criticity", "GRIS")
+    st.session_state['analysis_done'] = True
+
+    # Ajout à l'historique pour les stats du Dashboard
+    criticity = res.get("criticity", "GRIS")
+    st.session_state['triage_history'].append(criticity)
+
+    # Stocker les métriques pour les totaux
+    m = res.get('metrics', {})
+    if m:
+        st.session_state['metrics_history'].append({
+            'cost_usd': m.get('cost_usd', 0),
+            'gwp_kgco2': m.get('gwp_kgco2', 0),
+            'energy_kwh': m.get('energy_kwh', 0)
+        })
+        # Mettre à jour la dernière requête (toutes sources)
+        st.session_state['last_request_metrics'] = m
+        st.session_state['last_request_source'] = "Accueil"
+
+    # Sauvegarder dans l'historique (avec métriques)
+    current_filename = st.session_state.get('current_filename', 'unknown')
+    extracted = res.get('extracted_data', {})
+    prediction_id = save_triage_to_history(res, current_filename, extracted, m)
+
+    # Stocker pour le feedback
+    st.session_state['last_triage_result'] = {
+        'prediction_id': prediction_id or f"pred_{current_filename}",
+        'gravity_level': res.get('criticity', 'GRIS'),
+        'french_triage_level': res.get('french_triage_level', 'Tri 5'),
+        'extracted_data': extracted,
+        'filename': current_filename,
+        'source': 'accueil'
+    }
+
+
+@st.fragment
+def render_results(res: Dict) -> None:
+    """
+    Affiche le résultat du copilote (données structurées, décision, actions).
+
+    Fragment : les interactions du panneau ne ré-exécutent que lui, pas la
+    sélection des dossiers ni le replay. « Nouvelle Analyse » change l'état
+    de toute la page et relance donc l'application entière.
+    """
+    extracted = res.get("extracted_data", {})
+    constantes = extracted.get('constantes', {}) if extracted else {}
+    alert = res.get("protocol_alert")
+    missing_info = res.get("missing_info", [])
+    criticity = st.session_state.get('triage_color', 'GRIS')
+
+    st.divider()
+    col_data, col_decision = st.columns([1, 1])
+
+    with col_data:
+        st.subheader("Données Structurées")
+        douleur = constantes.get('echelle_douleur')
+        temp = constantes.get('temperature')
+        age = extracted.get('age')
+        # Une seule rangée HTML au lieu de 3 colonnes + 3 st.metric
+        st.markdown(render_metric_row([
+            ("Douleur", f"{douleur}/10" if douleur is not None else "-"),
+            ("Température", f"{temp}°C" if temp else "-"),
+            ("Âge", f"{age} ans" if age else "-"),
+        ]), unsafe_allow_html=True)
+
+        with st.expander("Dossier complet", expanded=False):
+            clean_data = filter_empty_values(extracted)
+            st.caption(f"{len(clean_data)} rubrique(s) renseignée(s)")
+            # Le JSON complet n'est envoyé au navigateur que sur demande (ou téléchargé)
+            if st.toggle("Afficher le JSON", key="show_full_record"):
+                st.json(clean_data)
+            st.download_button(
+                "Télécharger JSON",
+                data=json.dumps(clean_data, ensure_ascii=False, indent=2),
+                file_name="dossier.json",
+                mime="application/json",
+            )
+
+    with col_decision:
+        st.subheader("Copilote IA")
+
+        # Utiliser le nouveau badge de triage avec animation
+        st.markdown(render_triage_badge(criticity), unsafe_allow_html=True)
+
+        # 1. Alerte Protocolaire (Priorité absolue)
+        if alert:
+            st.error(f"**ALERTE PROTOCOLE**\n\n{alert}")
+        
+        # 2. Informations Manquantes (Bloquant pour le succès)
+        if missing_info:
+            st.warning("⚠️ **Données incomplètes**")
+            st.markdown("L'IA ne peut pas finaliser le triage. Veuillez demander :")
+            for q in missing_info:
+                st.markdown(f"- {q}")
+        
+        # 3. Dossier Complet & Sain (Uniquement si ni alerte ni manque)
+        elif not alert and not missing_info:
+            st.success("✅ Dossier complet.\nAucun indicateur de gravité immédiate détecté.")
+
+        st.markdown("---")
+        with st.expander("Logs & Raisonnement"):
+            steps = res.get("reasoning_steps", [])
+            if steps:
+                for step in steps:
+                    st.markdown(step)
+            else:
+                st.caption("Analyse directe.")
+
+    st.markdown("---")
+
+    # Boutons d'action
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Nouvelle Analyse", use_container_width=True):
+            st.session_state['analysis_done'] = False
+            st.session_state['conversation_data'] = None
+            st.session_state['conversation_body'] = None
+            st.session_state['selected_conversation'] = None
+            st.session_state['selected_conversation_info'] = None
+            st.rerun(scope="app")
+
+    with col2:
+        if st.button("Donner un Feedback", type="primary", use_container_width=True):
+            st.switch_page("pages/3_Feedback.py")
+
+
+def set_current_conversation(data: Dict, filename: str, info: Optional[Dict] = None) -> None:
+    """Charge une conversation comme conversation courante et lance son audit en arrière-plan."""
+    ss = st.session_state
+    ss['conversation_data'] = data
+    ss['current_filename'] = filename
+    if info is not None:
+        ss['selected_conversation'] = filename
+        ss['selected_conversation_info'] = info  # Stocker les infos (name, niveau, icon)
+    ss['analysis_done'] = False
+    ss['agent_result'] = None
+    ss['conversation_body'] = None
+    prefetch_agent_audit(data)
+
+
 def main():
     if not API_URL:
         st.error("""
@@ -127,24 +473,21 @@ def main():
 
     st.title("Accueil - Régulation Agentique")
 
-    # Gestion de l'état
-    if 'conversation_data' not in st.session_state:
-        st.session_state['conversation_data'] = None
-    if 'analysis_done' not in st.session_state:
-        st.session_state['analysis_done'] = False
-    if 'agent_result' not in st.session_state:
-        st.session_state['agent_result'] = None
-    if 'selected_conversation' not in st.session_state:
-        st.session_state['selected_conversation'] = None
-    if 'selected_conversation_info' not in st.session_state:
-        st.session_state['selected_conversation_info'] = None
+    ss = st.session_state
 
     # Charger les conversations disponibles
     conversations = load_available_conversations()
 
     # Section de sélection
-    st.markdown("### Dossiers Patients Disponibles")
-    st.caption("Sélectionnez une conversation pour l'analyser avec le copilote IA")
+    col_title, col_refresh = st.columns([5, 1])
+    with col_title:
+        st.markdown("### Dossiers Patients Disponibles")
+        st.caption("Sélectionnez une conversation pour l'analyser avec le copilote IA")
+    with col_refresh:
+        if st.button("🔄 Rafraîchir", use_container_width=True, help="Recharger les dossiers depuis l'API"):
+            fetch_conversations.clear()
+            fetch_conversation.clear()
+            st.rerun()
 
     if not conversations:
         st.warning("Aucune conversation trouvée dans le dossier.")
@@ -154,29 +497,31 @@ def main():
         st.markdown("#### Upload manuel")
         uploaded_file = st.file_uploader("Chargez une transcription", type=["csv", "txt"])
         if uploaded_file:
-            with st.spinner("Lecture du fichier..."):
-                try:
-                    files = {"file": (uploaded_file.name, uploaded_file, "text/csv")}
-                    res = requests.post(f"{API_URL}/conversation/upload", files=files, timeout=30)
-                    if res.status_code == 200:
-                        st.session_state['conversation_data'] = res.json()
-                        st.session_state['current_filename'] = uploaded_file.name
-                        st.session_state['analysis_done'] = False
-                        st.session_state['agent_result'] = None
+            # Empreinte calculée sur une vue du buffer (pas de copie du fichier)
+            with uploaded_file.getbuffer() as file_view:
+                digest = content_digest(file_view)
+            # Fichier déjà chargé : pas de nouvel upload à chaque rerun
+            if ss.get('upload_digest') != digest:
+                with st.spinner("Lecture du fichier..."):
+                    try:
+                        data = upload_conversation(digest, uploaded_file.name, uploaded_file)
+                        ss['upload_digest'] = digest
+                        set_current_conversation(data, uploaded_file.name)
                         st.rerun()
-                    else:
-                        st.error(f"Erreur API: {res.text}")
-                except Exception as e:
-                    st.error(f"Erreur: {e}")
+                    except requests.HTTPError as e:
+                        st.error(f"Erreur API: {e.response.text}")
+                    except requests.RequestException as e:
+                        st.error(f"Erreur: {e}")
     else:
         # Afficher les conversations sous forme de cartes
         cols = st.columns(3)
+        selected_filename = ss.get('selected_conversation')
 
         for idx, conv in enumerate(conversations):
             col = cols[idx % 3]
             with col:
                 # Déterminer si cette conversation est sélectionnée
-                is_selected = st.session_state.get('selected_conversation') == conv['filename']
+                is_selected = selected_filename == conv['filename']
 
                 # Utiliser le nouveau composant de carte patient
                 st.markdown(
@@ -198,166 +543,60 @@ def main():
                     # Charger la conversation via l'API
                     data = load_conversation_from_api(conv['filename'])
                     if data:
-                        st.session_state['conversation_data'] = data
-                        st.session_state['current_filename'] = conv['filename']
-                        st.session_state['selected_conversation'] = conv['filename']
-                        st.session_state['selected_conversation_info'] = conv  # Stocker les infos (name, niveau, icon)
-                        st.session_state['analysis_done'] = False
-                        st.session_state['agent_result'] = None
+                        set_current_conversation(data, conv['filename'], conv)
                         st.rerun()
 
+        # Analyse groupée : tous les dossiers prédéfinis en une fois
+        with st.expander("Analyse groupée des dossiers"):
+            st.caption(f"Lance le copilote sur les {len(conversations)} dossiers en parallèle (non enregistré dans l'historique)")
+            if st.button("🎬 Analyser tous les dossiers", key="run_all_audits"):
+                with st.spinner("Analyse de tous les dossiers en cours..."):
+                    ss['batch_audit_results'] = run_all_audits(conversations)
+            if ss.get('batch_audit_results'):
+                st.dataframe(ss['batch_audit_results'], use_container_width=True, hide_index=True)
+
     # Interface principale si une conversation est chargée
-    if st.session_state['conversation_data'] is not None:
-        json_payload = st.session_state['conversation_data']
+    json_payload = ss['conversation_data']
+    if json_payload is not None:
+        analysis_done = ss['analysis_done']
 
         st.markdown("---")
 
         # Info sur la conversation sélectionnée
-        conv_info = st.session_state.get('selected_conversation_info')
+        conv_info = ss.get('selected_conversation_info')
         if conv_info:
             st.info(f"{conv_info.get('icon', '📄')} **{conv_info.get('name', 'Conversation')}** - Niveau attendu: {conv_info.get('niveau', 'N/A')}")
 
-        label_expander = f"Replay: {st.session_state.get('current_filename', 'Discussion')}"
-        is_expanded = not st.session_state['analysis_done']
-
-        with st.expander(label_expander, expanded=is_expanded):
-            chat_container = st.container(height=300, border=True)
-            with chat_container:
-                for msg in json_payload["messages"]:
-                    avatar = "🧑‍⚕️" if msg["role"] == "infirmier" else "🤒"
-                    role_style = "user" if msg["role"] == "infirmier" else "assistant"
-                    with st.chat_message(role_style, avatar=avatar):
-                        st.write(msg['content'])
-
-        if not st.session_state['analysis_done']:
-            st.markdown("---")
-            if st.button("Lancer le Copilote", type="primary", use_container_width=True):
-                with st.spinner("Analyse clinique en cours..."):
-                    try:
-                        response = requests.post(
-                            f"{API_URL}/conversation/agent-audit",
-                            json=json_payload,
-                            timeout=120
-                        )
-                        if response.status_code == 200:
-                            res = response.json()
-                            st.session_state['agent_result'] = res
-                            st.session_state['last_agent_audit'] = res
-                            st.session_state['triage_color'] = res.get("criticity", "GRIS")
-                            st.session_state['analysis_done'] = True
-
-                            # Ajout à l'historique pour les stats du Dashboard
-                            criticity = res.get("criticity", "GRIS")
-                            st.session_state['triage_history'].append(criticity)
-
-                            # Stocker les métriques pour les totaux
-                            m = res.get('metrics', {})
-                            if m:
-                                st.session_state['metrics_history'].append({
-                                    'cost_usd': m.get('cost_usd', 0),
-                                    'gwp_kgco2': m.get('gwp_kgco2', 0),
-                                    'energy_kwh': m.get('energy_kwh', 0)
-                                })
-                                # Mettre à jour la dernière requête (toutes sources)
-                                st.session_state['last_request_metrics'] = m
-                                st.session_state['last_request_source'] = "Accueil"
-
-                            # Sauvegarder dans l'historique (avec métriques)
-                            current_filename = st.session_state.get('current_filename', 'unknown')
-                            extracted = res.get('extracted_data', {})
-                            prediction_id = save_triage_to_history(res, current_filename, extracted, m)
-
-                            # Stocker pour le feedback
-                            st.session_state['last_triage_result'] = {
-                                'prediction_id': prediction_id or f"pred_{current_filename}",
-                                'gravity_level': res.get('criticity', 'GRIS'),
-                                'french_triage_level': res.get('french_triage_level', 'Tri 5'),
-                                'extracted_data': extracted,
-                                'filename': current_filename,
-                                'source': 'accueil'
-                            }
-
-                            st.rerun()
-                        else:
-                            st.error(f"Erreur API: {response.text}")
-                    except requests.exceptions.Timeout:
-                        st.error("Timeout - Réessayez")
-                    except Exception as e:
-                        st.error(f"Erreur: {e}")
-
-        if st.session_state['analysis_done'] and st.session_state['agent_result']:
-            res = st.session_state['agent_result']
-            extracted = res.get("extracted_data", {})
-            constantes = extracted.get('constantes', {}) if extracted else {}
-            alert = res.get("protocol_alert")
-            missing_info = res.get("missing_info", [])
-            criticity = st.session_state.get('triage_color', 'GRIS')
-
-            st.divider()
-            col_data, col_decision = st.columns([1, 1])
-
-            with col_data:
-                st.subheader("Données Structurées")
-                m1, m2, m3 = st.columns(3)
-                with m1:
-                    douleur = constantes.get('echelle_douleur')
-                    st.metric("Douleur", f"{douleur}/10" if douleur is not None else "-")
-                with m2:
-                    temp = constantes.get('temperature')
-                    st.metric("Température", f"{temp}°C" if temp else "-")
-                with m3:
-                    age = extracted.get('age')
-                    st.metric("Âge", f"{age} ans" if age else "-")
-
-                with st.expander("Dossier complet", expanded=True):
-                    clean_data = filter_empty_values(extracted)
-                    st.json(clean_data)
-
-            with col_decision:
-                st.subheader("Copilote IA")
-
-                # Utiliser le nouveau badge de triage avec animation
-                st.markdown(render_triage_badge(criticity), unsafe_allow_html=True)
-
-                # 1. Alerte Protocolaire (Priorité absolue)
-                if alert:
-                    st.error(f"**ALERTE PROTOCOLE**\n\n{alert}")
-                
-                # 2. Informations Manquantes (Bloquant pour le succès)
-                if missing_info:
-                    st.warning("⚠️ **Données incomplètes**")
-                    st.markdown("L'IA ne peut pas finaliser le triage. Veuillez demander :")
-                    for q in missing_info:
-                        st.markdown(f"- {q}")
-                
-                # 3. Dossier Complet & Sain (Uniquement si ni alerte ni manque)
-                elif not alert and not missing_info:
-                    st.success("✅ Dossier complet.\nAucun indicateur de gravité immédiate détecté.")
-
-                st.markdown("---")
-                with st.expander("Logs & Raisonnement"):
-                    steps = res.get("reasoning_steps", [])
-                    if steps:
-                        for step in steps:
-                            st.markdown(step)
-                    else:
-                        st.caption("Analyse directe.")
-
+        label_expander = f"Replay: {ss.get('current_filename', 'Discussion')}"
+        is_expanded = not analysis_done
+
+        # Après l'analyse, la conversation n'est sérialisée que si on demande à la revoir
+        show_transcript = is_expanded or st.toggle(
+            f"{label_expander} ({len(json_payload['messages'])} messages)", key="show_transcript"
+        )
+        if show_transcript:
+            # Un seul élément <details> (repliable côté navigateur) au lieu d'expander + conteneur
+            st.markdown(
+                render_transcript_details(label_expander, json_payload["messages"]),
+                unsafe_allow_html=True
+            )
+
+        if not analysis_done:
             st.markdown("---")
-
-            # Boutons d'action
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("Nouvelle Analyse", use_container_width=True):
-                    st.session_state['analysis_done'] = False
-                    st.session_state['conversation_data'] = None
-                    st.session_state['selected_conversation'] = None
-                    st.session_state['selected_conversation_info'] = None
-                    st.rerun()
-
-            with col2:
-                if st.button("Donner un Feedback", type="primary", use_container_width=True):
-                    st.switch_page("pages/3_Feedback.py")
+            # L'audit tourne dans le callback : la page n'est exécutée qu'une fois après le clic
+            st.button(
+                "Lancer le Copilote",
+                type="primary",
+                use_container_width=True,
+                on_click=run_copilot,
+                args=(json_payload,),
+            )
+            audit_error = ss.pop('audit_error', None)
+            if audit_error:
+                st.error(audit_error)
+
+        if analysis_done and ss['agent_result']:
+            render_results(ss['agent_result'])
 
     else:
         st.info("Sélectionnez une conversation ci-dessus pour commencer l'analyse.")
@@ -3,11 +3,13 @@ Page Mode Interactif - Simulation de triage aux urgences.
 Version Refactorisée : Full Agentic + Feedback Loop.
 """
 
+import copy
+import json
 import os
 import sys
-import uuid
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import requests
 import streamlit as st
@@ -15,10 +17,13 @@ import streamlit as st
 # Configuration des chemins
 current_dir = Path(__file__).parent
 interface_dir = current_dir.parent
-sys.path.append(str(interface_dir))
+if str(interface_dir) not in sys.path:
+    sys.path.append(str(interface_dir))
 
 from state import init_session_state
 from style import configure_page, apply_style
+from api_client import DigestCache, api_timeout, content_digest, get_http_session, parse_json, warm_up_connection
+from components import filter_empty_values, get_triage_emoji
 
 # IMPORTANT: configure_page DOIT être appelée EN PREMIER
 configure_page(page_title="Mode interactif - MedTriage-AI")
@@ -27,8 +32,38 @@ apply_style()
 
 # Configuration API
 API_URL = os.getenv("API_URL", "http://backend:8000")
+
+# Session HTTP partagée (connexions keep-alive réutilisées entre les tours de dialogue)
+HTTP_SESSION = get_http_session()
+
+# Connexion vers l'API ouverte en arrière-plan : le premier tour ne paie pas le handshake
+warm_up_connection(API_URL)
+
 MIN_FIELDS_FOR_VALIDATION = 4
 
+# Nombre de tours de simulation gardés en cache (toutes sessions confondues)
+SIMULATION_TURN_CACHE_SIZE = 128
+
+# Valeurs initiales des session states de la simulation : clé -> fabrique de la valeur
+SIMULATION_DEFAULTS = {
+    "simulation_messages": list,
+    "patient_persona": str,
+    "extracted_data": dict,
+    "suggested_questions": list,
+    "simulation_started": lambda: False,
+    "pending_message": lambda: None,
+    "triage_launched": lambda: False,
+    "final_triage_result": lambda: None,
+    # Nombre de messages déjà couverts par l'analyse de l'agent
+    "last_analyzed_idx": int,
+}
+
+# Messages de contexte lus par le patient simulé (history[-6:] côté API)
+PATIENT_CONTEXT_MESSAGES = 6
+
+# Analyses de l'agent terminées en arrière-plan (toutes sessions confondues)
+ANALYSIS_CONCURRENCY = 4
+
 # Liste stricte alignée sur le backend (med_tools.py)
 REQUIRED_FOR_ML = {
     "age", "sexe", 
@@ -40,65 +75,160 @@ REQUIRED_FOR_ML = {
     "constantes.frequence_respiratoire"
 }
 
-# --- FONCTIONS UTILITAIRES ---
+def _build_ml_field_labels() -> List[tuple]:
+    """Construit une seule fois (clé, est_constante, libellé) pour la sidebar et le calcul de complétion."""
+    fields = []
+    for field in sorted(REQUIRED_FOR_ML):
+        if "constantes." in field:
+            key = field.split(".")[1]
+            label = key.replace("_", " ").capitalize()
+        else:
+            key = field
+            label = field.capitalize()
+        label = label.replace("Frequence", "Fréq.").replace("Pression", "Tens.").replace("Saturation", "Sat.")
+        fields.append((key, "constantes." in field, label))
+    return fields
+
+ML_FIELD_LABELS = _build_ml_field_labels()
+
+# Mêmes champs regroupés par dictionnaire source (patient / constantes) pour le calcul de complétion
+ML_ROOT_KEYS = tuple(key for key, is_constante, _ in ML_FIELD_LABELS if not is_constante)
+ML_CONSTANTE_KEYS = tuple(key for key, is_constante, _ in ML_FIELD_LABELS if is_constante)
+EMPTY_VALUES = (None, "", [])
 
-def filter_empty_values(data: Dict) -> Dict:
-    """Nettoie le dictionnaire pour l'affichage."""
-    if not isinstance(data, dict): return data
-    clean_dict = {}
-    for k, v in data.items():
-        if isinstance(v, dict):
-            nested = filter_empty_values(v)
-            if nested: clean_dict[k] = nested
-        elif isinstance(v, list):
-            if v: clean_dict[k] = v
-        elif v is not None and v != "":
-            clean_dict[k] = v
-    return clean_dict
+# Tables de correspondance par niveau de gravité (construites une seule fois)
+REASONING_COLORS = {"ROUGE": "red", "JAUNE": "orange", "VERT": "green", "GRIS": "grey"}
+
+# (fond, texte, description) de la bannière de résultat
+TRIAGE_BANNER_STYLES = {
+    "ROUGE": ("#dc3545", "#fff", "Urgence Vitale"),
+    "JAUNE": ("#ffc107", "#000", "Urgence Relative"),
+    "VERT": ("#28a745", "#fff", "Consultation Standard"),
+    "GRIS": ("#6c757d", "#fff", "Non Urgent")
+}
+
+# Niveau de gravité -> (niveau FRENCH, délai, orientation)
+FRENCH_MAPPING = {
+    "ROUGE": ("Tri 1 / Tri 2", "Immédiat / < 20 min", "SAUV / Déchocage"),
+    "JAUNE": ("Tri 3", "< 60 min", "Box Urgence"),
+    "VERT": ("Tri 4", "< 120 min", "Zone de consultation"),
+    "GRIS": ("Tri 5", "< 240 min", "Salle d'attente")
+}
+
+# Cas de départ proposés (l'état du selectbox est l'identifiant entier du cas)
+PATIENT_PRESETS = (
+    {"id": 0, "label": "-- Personnalisé --", "persona": ""},
+    {"id": 1, "label": "Douleur thoracique", "persona": "Homme 58 ans, fumeur. Douleur poitrine..."},
+    {"id": 2, "label": "Crise d'asthme", "persona": "Femme 30 ans..."},
+)
+PRESETS_BY_ID = {preset["id"]: preset for preset in PATIENT_PRESETS}
+PRESET_IDS = tuple(PRESETS_BY_ID)
+
+# Recommandations par niveau de gravité
+RECOMMENDATIONS = {
+    "ROUGE": ["Prise en charge immédiate", "Monitoring continu", "Alerte médecin senior"],
+    "JAUNE": ["Surveillance rapprochée", "Réévaluation dans 30 min", "Bilan complémentaire"],
+    "VERT": ["Consultation standard", "Réévaluation si aggravation"],
+    "GRIS": ["Prise en charge différée possible", "Orientation médecine de ville si besoin"]
+}
+
+# Questions proposées par information manquante : (mot-clé, question), dans l'ordre de priorité
+QUESTION_TEMPLATES = (
+    ("temperature", "Avez-vous de la fièvre ?"),
+    ("frequence_cardiaque", "Votre cœur bat-il vite ?"),
+    ("douleur", "Votre douleur est à combien sur 10 ?"),
+    ("duree", "Depuis combien de temps ?"),
+    ("antecedents", "Vos antécédents ?"),
+    ("traitement", "Prenez-vous des médicaments ?"),
+    ("age", "Quel âge avez-vous ?"),
+    ("sexe", "Êtes-vous un homme ou une femme ?"),
+    ("saturation", "Respirez-vous bien ?"),
+)
+DEFAULT_QUESTIONS = ("Décrivez vos symptômes.", "Depuis quand ?", "Antécédents ?")
+
+# Explication statique du score de confiance (texte fixe, construit une seule fois)
+CONFIDENCE_HELP_MD = """
+Le **score de confiance** est calculé selon plusieurs critères :
+
+- **Base** : 75% (protocole FRENCH)
+- **+15%** si le ML confirme le niveau FRENCH
+- **+10%** si red flags détectés → confiance max
+- **-10%** si qualité des données LOW
+- **-20%** si données insuffisantes
+
+*Formule* : `Confiance = Base + Bonus_ML - Pénalité_Qualité`
+"""
+
+# --- FONCTIONS UTILITAIRES ---
 
 def calculate_ml_completion(data: Dict) -> float:
     """Calcule le pourcentage de complétion ML."""
     if not data: return 0.0
     root = data.get("patient", data)
     constantes = root.get("constantes", root)
-    present_count = 0
-    for field_path in REQUIRED_FOR_ML:
-        val = None
-        if "constantes." in field_path:
-            key = field_path.split(".")[1]
-            val = constantes.get(key)
-        else:
-            val = root.get(field_path)
-        if val is not None and val != "" and val != []:
-            present_count += 1
-    return (present_count / len(REQUIRED_FOR_ML)) * 100
-
-def get_triage_emoji(level: str) -> str:
-    emojis = {"ROUGE": "🔴", "JAUNE": "🟡", "VERT": "🟢", "GRIS": "⚪"}
-    return emojis.get(level, "⚪")
+    # Une boucle par dictionnaire source, sans test par champ
+    present_count = (
+        sum(root.get(key) not in EMPTY_VALUES for key in ML_ROOT_KEYS)
+        + sum(constantes.get(key) not in EMPTY_VALUES for key in ML_CONSTANTE_KEYS)
+    )
+    return (present_count / len(ML_FIELD_LABELS)) * 100
 
 # --- APPELS API ---
 
-def call_patient_simulation(persona: str, messages: List[Dict], nurse_message: str) -> Optional[str]:
+@st.cache_resource
+def get_turn_cache() -> DigestCache:
+    """
+    Tours de simulation terminés, indexés par empreinte du corps JSON.
+
+    Rejouer un cas avec les mêmes questions ne repaie ni le patient ni l'agent.
+    """
+    return DigestCache(maxsize=SIMULATION_TURN_CACHE_SIZE)
+
+def encode_turn_request(persona: str, messages: List[Dict], nurse_message: str,
+                        extracted_data: Optional[Dict] = None, analyzed_count: int = 0) -> bytes:
+    """
+    Corps JSON d'un tour, encodé de façon canonique (même contenu, même clé de cache).
+
+    Quand des données ont déjà été extraites, seuls les messages pas encore
+    analysés (et le contexte lu par le patient) sont envoyés avec ces données :
+    l'agent travaille sur le delta au lieu de toute la transcription.
+    """
+    payload = {"persona": persona, "history": messages, "nurse_message": nurse_message}
+    if extracted_data and analyzed_count:
+        new_messages = len(messages) - analyzed_count
+        payload["history"] = messages[-max(new_messages, PATIENT_CONTEXT_MESSAGES):]
+        # Les informations manquantes sont recalculées par l'agent à chaque tour
+        payload["extracted_data"] = {k: v for k, v in extracted_data.items() if k != "missing_critical_info"}
+        payload["new_messages"] = new_messages
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+def iter_turn_events(body: bytes) -> Iterator[Dict]:
+    """Événements NDJSON de /simulation/turn/stream (tokens, réponse complète, puis « done »)."""
     try:
-        response = requests.post(
-            f"{API_URL}/simulation/patient-response",
-            json={"persona": persona, "history": messages, "nurse_message": nurse_message},
-            timeout=15
-        )
-        if response.status_code == 200:
-            return response.json().get("response")
-    except requests.RequestException:
-        pass
-    return None
+        with HTTP_SESSION.post(
+            f"{API_URL}/simulation/turn/stream",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=api_timeout(45),
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+    except (requests.RequestException, ValueError):
+        return
 
-def call_agent_interact(messages: List[Dict]) -> Optional[Dict]:
-    try:
-        full_text = "\n".join([f"{'Infirmier' if m['role'] == 'user' else 'Patient'}: {m['content']}" for m in messages])
-        response = requests.post(f"{API_URL}/simulation/agent/interact", json={"text": full_text}, timeout=30)
-        return response.json() if response.status_code == 200 else None
-    except requests.RequestException:
-        return None
+@st.cache_resource
+def get_analysis_executor() -> ThreadPoolExecutor:
+    """Pool partagé qui termine les tours (analyse de l'agent) hors du script Streamlit."""
+    return ThreadPoolExecutor(max_workers=ANALYSIS_CONCURRENCY)
+
+def finish_turn(events: Iterator[Dict], turn: Dict) -> Dict:
+    """Consomme la fin du flux d'un tour (événement « done » de l'agent)."""
+    for event in events:
+        turn.update(event)
+    return turn
 
 def save_triage_to_history(result: Dict, extracted_data: Dict, metrics: Dict = None) -> Optional[str]:
     try:
@@ -112,9 +242,10 @@ def save_triage_to_history(result: Dict, extracted_data: Dict, metrics: Dict = N
             "recommendations": result.get("recommendations"),
             "metrics": metrics
         }
-        response = requests.post(f"{API_URL}/history/save", json=payload, timeout=10)
+        response = HTTP_SESSION.post(f"{API_URL}/history/save", json=payload, timeout=api_timeout(10))
         if response.status_code == 200:
-            return response.json().get("prediction_id")
+            st.session_state['history_version'] += 1
+            return parse_json(response).get("prediction_id")
     except requests.RequestException:
         pass
     return None
@@ -124,73 +255,141 @@ def save_triage_to_history(result: Dict, extracted_data: Dict, metrics: Dict = N
 def generate_question_suggestions() -> List[str]:
     data = st.session_state.get("extracted_data", {})
     missing_list = data.get("missing_critical_info", [])
-    templates = {
-        "temperature": "Avez-vous de la fièvre ?",
-        "frequence_cardiaque": "Votre cœur bat-il vite ?",
-        "douleur": "Votre douleur est à combien sur 10 ?",
-        "duree": "Depuis combien de temps ?",
-        "antecedents": "Vos antécédents ?",
-        "traitement": "Prenez-vous des médicaments ?",
-        "age": "Quel âge avez-vous ?",
-        "sexe": "Êtes-vous un homme ou une femme ?",
-        "saturation": "Respirez-vous bien ?"
-    }
     suggestions = []
     for missing_item in missing_list:
-        for key, question in templates.items():
-            if key in missing_item.lower() and question not in suggestions:
+        # Mise en minuscules une seule fois par item (et non par template)
+        item_lower = str(missing_item).lower()
+        for key, question in QUESTION_TEMPLATES:
+            if key in item_lower and question not in suggestions:
                 suggestions.append(question)
-    defaults = ["Décrivez vos symptômes.", "Depuis quand ?", "Antécédents ?"]
-    for d in defaults:
+    for d in DEFAULT_QUESTIONS:
         if len(suggestions) < 3 and d not in suggestions: suggestions.append(d)
     return suggestions[:3]
 
-def process_nurse_message(message: str) -> None:
-    st.session_state.simulation_messages.append({"role": "user", "content": message})
-    with st.spinner("Le patient réfléchit..."):
-        patient_resp = call_patient_simulation(st.session_state.patient_persona, st.session_state.simulation_messages, message) or "..."
-    st.session_state.simulation_messages.append({"role": "assistant", "content": patient_resp})
-    
-    with st.spinner("L'IA analyse..."):
-        agent_result = call_agent_interact(st.session_state.simulation_messages)
-        if agent_result and "extracted_data" in agent_result:
-            data = agent_result["extracted_data"]
-            if "missing_info" in agent_result: data["missing_critical_info"] = agent_result["missing_info"]
-            st.session_state.extracted_data = data
-            st.session_state['latest_agent_result'] = agent_result
-            
-            if "metrics" in agent_result:
-                m = agent_result["metrics"]
-                acc = st.session_state['current_interactive_session_metrics']
-                acc['cost_usd'] += m.get('cost_usd', 0) or 0
-                acc['gwp_kgco2'] += m.get('gwp_kgco2', 0) or 0
-                acc['energy_kwh'] += m.get('energy_kwh', 0) or 0
-                acc['nb_calls'] += 1
-                st.session_state['last_request_metrics'] = m
-                st.session_state['last_request_source'] = "Mode Interactif"
+def apply_turn_analysis(turn: Dict) -> None:
+    """Reporte l'analyse de l'agent d'un tour dans l'état de la simulation."""
+    agent_result = turn.get("agent")
+    if agent_result and agent_result.get("extracted_data") is not None:
+        data = agent_result["extracted_data"]
+        if "missing_info" in agent_result: data["missing_critical_info"] = agent_result["missing_info"]
+        st.session_state.extracted_data = data
+        st.session_state['latest_agent_result'] = agent_result
+        # Messages couverts par l'analyse : le prochain tour n'envoie que la suite
+        st.session_state['last_analyzed_idx'] = len(st.session_state.simulation_messages)
+        
+        if "metrics" in agent_result:
+            m = agent_result["metrics"]
+            acc = st.session_state['current_interactive_session_metrics']
+            acc['cost_usd'] += m.get('cost_usd', 0) or 0
+            acc['gwp_kgco2'] += m.get('gwp_kgco2', 0) or 0
+            acc['energy_kwh'] += m.get('energy_kwh', 0) or 0
+            acc['nb_calls'] += 1
+            st.session_state['last_request_metrics'] = m
+            st.session_state['last_request_source'] = "Mode Interactif"
 
     st.session_state.suggested_questions = generate_question_suggestions()
 
+def collect_pending_analysis(wait: bool = False) -> bool:
+    """
+    Applique l'analyse lancée en arrière-plan au tour précédent, si elle est terminée.
+
+    Avec `wait`, attend sa fin (nouvelle question posée avant la fin de l'analyse).
+    Retourne True si une analyse a été appliquée.
+    """
+    pending = st.session_state.get('pending_analysis')
+    if not pending:
+        return False
+    future = pending["future"]
+    if not future.done():
+        if not wait:
+            return False
+        with st.spinner("L'IA termine l'analyse précédente..."):
+            wait_futures([future])
+    del st.session_state['pending_analysis']
+    try:
+        turn = future.result()
+    except Exception:
+        return False
+    if turn.get("type") == "done":
+        # Copies : l'état de la session modifie ensuite le résultat de l'agent
+        get_turn_cache().put(pending["digest"], copy.deepcopy(turn))
+    apply_turn_analysis(turn)
+    return True
+
+def process_nurse_message(message: str, chat_box) -> None:
+    collect_pending_analysis(wait=True)
+    st.session_state.simulation_messages.append({"role": "user", "content": message})
+    body = encode_turn_request(
+        st.session_state.patient_persona, st.session_state.simulation_messages, message,
+        st.session_state.extracted_data, st.session_state.last_analyzed_idx
+    )
+    digest = content_digest(body)
+    turn = copy.deepcopy(get_turn_cache().get(digest)) or {}
+
+    if turn:
+        st.session_state.simulation_messages.append({"role": "assistant", "content": turn.get("response") or "..."})
+        apply_turn_analysis(turn)
+        return
+
+    # La réponse du patient s'affiche au fil de la génération
+    events = iter_turn_events(body)
+
+    def patient_tokens() -> Iterator[str]:
+        for event in events:
+            if event.get("type") != "token":
+                turn.update(event)
+                return
+            yield event["content"]
+
+    with chat_box:
+        st.chat_message("user", avatar="🧑‍⚕️").write(message)
+        with st.chat_message("assistant", avatar="🤒"):
+            st.write_stream(patient_tokens())
+    st.session_state.simulation_messages.append({"role": "assistant", "content": turn.get("response") or "..."})
+
+    # L'analyse de l'agent (qui dépend de la réponse du patient) se termine en arrière-plan :
+    # la page redevient interactive sans attendre, l'analyse est appliquée dès qu'elle arrive
+    future = get_analysis_executor().submit(finish_turn, events, turn)
+    st.session_state['pending_analysis'] = {"digest": digest, "future": future}
+
 # --- UI RENDERING ---
 
 def render_agent_reasoning():
     res = st.session_state.get("latest_agent_result")
     if not res: return
     criticity = res.get("criticity", "GRIS")
-    colors = {"ROUGE": "red", "JAUNE": "orange", "VERT": "green", "GRIS": "grey"}
-    with st.expander(f"🧠 Raisonnement IA (Triage : :{colors.get(criticity, 'grey')}[{criticity}])", expanded=True):
-        for step in res.get("reasoning_steps", []):
-            if "Tool Call" in step: st.caption(f"🛠️ {step}")
-            elif "Finalisation" in step: st.caption("🏁 Conclusion...")
-            else: st.markdown(f"- {step}")
+    with st.expander(f"🧠 Raisonnement IA (Triage : :{REASONING_COLORS.get(criticity, 'grey')}[{criticity}])", expanded=True):
+        # Les étapes consécutives sont regroupées en un seul st.markdown
+        # (un élément envoyé au navigateur au lieu d'un par étape)
+        bullets = []
+
+        def flush_bullets():
+            """Affiche les étapes accumulées en un seul élément, puis vide la liste."""
+            if bullets:
+                st.markdown("\n".join(bullets))
+                bullets.clear()
 
-def render_json_panel():
+        for step in res.get("reasoning_steps", []):
+            if "Tool Call" in step or "Finalisation" in step:
+                flush_bullets()
+                st.caption(f"🛠️ {step}" if "Tool Call" in step else "🏁 Conclusion...")
+            else:
+                bullets.append(f"- {step}")
+        flush_bullets()
+
+@st.fragment(run_every=1)
+def render_analysis_status():
+    """Suit l'analyse en arrière-plan ; la page entière est relancée dès qu'elle est appliquée."""
+    if collect_pending_analysis():
+        st.rerun(scope="app")
+    st.caption("🧠 Analyse de l'IA en cours...")
+
+def render_json_panel(progress: float):
     st.markdown("### 📋 Données Extraites")
     raw = st.session_state.get("extracted_data", {})
     if raw:
         clean = filter_empty_values(raw)
         st.json(clean)
-        progress = calculate_ml_completion(raw)
         color, label = ("#28a745", "✅ Dossier complet ML") if progress >= 100 else ("#dc3545", f"❌ Incomplet ML ({int(progress)}%)")
         st.markdown(f"""<div style="background:#e9ecef;border-radius:5px;height:8px;margin-top:5px;"><div style="background:{color};width:{progress}%;height:100%;border-radius:5px;"></div></div><div style="text-align:right;font-size:0.8em;color:#666;">{label}</div>""", unsafe_allow_html=True)
     else:
@@ -210,27 +409,18 @@ def render_sidebar_summary():
     root = data.get("patient", data)
     const = root.get("constantes", root) if isinstance(root.get("constantes"), dict) else {}
     
-    for field in sorted(REQUIRED_FOR_ML):
-        if "constantes." in field:
-            key = field.split(".")[1]
-            val = const.get(key)
-            label = key.replace("_", " ").capitalize()
-        else:
-            val = root.get(field)
-            label = field.capitalize()
-        label = label.replace("Frequence", "Fréq.").replace("Pression", "Tens.").replace("Saturation", "Sat.")
+    # Toute la checklist en un seul élément (et non un st.markdown par champ)
+    lines = []
+    for key, is_constante, label in ML_FIELD_LABELS:
+        val = const.get(key) if is_constante else root.get(key)
         icon, display = ("✅", f": **{val}**") if (val is not None and val != "" and val != []) else ("⬜", "")
-        st.sidebar.markdown(f"{icon} {label}{display}")
-
-def init_simulation_state():
-    keys = ["simulation_messages", "patient_persona", "extracted_data", "suggested_questions", "simulation_started", "pending_message", "triage_launched", "final_triage_result"]
-    for k in keys:
-        if k not in st.session_state: st.session_state[k] = None if k == "pending_message" or k == "final_triage_result" else [] if "messages" in k or "questions" in k else {} if "data" in k else False if "started" in k or "launched" in k else ""
-    if "current_interactive_session_metrics" not in st.session_state:
-        st.session_state.current_interactive_session_metrics = {'cost_usd': 0, 'gwp_kgco2': 0, 'energy_kwh': 0, 'nb_calls': 0}
+        lines.append(f"{icon} {label}{display}")
+    st.sidebar.markdown("\n\n".join(lines))
 
 def main():
-    init_simulation_state()
+    init_session_state(SIMULATION_DEFAULTS)
+    # Analyse du dernier tour terminée entre-temps : appliquée avant le rendu
+    collect_pending_analysis()
     st.title("Mode Interactif")
     
     if st.session_state.triage_launched and st.session_state.final_triage_result:
@@ -242,14 +432,7 @@ def main():
             confidence = confidence * 100
         emoji = get_triage_emoji(lvl)
 
-        # Couleurs par niveau
-        colors = {
-            "ROUGE": ("#dc3545", "#fff", "Urgence Vitale"),
-            "JAUNE": ("#ffc107", "#000", "Urgence Relative"),
-            "VERT": ("#28a745", "#fff", "Consultation Standard"),
-            "GRIS": ("#6c757d", "#fff", "Non Urgent")
-        }
-        bg_color, text_color, level_desc = colors.get(lvl, ("#6c757d", "#fff", "Non défini"))
+        bg_color, text_color, level_desc = TRIAGE_BANNER_STYLES.get(lvl, ("#6c757d", "#fff", "Non défini"))
 
         # Grande bannière de triage
         st.markdown(f"""
@@ -283,17 +466,7 @@ def main():
             """, unsafe_allow_html=True)
 
             with st.expander("Comment est calculé le score ?"):
-                st.markdown("""
-                Le **score de confiance** est calculé selon plusieurs critères :
-
-                - **Base** : 75% (protocole FRENCH)
-                - **+15%** si le ML confirme le niveau FRENCH
-                - **+10%** si red flags détectés → confiance max
-                - **-10%** si qualité des données LOW
-                - **-20%** si données insuffisantes
-
-                *Formule* : `Confiance = Base + Bonus_ML - Pénalité_Qualité`
-                """)
+                st.markdown(CONFIDENCE_HELP_MD)
 
         with col2:
             st.markdown("### Prise en Charge")
@@ -321,20 +494,17 @@ def main():
         st.info(f"📋 {justification}")
 
         # Signaux d'alerte
-        red_flags = res.get("red_flags", [])
+        red_flags = [flag for flag in res.get("red_flags", []) if flag]
         if red_flags:
             st.markdown("### Signaux d'Alerte")
-            for flag in red_flags:
-                if flag:
-                    st.error(f"🚨 {flag}")
+            # Un seul bloc pour toutes les alertes (un élément par liste, pas par ligne)
+            st.error("\n\n".join(f"🚨 {flag}" for flag in red_flags))
 
         # Recommandations
-        recommendations = res.get("recommendations", [])
+        recommendations = [rec for rec in res.get("recommendations", []) if rec]
         if recommendations:
             st.markdown("### Recommandations")
-            for rec in recommendations:
-                if rec:
-                    st.warning(f"💡 {rec}")
+            st.warning("\n\n".join(f"💡 {rec}" for rec in recommendations))
 
         st.markdown("---")
 
@@ -342,7 +512,7 @@ def main():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("🔄 Nouvelle Simulation", use_container_width=True):
-                for k in ["simulation_messages", "patient_persona", "extracted_data", "triage_launched", "final_triage_result", "simulation_started", "latest_agent_result"]:
+                for k in ["simulation_messages", "patient_persona", "extracted_data", "triage_launched", "final_triage_result", "simulation_started", "latest_agent_result", "pending_analysis", "last_analyzed_idx"]:
                     if k in st.session_state: del st.session_state[k]
                 st.session_state['current_interactive_session_metrics'] = {'cost_usd': 0, 'gwp_kgco2': 0, 'energy_kwh': 0, 'nb_calls': 0}
                 st.rerun()
@@ -369,9 +539,8 @@ def main():
 
     if not st.session_state.simulation_started:
         with st.expander("Configuration", expanded=True):
-            presets = {"Douleur thoracique": "Homme 58 ans, fumeur. Douleur poitrine...", "Crise d'asthme": "Femme 30 ans..."}
-            sel = st.selectbox("Cas", ["-- Personnalisé --"] + list(presets.keys()))
-            txt = presets[sel] if sel != "-- Personnalisé --" else ""
+            sel = st.selectbox("Cas", PRESET_IDS, format_func=lambda i: PRESETS_BY_ID[i]["label"])
+            txt = PRESETS_BY_ID[sel]["persona"]
             persona = st.text_area("Patient", value=st.session_state.patient_persona or txt)
             st.session_state.patient_persona = persona
             if st.button("Démarrer", type="primary", disabled=not persona):
@@ -389,28 +558,33 @@ def main():
                 st.session_state.pending_message = s
                 st.rerun()
         
-        with st.container(height=400, border=True):
+        chat_box = st.container(height=400, border=True)
+        with chat_box:
             for m in st.session_state.simulation_messages:
                 st.chat_message(m["role"], avatar="🧑‍⚕️" if m["role"]=="user" else "🤒").write(m["content"])
 
         if msg := st.chat_input("Votre question..."):
-            process_nurse_message(msg)
+            process_nurse_message(msg, chat_box)
             st.rerun()
             
         if st.session_state.pending_message:
-            process_nurse_message(st.session_state.pending_message)
+            process_nurse_message(st.session_state.pending_message, chat_box)
             st.session_state.pending_message = None
             st.rerun()
             
         st.markdown("<br>", unsafe_allow_html=True)
+        # Fragment (et son minuteur) rendu uniquement pendant une analyse en cours
+        if st.session_state.get('pending_analysis'):
+            render_analysis_status()
         render_agent_reasoning()
 
     with col_json:
-        render_json_panel()
-        st.markdown("---")
         data = st.session_state.get("extracted_data", {})
         agent_res = st.session_state.get("latest_agent_result", {})
+        # Complétion calculée une seule fois par rerun (panneau JSON et bouton de validation)
         ml_completion = calculate_ml_completion(data)
+        render_json_panel(ml_completion)
+        st.markdown("---")
         is_emergency = agent_res.get("criticity") == "ROUGE"
         
         if ml_completion >= 100 or is_emergency:
@@ -418,13 +592,7 @@ def main():
                 if agent_res:
                     # Mapping niveau de gravité vers niveau FRENCH et délais
                     gravity = agent_res.get("criticity", "GRIS")
-                    french_mapping = {
-                        "ROUGE": ("Tri 1 / Tri 2", "Immédiat / < 20 min", "SAUV / Déchocage"),
-                        "JAUNE": ("Tri 3", "< 60 min", "Box Urgence"),
-                        "VERT": ("Tri 4", "< 120 min", "Zone de consultation"),
-                        "GRIS": ("Tri 5", "< 240 min", "Salle d'attente")
-                    }
-                    french_level, delai, orientation = french_mapping.get(gravity, ("Tri 5", "À évaluer", "À déterminer"))
+                    french_level, delai, orientation = FRENCH_MAPPING.get(gravity, ("Tri 5", "À évaluer", "À déterminer"))
 
                     # Calcul du score de confiance
                     base_confidence = 0.75
@@ -438,14 +606,6 @@ def main():
                     protocol_alert = agent_res.get("protocol_alert", "")
                     justification = protocol_alert if protocol_alert else f"Triage {gravity} basé sur l'analyse des données cliniques selon le protocole FRENCH."
 
-                    # Recommandations basées sur le niveau
-                    recommendations_map = {
-                        "ROUGE": ["Prise en charge immédiate", "Monitoring continu", "Alerte médecin senior"],
-                        "JAUNE": ["Surveillance rapprochée", "Réévaluation dans 30 min", "Bilan complémentaire"],
-                        "VERT": ["Consultation standard", "Réévaluation si aggravation"],
-                        "GRIS": ["Prise en charge différée possible", "Orientation médecine de ville si besoin"]
-                    }
-
                     final = {
                         "gravity_level": gravity,
                         "french_triage_level": french_level,
@@ -454,7 +614,8 @@ def main():
                         "orientation": orientation,
                         "justification": justification,
                         "red_flags": [protocol_alert] if protocol_alert else agent_res.get("missing_info", [])[:3],
-                        "recommendations": recommendations_map.get(gravity, [])
+                        # Copie : la liste est conservée dans session_state
+                        "recommendations": list(RECOMMENDATIONS.get(gravity, []))
                     }
 
                     acc = st.session_state['current_interactive_session_metrics']
@@ -8,6 +8,7 @@ Les données proviennent de l'historique persistant (history.json via API).
 """
 
 import os
+import time
 import streamlit as st
 import requests
 import sys
@@ -15,10 +16,13 @@ from pathlib import Path
 
 current_dir = Path(__file__).parent
 interface_dir = current_dir.parent
-sys.path.append(str(interface_dir))
+if str(interface_dir) not in sys.path:
+    sys.path.append(str(interface_dir))
 
 from style import  configure_page, apply_style
 from state import init_session_state
+from api_client import get_http_session, parse_json
+from components import TRIAGE_COLORS
 
 # IMPORTANT: configure_page DOIT être appelée EN PREMIER
 configure_page(page_title="Dashboard - MedTriage-AI")
@@ -29,6 +33,12 @@ apply_style()
 # URL de l'API Backend
 API_URL = os.getenv("API_URL", "http://backend:8000")
 
+# Session HTTP partagée (connexions keep-alive réutilisées entre les reruns)
+HTTP_SESSION = get_http_session()
+
+# Âge maximal (s) des statistiques gardées en session quand aucun triage n'a été enregistré
+HISTORY_STATS_MAX_AGE = 60
+
 st.title("Dashboard & Monitoring")
 st.caption("Pilotage GreenOps / FinOps")
 
@@ -44,11 +54,23 @@ prix_modeles = {
 
 
 def get_history_stats():
-    """Récupère les statistiques depuis l'API /history/stats."""
+    """
+    Récupère les statistiques depuis l'API /history/stats.
+
+    Le résultat est gardé en session avec le compteur `history_version` :
+    tant qu'aucun triage n'a été enregistré et que HISTORY_STATS_MAX_AGE
+    n'est pas dépassé, un rerun (widget, navigation) ne refait pas l'appel.
+    """
+    version = st.session_state['history_version']
+    cached = st.session_state.get('history_stats')
+    if cached and cached["version"] == version and time.monotonic() - cached["fetched_at"] < HISTORY_STATS_MAX_AGE:
+        return cached["stats"]
     try:
-        response = requests.get(f"{API_URL}/history/stats", timeout=10)
+        response = HTTP_SESSION.get(f"{API_URL}/history/stats", timeout=10)
         if response.status_code == 200:
-            return response.json()
+            stats = parse_json(response)
+            st.session_state['history_stats'] = {"version": version, "fetched_at": time.monotonic(), "stats": stats}
+            return stats
     except requests.RequestException:
         pass
     return None
@@ -208,13 +230,6 @@ with st.container(border=True):
             st.divider()
 
         # --- REPARTITION PAR NIVEAU DE TRIAGE ---
-        colors = {
-            "ROUGE": "#DC2626",
-            "JAUNE": "#F59E0B",
-            "VERT": "#10B981",
-            "GRIS": "#6B7280"
-        }
-
         st.markdown("**Répartition des niveaux de triage**")
 
         r1, r2, r3, r4 = st.columns(4)
@@ -224,7 +239,7 @@ with st.container(border=True):
             pct = (count / total_triages * 100) if total_triages > 0 else 0
             with col:
                 st.markdown(
-                    f'<span style="display:inline-block;width:12px;height:12px;border-radius:50%;background:{colors[level]};margin-right:6px;vertical-align:middle;"></span>**{level}**',
+                    f'<span style="display:inline-block;width:12px;height:12px;border-radius:50%;background:{TRIAGE_COLORS[level]};margin-right:6px;vertical-align:middle;"></span>**{level}**',
                     unsafe_allow_html=True
                 )
                 st.metric(
@@ -9,9 +9,11 @@ Cette page permet aux infirmières de:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 
 import requests
 import streamlit as st
@@ -19,10 +21,13 @@ import streamlit as st
 # Configuration des chemins
 current_dir = Path(__file__).parent
 interface_dir = current_dir.parent
-sys.path.append(str(interface_dir))
+if str(interface_dir) not in sys.path:
+    sys.path.append(str(interface_dir))
 
 from state import init_session_state
 from style import  configure_page, apply_style, render_triage_badge
+from api_client import get_http_session, parse_json
+from components import get_triage_emoji
 
 # IMPORTANT: configure_page DOIT être appelée EN PREMIER (avant tout autre appel Streamlit)
 configure_page(page_title="Feedback - MedTriage-AI")
@@ -32,9 +37,24 @@ apply_style()
 # Configuration API
 API_URL = os.getenv("API_URL", "http://backend:8000")
 
+# Session HTTP partagée (keep-alive), utilisable depuis les threads de préchargement
+HTTP_SESSION = get_http_session()
+
 # Constantes
 GRAVITY_LEVELS = ["ROUGE", "JAUNE", "VERT", "GRIS"]
+
+# Clés de `by_gravity_level` (API) -> libellés du tableau de détail par niveau
+GRAVITY_STAT_COLUMNS = {
+    "total": "Total",
+    "correct": "Corrects",
+    "upgraded": "Sous-estimations",
+    "downgraded": "Sur-estimations",
+    "disagreed": "Désaccords",
+}
+GRAVITY_INDEX = {level: i for i, level in enumerate(GRAVITY_LEVELS)}
 FRENCH_LEVELS = ["Tri 1", "Tri 2", "Tri 3A", "Tri 3B", "Tri 4", "Tri 5"]
+HISTORY_PAGE_SIZE = 10
+FEEDBACK_BATCH_WORKERS = 8
 FEEDBACK_TYPES = {
     "correct": "Triage correct",
     "upgrade": "Sous-estimation (devrait être plus grave)",
@@ -43,20 +63,20 @@ FEEDBACK_TYPES = {
 }
 
 
-def get_triage_color(level: str) -> str:
-    colors = {"ROUGE": "#dc3545", "JAUNE": "#ffc107", "VERT": "#28a745", "GRIS": "#6c757d"}
-    return colors.get(level, "#6c757d")
-
-
-def get_triage_emoji(level: str) -> str:
-    emojis = {"ROUGE": "🔴", "JAUNE": "🟡", "VERT": "🟢", "GRIS": "⚪"}
-    return emojis.get(level, "⚪")
+@lru_cache(maxsize=1024)
+def format_timestamp(timestamp: str) -> str:
+    """Formate un timestamp ISO pour l'affichage (mis en cache : les entrées ne changent pas)."""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return dt.strftime("%d/%m/%Y %H:%M")
+    except (ValueError, AttributeError):
+        return timestamp[:19] if len(timestamp) > 19 else timestamp
 
 
 def get_feedback_stats() -> Optional[Dict]:
     """Récupère les statistiques de feedback."""
     try:
-        response = requests.get(f"{API_URL}/feedback/stats", timeout=10)
+        response = HTTP_SESSION.get(f"{API_URL}/feedback/stats", timeout=10)
         if response.status_code == 200:
             return response.json()
     except requests.RequestException:
@@ -67,7 +87,7 @@ def get_feedback_stats() -> Optional[Dict]:
 def get_feedback_count() -> int:
     """Récupère le nombre de feedbacks."""
     try:
-        response = requests.get(f"{API_URL}/feedback/count", timeout=5)
+        response = HTTP_SESSION.get(f"{API_URL}/feedback/count", timeout=5)
         if response.status_code == 200:
             return response.json().get("count", 0)
     except requests.RequestException:
@@ -75,22 +95,37 @@ def get_feedback_count() -> int:
     return 0
 
 
-def get_triage_history(limit: int = 50) -> List[Dict]:
-    """Récupère l'historique des triages depuis l'API."""
+def get_triage_history(limit: int = HISTORY_PAGE_SIZE, offset: int = 0) -> Dict:
+    """Récupère une page de l'historique des triages (entrées + total) depuis l'API."""
     try:
-        response = requests.get(f"{API_URL}/history/list", params={"limit": limit}, timeout=10)
+        response = HTTP_SESSION.get(
+            f"{API_URL}/history/list",
+            params={"limit": limit, "offset": offset},
+            timeout=10
+        )
         if response.status_code == 200:
-            data = response.json()
-            return data.get("entries", [])
+            data = parse_json(response)
+            return {"entries": data.get("entries", []), "total": data.get("total", 0)}
     except requests.RequestException:
         pass
-    return []
+    return {"entries": [], "total": 0}
 
 
 def get_history_stats() -> Optional[Dict]:
     """Récupère les statistiques de l'historique."""
     try:
-        response = requests.get(f"{API_URL}/history/stats", timeout=10)
+        response = HTTP_SESSION.get(f"{API_URL}/history/stats", timeout=10)
+        if response.status_code == 200:
+            return response.json()
+    except requests.RequestException:
+        pass
+    return None
+
+
+def get_latest_model_info() -> Optional[Dict]:
+    """Récupère les informations du modèle actuel."""
+    try:
+        response = HTTP_SESSION.get(f"{API_URL}/models/latest", timeout=5)
         if response.status_code == 200:
             return response.json()
     except requests.RequestException:
@@ -104,7 +139,7 @@ def update_history_feedback(prediction_id: str, feedback_type: str, corrected_gr
         params = {"feedback_type": feedback_type}
         if corrected_gravity:
             params["corrected_gravity"] = corrected_gravity
-        response = requests.patch(
+        response = HTTP_SESSION.patch(
             f"{API_URL}/history/entry/{prediction_id}/feedback",
             params=params,
             timeout=10
@@ -140,7 +175,7 @@ def submit_feedback(
             "patient_features": patient_features or {}
         }
 
-        response = requests.post(
+        response = HTTP_SESSION.post(
             f"{API_URL}/feedback/submit",
             json=payload,
             timeout=10
@@ -150,6 +185,40 @@ def submit_feedback(
         return False
 
 
+def build_patient_features(extracted_data: Optional[Dict]) -> Dict:
+    """Features du patient conservées avec le feedback pour le retraining."""
+    if not extracted_data:
+        return {}
+    constantes = extracted_data.get("constantes", {})
+    return {
+        "age": extracted_data.get("age"),
+        "sexe": extracted_data.get("sexe"),
+        "temperature": constantes.get("temperature"),
+        "frequence_cardiaque": constantes.get("frequence_cardiaque"),
+        "saturation_oxygene": constantes.get("saturation_oxygene"),
+        "pression_systolique": constantes.get("pression_systolique"),
+        "echelle_douleur": constantes.get("echelle_douleur"),
+    }
+
+
+def submit_history_validation(entry: Dict, feedback_type: str, corrected_gravity: Optional[str]) -> bool:
+    """Enregistre la validation rapide d'un triage de l'historique (feedback + historique)."""
+    prediction_id = entry.get('prediction_id')
+    if feedback_type == "correct":
+        corrected_gravity = None
+    success = submit_feedback(
+        prediction_id=prediction_id,
+        original_gravity=entry.get('gravity_level', 'GRIS'),
+        feedback_type=feedback_type,
+        corrected_gravity=corrected_gravity,
+        patient_features=build_patient_features(entry.get('extracted_data') or entry.get('patient_input')),
+    )
+    if success:
+        update_history_feedback(prediction_id, feedback_type, corrected_gravity)
+    return success
+
+
+@st.fragment
 def render_feedback_form() -> None:
     """Affiche le formulaire de feedback pour le dernier triage."""
     last_result = st.session_state.get('last_triage_result')
@@ -216,7 +285,7 @@ def render_feedback_form() -> None:
             corrected_gravity = st.selectbox(
                 "Niveau de gravité correct",
                 options=GRAVITY_LEVELS,
-                index=GRAVITY_LEVELS.index(original_gravity) if original_gravity in GRAVITY_LEVELS else 0
+                index=GRAVITY_INDEX.get(original_gravity, 0)
             )
         with col2:
             corrected_french = st.selectbox(
@@ -242,17 +311,7 @@ def render_feedback_form() -> None:
 
     if st.button("Soumettre le Feedback", type="primary", use_container_width=True):
         # Préparer les features du patient pour le retraining
-        patient_features = {}
-        if extracted_data:
-            patient_features = {
-                "age": extracted_data.get("age"),
-                "sexe": extracted_data.get("sexe"),
-                "temperature": extracted_data.get("constantes", {}).get("temperature"),
-                "frequence_cardiaque": extracted_data.get("constantes", {}).get("frequence_cardiaque"),
-                "saturation_oxygene": extracted_data.get("constantes", {}).get("saturation_oxygene"),
-                "pression_systolique": extracted_data.get("constantes", {}).get("pression_systolique"),
-                "echelle_douleur": extracted_data.get("constantes", {}).get("echelle_douleur"),
-            }
+        patient_features = build_patient_features(extracted_data)
 
         success = submit_feedback(
             prediction_id=prediction_id,
@@ -278,123 +337,225 @@ def render_feedback_form() -> None:
             st.error("Erreur lors de l'enregistrement du feedback. Vérifiez la connexion à l'API.")
 
 
+def set_history_page(page: int) -> None:
+    """Change la page affichée de l'historique."""
+    st.session_state["history_page"] = max(0, page)
+
+
+@st.fragment
 def render_history() -> None:
     """Affiche l'historique des triages."""
     st.markdown("## Historique des Triages")
 
-    history = get_triage_history()
+    # Pagination côté API : seule la page affichée est chargée et rendue
+    page = st.session_state.get("history_page", 0)
+    history = get_triage_history(limit=HISTORY_PAGE_SIZE, offset=page * HISTORY_PAGE_SIZE)
+    total_triages = history["total"]
+    page_count = max(1, -(-total_triages // HISTORY_PAGE_SIZE))
 
-    if not history:
+    if page >= page_count and page > 0:
+        # Historique réduit depuis le dernier affichage : retour à la dernière page
+        page = page_count - 1
+        st.session_state["history_page"] = page
+        history = get_triage_history(limit=HISTORY_PAGE_SIZE, offset=page * HISTORY_PAGE_SIZE)
+
+    if not history["entries"]:
         st.info("Aucun triage enregistré pour le moment.")
         return
 
-    # Trier par date décroissante
-    history_sorted = sorted(
-        history,
-        key=lambda x: x.get('timestamp', ''),
-        reverse=True
-    )
-    
-    # Option pour limiter le nombre de triages affichés
-    total_triages = len(history_sorted)
+    # L'API renvoie déjà les entrées triées par date décroissante
     st.markdown(f"**Total de triages:** {total_triages}")
-    
-    # Afficher un slider seulement s'il y a plus de 5 triages
-    if total_triages > 5:
-        max_display = st.slider(
-            "Nombre de triages à afficher", 
-            min_value=5, 
-            max_value=total_triages, 
-            value=min(20, total_triages),
-            step=5
-        )
-        history_sorted = history_sorted[:max_display]
-    # Sinon, afficher tous les triages disponibles
-
-    for idx, entry in enumerate(history_sorted):
-        gravity = entry.get('gravity_level', 'GRIS')
-        color = get_triage_color(gravity)
-        emoji = get_triage_emoji(gravity)
-        timestamp = entry.get('timestamp', 'N/A')
-        prediction_id = entry.get('prediction_id', 'N/A')[:8]
-        french_level = entry.get('french_triage_level', 'N/A')
-
-        # Parser le timestamp si possible
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            timestamp_display = dt.strftime("%d/%m/%Y %H:%M")
-        except:
-            timestamp_display = timestamp[:19] if len(timestamp) > 19 else timestamp
-
-        # Indicateur de feedback dans le titre
-        feedback_indicator = "✅" if entry.get('feedback_given') else "⚠️"
+
+    if page_count > 1:
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            st.button("◀ Précédents", disabled=page == 0, use_container_width=True,
+                      on_click=set_history_page, args=(page - 1,))
+        with col_page:
+            st.caption(f"Page {page + 1} / {page_count}")
+        with col_next:
+            st.button("Suivants ▶", disabled=page >= page_count - 1, use_container_width=True,
+                      on_click=set_history_page, args=(page + 1,))
+
+    entries = history["entries"]
+
+    # Tableau unique éditable au lieu d'un expander par triage : validation rapide
+    # des triages sans feedback directement dans les colonnes "Validation"/"Niveau corrigé"
+    rows = [
+        {
+            "Feedback": "✅" if entry.get('feedback_given') else "⚠️",
+            "Niveau": f"{get_triage_emoji(entry.get('gravity_level', 'GRIS'))} {entry.get('gravity_level', 'GRIS')}",
+            "Date": format_timestamp(entry.get('timestamp', 'N/A')),
+            "ID": entry.get('prediction_id', 'N/A')[:8],
+            "FRENCH": entry.get('french_triage_level', 'N/A'),
+            "Validation": None,
+            "Niveau corrigé": None,
+        }
+        for entry in entries
+    ]
+    edited = st.data_editor(
+        rows,
+        key=f"history_editor_{page}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=["Feedback", "Niveau", "Date", "ID", "FRENCH"],
+        column_config={
+            "Validation": st.column_config.SelectboxColumn(
+                "Validation", options=list(FEEDBACK_TYPES), help="correct / upgrade / downgrade / disagree"
+            ),
+            "Niveau corrigé": st.column_config.SelectboxColumn("Niveau corrigé", options=GRAVITY_LEVELS),
+        },
+    )
+
+    # Seules les lignes modifiées et encore sans feedback sont envoyées
+    to_submit = [
+        (entry, row["Validation"], row["Niveau corrigé"])
+        for entry, row in zip(entries, edited)
+        if row["Validation"] and not entry.get('feedback_given')
+    ]
+    if st.button(f"Enregistrer les validations ({len(to_submit)})", disabled=not to_submit, type="primary"):
+        # Envois indépendants : lancés en parallèle (durée ≈ un aller-retour au lieu de N)
+        with ThreadPoolExecutor(max_workers=min(FEEDBACK_BATCH_WORKERS, len(to_submit))) as executor:
+            results = list(executor.map(lambda args: submit_history_validation(*args), to_submit))
+        failures = results.count(False)
+        # Toasts : restent affichés après le rerun du fragment
+        if failures:
+            st.toast(f"{failures} validation(s) non enregistrée(s). Vérifiez la connexion à l'API.")
+        else:
+            st.toast(f"{len(to_submit)} validation(s) enregistrée(s).")
+        st.session_state.pop(f"history_editor_{page}", None)
+        st.rerun(scope="fragment")
+
+    # Détail d'un seul triage à la fois
+    entries_by_id = {entry.get('prediction_id', 'N/A'): entry for entry in entries}
+    selected_id = st.selectbox(
+        "Détails du triage",
+        list(entries_by_id),
+        format_func=lambda pid: f"{get_triage_emoji(entries_by_id[pid].get('gravity_level', 'GRIS'))} "
+                                f"{format_timestamp(entries_by_id[pid].get('timestamp', 'N/A'))} (ID: {pid[:8]}...)",
+    )
+    with st.container(border=True):
+        render_history_entry(entries_by_id[selected_id])
+
+
+def render_history_entry(entry: Dict) -> None:
+    """Affiche le détail d'un triage de l'historique et son feedback."""
+    gravity = entry.get('gravity_level', 'GRIS')
+    french_level = entry.get('french_triage_level', 'N/A')
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown(f"**Niveau:** {french_level}")
+        # CORRECTION: Utiliser 'or 0' pour éviter NoneType
+        confidence = entry.get('confidence_score') or 0
+        st.markdown(f"**Confiance:** {confidence*100:.0f}%")
+
+    with col2:
+        if entry.get('orientation'):
+            st.markdown(f"**Orientation:** {entry['orientation']}")
+        if entry.get('delai_prise_en_charge'):
+            st.markdown(f"**Délai:** {entry['delai_prise_en_charge']}")
+
+    with col3:
+        st.markdown(f"**Modèle:** {entry.get('model_version', 'N/A')}")
+        if entry.get('ml_available'):
+            st.markdown("**ML:** Actif")
+
+    # Section Feedback - AMÉLIORÉE
+    st.markdown("---")
+    if not entry.get('feedback_given'):
+        st.warning("⚠️ Aucun feedback pour ce triage")
+        if st.button(f"📝 Donner un feedback", key=f"fb_{entry.get('prediction_id')}", type="primary"):
+            st.session_state['last_triage_result'] = {
+                'prediction_id': entry.get('prediction_id'),
+                'gravity_level': gravity,
+                'french_triage_level': french_level,
+                'extracted_data': entry.get('extracted_data') or entry.get('patient_input', {})
+            }
+            st.rerun()
+    else:
+        st.success("✅ Feedback reçu")
         
-        with st.expander(f"{feedback_indicator} {emoji} {gravity} - {timestamp_display} (ID: {prediction_id}...)"):
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.markdown(f"**Niveau:** {french_level}")
-                # CORRECTION: Utiliser 'or 0' pour éviter NoneType
-                confidence = entry.get('confidence_score') or 0
-                st.markdown(f"**Confiance:** {confidence*100:.0f}%")
-
-            with col2:
-                if entry.get('orientation'):
-                    st.markdown(f"**Orientation:** {entry['orientation']}")
-                if entry.get('delai_prise_en_charge'):
-                    st.markdown(f"**Délai:** {entry['delai_prise_en_charge']}")
-
-            with col3:
-                st.markdown(f"**Modèle:** {entry.get('model_version', 'N/A')}")
-                if entry.get('ml_available'):
-                    st.markdown("**ML:** Actif")
-
-            # Section Feedback - AMÉLIORÉE
-            st.markdown("---")
-            if not entry.get('feedback_given'):
-                st.warning("⚠️ Aucun feedback pour ce triage")
-                if st.button(f"📝 Donner un feedback", key=f"fb_{idx}", type="primary"):
-                    st.session_state['last_triage_result'] = {
-                        'prediction_id': entry.get('prediction_id'),
-                        'gravity_level': gravity,
-                        'french_triage_level': french_level,
-                        'extracted_data': entry.get('extracted_data') or entry.get('patient_input', {})
-                    }
-                    st.rerun()
-            else:
-                st.success("✅ Feedback reçu")
-                
-                # Afficher les détails du feedback
-                feedback_type = entry.get('feedback_type', 'correct')
-                st.markdown(f"**Type:** {FEEDBACK_TYPES.get(feedback_type, feedback_type)}")
-                
-                # Commentaire du feedback
-                if entry.get('feedback_comment'):
-                    st.markdown(f"**Commentaire:** _{entry['feedback_comment']}_")
-                
-                # Niveau correct si différent
-                if entry.get('correct_level') and entry.get('correct_level') != gravity:
-                    st.markdown(f"**Niveau correct suggéré:** {entry['correct_level']}")
-                
-                # Date du feedback
-                if entry.get('feedback_timestamp'):
-                    try:
-                        fb_dt = datetime.fromisoformat(entry['feedback_timestamp'].replace('Z', '+00:00'))
-                        st.markdown(f"**Date du feedback:** {fb_dt.strftime('%d/%m/%Y %H:%M')}")
-                    except:
-                        pass
-                
-                # Afficher qui a donné le feedback si disponible
-                if entry.get('feedback_by'):
-                    st.markdown(f"**Par:** {entry['feedback_by']}")
+        # Afficher les détails du feedback
+        feedback_type = entry.get('feedback_type', 'correct')
+        st.markdown(f"**Type:** {FEEDBACK_TYPES.get(feedback_type, feedback_type)}")
+        
+        # Commentaire du feedback
+        if entry.get('feedback_comment'):
+            st.markdown(f"**Commentaire:** _{entry['feedback_comment']}_")
+        
+        # Niveau correct si différent
+        if entry.get('correct_level') and entry.get('correct_level') != gravity:
+            st.markdown(f"**Niveau correct suggéré:** {entry['correct_level']}")
+        
+        # Date du feedback
+        if entry.get('feedback_timestamp'):
+            try:
+                fb_dt = datetime.fromisoformat(entry['feedback_timestamp'].replace('Z', '+00:00'))
+                st.markdown(f"**Date du feedback:** {fb_dt.strftime('%d/%m/%Y %H:%M')}")
+            except:
+                pass
+        
+        # Afficher qui a donné le feedback si disponible
+        if entry.get('feedback_by'):
+            st.markdown(f"**Par:** {entry['feedback_by']}")
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_feedback_rates_frame(correct: float, upgrade: float, downgrade: float, disagree: float):
+    """DataFrame du graphique des types de feedback, reconstruit seulement si les taux changent."""
+    import pandas as pd
+
+    return pd.DataFrame({
+        'Type': ['Corrects', 'Sous-estimations', 'Sur-estimations', 'Désaccords'],
+        'Pourcentage': [correct, upgrade, downgrade, disagree]
+    }).set_index('Type')
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def build_gravity_stats_frame(by_gravity: Dict[str, Dict[str, int]]):
+    """
+    Tableau niveau x type de feedback à partir de `by_gravity_level`.
+
+    Le dict de dicts renvoyé par l'API est converti en une seule fois
+    (from_dict + reindex) au lieu d'un double parcours avec des .get().
+    """
+    import pandas as pd
 
+    frame = (
+        pd.DataFrame.from_dict(by_gravity, orient="index")
+        .reindex(index=GRAVITY_LEVELS, columns=list(GRAVITY_STAT_COLUMNS))
+        .fillna(0)
+        .astype(int)
+    )
+    frame = frame[frame["total"] > 0]
+    frame = frame.assign(
+        precision=(frame["correct"] / frame["total"] * 100).round().astype(int)
+    )
+    frame.insert(0, "niveau", [f"{get_triage_emoji(level)} {level}" for level in frame.index])
+    return frame.rename(columns={
+        "niveau": "Niveau",
+        **GRAVITY_STAT_COLUMNS,
+        "precision": "Précision (%)",
+    })
+
+
+@st.fragment
 def render_metrics() -> None:
     """Affiche les métriques de performance."""
     st.markdown("## Métriques de Performance")
 
-    # D'abord essayer les stats de l'historique
-    history_stats = get_history_stats()
-    feedback_stats = get_feedback_stats()
+    # Les 4 appels API sont indépendants : on les lance en parallèle
+    # (durée = appel le plus lent au lieu de la somme des latences)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        history_future = executor.submit(get_history_stats)
+        feedback_future = executor.submit(get_feedback_stats)
+        count_future = executor.submit(get_feedback_count)
+        model_future = executor.submit(get_latest_model_info)
+
+    history_stats = history_future.result()
+    feedback_stats = feedback_future.result()
 
     if history_stats:
         st.markdown("### Statistiques des Triages")
@@ -458,7 +619,7 @@ def render_metrics() -> None:
             )
 
         with col4:
-            feedback_count = get_feedback_count()
+            feedback_count = count_future.result()
             st.metric(
                 "Feedbacks pour Retraining",
                 feedback_count,
@@ -479,14 +640,7 @@ def render_metrics() -> None:
             disagree_rate = feedback_stats.get('disagree_rate', 0) * 100
             correct_rate = 100 - upgrade_rate - downgrade_rate - disagree_rate
 
-            import pandas as pd
-
-            feedback_data = pd.DataFrame({
-                'Type': ['Corrects', 'Sous-estimations', 'Sur-estimations', 'Désaccords'],
-                'Pourcentage': [correct_rate, upgrade_rate, downgrade_rate, disagree_rate]
-            })
-
-            st.bar_chart(feedback_data.set_index('Type'))
+            st.bar_chart(build_feedback_rates_frame(correct_rate, upgrade_rate, downgrade_rate, disagree_rate))
 
         with col2:
             # Détail par niveau de gravité
@@ -494,40 +648,32 @@ def render_metrics() -> None:
 
             by_gravity = feedback_stats.get('by_gravity_level', {})
 
-        for level in GRAVITY_LEVELS:
-            level_stats = by_gravity.get(level, {})
-            total = level_stats.get('total', 0)
-            correct = level_stats.get('correct', 0)
-
-            if total > 0:
-                rate = (correct / total) * 100
-                emoji = get_triage_emoji(level)
-                st.markdown(f"{emoji} **{level}**: {correct}/{total} corrects ({rate:.0f}%)")
+            # Un seul tableau (niveau x type de feedback) au lieu d'une ligne markdown par niveau
+            gravity_frame = build_gravity_stats_frame(by_gravity)
+            if not gravity_frame.empty:
+                st.dataframe(gravity_frame, hide_index=True, use_container_width=True)
+            else:
+                st.caption("Aucun feedback par niveau.")
 
     st.markdown("---")
 
     # Informations sur le modèle
     st.markdown("### Modèle Actuel")
 
-    try:
-        response = requests.get(f"{API_URL}/models/latest", timeout=5)
-        if response.status_code == 200:
-            model_info = response.json()
-
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                st.markdown(f"**Version:** {model_info.get('version', 'N/A')}")
-            with col2:
-                st.markdown(f"**Stage:** {model_info.get('stage', 'N/A')}")
-            with col3:
-                metrics = model_info.get('metrics', {})
-                accuracy = metrics.get('accuracy', 0) * 100
-                st.markdown(f"**Accuracy:** {accuracy:.1f}%")
-        else:
-            st.info("Informations du modèle non disponibles")
-    except:
-        st.info("Impossible de charger les informations du modèle")
+    model_info = model_future.result()
+    if model_info:
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.markdown(f"**Version:** {model_info.get('version', 'N/A')}")
+        with col2:
+            st.markdown(f"**Stage:** {model_info.get('stage', 'N/A')}")
+        with col3:
+            metrics = model_info.get('metrics', {})
+            accuracy = (metrics.get('accuracy') or 0) * 100
+            st.markdown(f"**Accuracy:** {accuracy:.1f}%")
+    else:
+        st.info("Informations du modèle non disponibles")
 
 
 def main() -> None:
@@ -535,7 +681,8 @@ def main() -> None:
     st.title("Feedback & Métriques")
     st.caption("Validez les triages et consultez les performances du système")
 
-    # Onglets
+    # Onglets : chaque rendu est un fragment, une interaction dans un onglet
+    # (formulaire, slider...) ne relance que cet onglet et pas les appels API des autres
     tab1, tab2, tab3 = st.tabs(["Nouveau Feedback", "Historique", "Métriques"])
 
     with tab1:
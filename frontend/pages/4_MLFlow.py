@@ -10,6 +10,7 @@ Cette page permet de:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -20,10 +21,12 @@ import streamlit as st
 # Configuration des chemins
 current_dir = Path(__file__).parent
 interface_dir = current_dir.parent
-sys.path.append(str(interface_dir))
+if str(interface_dir) not in sys.path:
+    sys.path.append(str(interface_dir))
 
 from state import init_session_state
-from style import  configure_page, apply_style, render_triage_badge, render_stage_badge, render_status_indicator
+from style import  configure_page, apply_style, render_stage_badge, render_status_indicator
+from api_client import get_api_health, get_http_session
 
 # IMPORTANT: configure_page DOIT être appelée EN PREMIER (avant tout autre appel Streamlit)
 configure_page(page_title="MLFlow - MedTriage-AI")
@@ -33,16 +36,33 @@ apply_style()
 # Configuration API
 API_URL = os.getenv("API_URL", "http://backend:8000")
 
+# Session HTTP partagée (keep-alive), utilisable depuis les threads de préchargement
+HTTP_SESSION = get_http_session()
+
 # Seuils
 MIN_FEEDBACK_FOR_RETRAIN = 3
 
+# Durée de vie du cache des lectures API (s)
+API_CACHE_TTL = 30
+
+
+@st.cache_data(ttl=API_CACHE_TTL, show_spinner=False)
+def cached_get_json(path: str, params: Optional[tuple] = None, timeout: int = 10) -> Any:
+    """
+    GET JSON mis en cache entre les reruns.
+
+    Les erreurs HTTP sont levées (donc jamais mises en cache) ;
+    le cache est vidé après une promotion ou un retraining.
+    """
+    response = HTTP_SESSION.get(f"{API_URL}{path}", params=dict(params) if params else None, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
 
 def get_models_list() -> Dict:
     """Récupère la liste des modèles depuis MLFlow."""
     try:
-        response = requests.get(f"{API_URL}/models/list", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json("/models/list")
     except requests.RequestException:
         pass
     return {"versions": [], "total_versions": 0}
@@ -51,9 +71,7 @@ def get_models_list() -> Dict:
 def get_latest_model() -> Optional[Dict]:
     """Récupère le modèle en production."""
     try:
-        response = requests.get(f"{API_URL}/models/latest", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json("/models/latest")
     except requests.RequestException:
         pass
     return None
@@ -62,9 +80,7 @@ def get_latest_model() -> Optional[Dict]:
 def get_model_version(version: int) -> Optional[Dict]:
     """Récupère les détails d'une version spécifique."""
     try:
-        response = requests.get(f"{API_URL}/models/version/{version}", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json(f"/models/version/{version}")
     except requests.RequestException:
         pass
     return None
@@ -73,9 +89,7 @@ def get_model_version(version: int) -> Optional[Dict]:
 def get_experiments() -> List[Dict]:
     """Récupère la liste des expériences MLFlow."""
     try:
-        response = requests.get(f"{API_URL}/models/experiments", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json("/models/experiments")
     except requests.RequestException:
         pass
     return []
@@ -88,9 +102,7 @@ def get_training_runs(experiment_name: str = None, limit: int = 10) -> Dict:
         if experiment_name:
             params["experiment_name"] = experiment_name
 
-        response = requests.get(f"{API_URL}/models/runs", params=params, timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json("/models/runs", tuple(sorted(params.items())))
     except requests.RequestException:
         pass
     return {"runs": []}
@@ -99,9 +111,7 @@ def get_training_runs(experiment_name: str = None, limit: int = 10) -> Dict:
 def get_feedback_count() -> int:
     """Récupère le nombre de feedbacks disponibles."""
     try:
-        response = requests.get(f"{API_URL}/feedback/count", timeout=5)
-        if response.status_code == 200:
-            return response.json().get("count", 0)
+        return cached_get_json("/feedback/count", timeout=5).get("count", 0)
     except requests.RequestException:
         pass
     return 0
@@ -110,9 +120,7 @@ def get_feedback_count() -> int:
 def get_feedback_stats() -> Optional[Dict]:
     """Récupère les statistiques de feedback."""
     try:
-        response = requests.get(f"{API_URL}/feedback/stats", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return cached_get_json("/feedback/stats")
     except requests.RequestException:
         pass
     return None
@@ -121,12 +129,14 @@ def get_feedback_stats() -> Optional[Dict]:
 def trigger_retrain() -> Optional[Dict]:
     """Lance le retraining du modèle."""
     try:
-        response = requests.post(
+        response = HTTP_SESSION.post(
             f"{API_URL}/feedback/retrain",
             json={"include_feedback": True, "min_feedback_samples": MIN_FEEDBACK_FOR_RETRAIN},
             timeout=300  # 5 minutes max
         )
         if response.status_code == 200:
+            # Nouvelle version et runs : les lectures en cache sont périmées
+            cached_get_json.clear()
             return response.json()
     except requests.RequestException as e:
         return {"status": "error", "message": str(e)}
@@ -136,16 +146,34 @@ def trigger_retrain() -> Optional[Dict]:
 def promote_model(version: int, stage: str) -> bool:
     """Promeut un modèle vers un stage."""
     try:
-        response = requests.post(
+        response = HTTP_SESSION.post(
             f"{API_URL}/models/promote/{version}",
             params={"stage": stage},
             timeout=30
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            cached_get_json.clear()
+            return True
+        return False
     except requests.RequestException:
         return False
 
 
+def prefetch_api_data() -> None:
+    """
+    Précharge en parallèle les lectures indépendantes utilisées par les onglets.
+
+    Les réponses alimentent le cache de cached_get_json : les fonctions de rendu
+    les relisent ensuite sans attendre un aller-retour réseau chacune.
+    """
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        executor.submit(get_latest_model)
+        executor.submit(get_models_list)
+        executor.submit(get_feedback_count)
+        executor.submit(get_feedback_stats)
+        executor.submit(get_training_runs, limit=10)
+
+
 def render_current_model() -> None:
     """Affiche les informations du modèle actuel."""
     st.markdown("## Modèle en Production")
@@ -212,8 +240,24 @@ def render_current_model() -> None:
                 st.write(f"- {key}: {value}")
 
 
+def format_created_at(created: Any) -> str:
+    """Formate la date de création MLFlow (ISO ou timestamp en ms)."""
+    try:
+        if not created:
+            return "N/A"
+        if isinstance(created, str):
+            dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
+        else:
+            dt = datetime.fromtimestamp(created / 1000)
+        return dt.strftime("%d/%m/%Y %H:%M")
+    except (TypeError, ValueError, OSError):
+        return str(created)[:19]
+
+
 def render_models_list() -> None:
     """Affiche la liste des modèles enregistrés."""
+    import pandas as pd
+
     st.markdown("## Versions de Modèles")
 
     models_data = get_models_list()
@@ -226,62 +270,64 @@ def render_models_list() -> None:
     # Trier par version décroissante
     models_sorted = sorted(versions, key=lambda x: x.get('version', 0), reverse=True)
 
+    # Un seul tableau pour tout le catalogue au lieu d'un expander par version
+    rows = []
     for model in models_sorted:
-        version = model.get('version', 'N/A')
-        stage = model.get('stage', 'None')
         metrics = model.get('metrics') or {}
-        accuracy = (metrics.get('accuracy') or 0) * 100
-        created = model.get('created_at', '')
-
-        # Parser la date
-        try:
-            if created:
-                if isinstance(created, str):
-                    dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                else:
-                    dt = datetime.fromtimestamp(created / 1000)
-                created_display = dt.strftime("%d/%m/%Y %H:%M")
-            else:
-                created_display = "N/A"
-        except:
-            created_display = str(created)[:19] if created else "N/A"
+        rows.append({
+            "Version": model.get('version', 'N/A'),
+            "Stage": model.get('stage', 'None'),
+            "Accuracy (%)": round((metrics.get('accuracy') or 0) * 100, 1),
+            "F1 (%)": round((metrics.get('f1_macro') or 0) * 100, 1),
+            "Créé le": format_created_at(model.get('created_at', '')),
+        })
+    st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+    # Détails et actions uniquement pour la version sélectionnée
+    models_by_version = {model.get('version', 'N/A'): model for model in models_sorted}
+    selected_version = st.selectbox(
+        "Détails du modèle",
+        list(models_by_version),
+        format_func=lambda v: f"Version {v}",
+    )
+    model = models_by_version[selected_version]
+    version = selected_version
+    stage = model.get('stage', 'None')
+    metrics = model.get('metrics') or {}
+    accuracy = (metrics.get('accuracy') or 0) * 100
+    stage_emoji = "🟢" if stage == "Production" else "🟡" if stage == "Staging" else "⚪"
+
+    with st.expander(f"{stage_emoji} Version {version} - {stage} (Accuracy: {accuracy:.1f}%)", expanded=True):
+        col1, col2, col3 = st.columns(3)
 
-        # Couleur selon le stage
-        stage_color = "#28a745" if stage == "Production" else "#ffc107" if stage == "Staging" else "#6c757d"
-        stage_emoji = "🟢" if stage == "Production" else "🟡" if stage == "Staging" else "⚪"
+        with col1:
+            st.markdown(f"**Créé le:** {format_created_at(model.get('created_at', ''))}")
+            st.markdown(f"**Stage:** {stage}")
 
-        with st.expander(f"{stage_emoji} Version {version} - {stage} (Accuracy: {accuracy:.1f}%)"):
-            col1, col2, col3 = st.columns(3)
+        with col2:
+            st.markdown("**Métriques:**")
+            f1 = (metrics.get('f1_macro') or 0) * 100
+            st.markdown(f"- Accuracy: {accuracy:.1f}%\n- F1: {f1:.1f}%")
 
-            with col1:
-                st.markdown(f"**Créé le:** {created_display}")
-                st.markdown(f"**Stage:** {stage}")
+        with col3:
+            # Boutons de promotion
+            st.markdown("**Actions:**")
+
+            if stage != "Production":
+                if st.button("Promouvoir en Production", key=f"prod_{version}"):
+                    if promote_model(version, "Production"):
+                        st.success(f"Version {version} promue en Production !")
+                        st.rerun()
+                    else:
+                        st.error("Erreur lors de la promotion")
 
-            with col2:
-                st.markdown("**Métriques:**")
-                st.write(f"- Accuracy: {accuracy:.1f}%")
-                f1 = (metrics.get('f1_macro') or 0) * 100
-                st.write(f"- F1: {f1:.1f}%")
-
-            with col3:
-                # Boutons de promotion
-                st.markdown("**Actions:**")
-
-                if stage != "Production":
-                    if st.button("Promouvoir en Production", key=f"prod_{version}"):
-                        if promote_model(version, "Production"):
-                            st.success(f"Version {version} promue en Production !")
-                            st.rerun()
-                        else:
-                            st.error("Erreur lors de la promotion")
-
-                if stage != "Staging" and stage != "Production":
-                    if st.button("Mettre en Staging", key=f"staging_{version}"):
-                        if promote_model(version, "Staging"):
-                            st.success(f"Version {version} mise en Staging !")
-                            st.rerun()
-                        else:
-                            st.error("Erreur lors de la promotion")
+            if stage != "Staging" and stage != "Production":
+                if st.button("Mettre en Staging", key=f"staging_{version}"):
+                    if promote_model(version, "Staging"):
+                        st.success(f"Version {version} mise en Staging !")
+                        st.rerun()
+                    else:
+                        st.error("Erreur lors de la promotion")
 
 
 def render_feedback_summary() -> None:
@@ -461,14 +507,15 @@ def main() -> None:
     st.caption("Gérez les versions de modèles et lancez le retraining")
 
     # Vérifier la connexion à l'API
-    try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
-        if response.status_code != 200:
-            st.error("API Backend non disponible")
-            return
-    except:
+    health = get_api_health(API_URL)
+    if health is None:
         st.error("Impossible de se connecter à l'API Backend")
         return
+    if not health:
+        st.error("API Backend non disponible")
+        return
+
+    prefetch_api_data()
 
     # Onglets
     tab1, tab2, tab3, tab4 = st.tabs([
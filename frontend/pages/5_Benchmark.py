@@ -8,20 +8,22 @@ le modèle le plus sobre énergétiquement tout en restant performant.
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 import streamlit as st
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Configuration des chemins pour importer depuis le parent
 current_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(current_dir))
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
 
 from state import init_session_state
 from style import configure_page, apply_style
+from api_client import api_timeout, get_http_session, parse_json
+from components import TRIAGE_COLORS
 
 # Initialisation
 configure_page(page_title="Benchmark - MedTriage-AI", page_icon="🌱")
@@ -31,6 +33,13 @@ apply_style()
 # Configuration API
 API_URL = os.getenv("API_URL", "http://backend:8000")
 
+# Nombre max d'appels de benchmark simultanés vers le backend
+BENCH_CONCURRENCY = max(1, int(os.getenv("BENCH_CONCURRENCY", "4")))
+
+# Nombre d'échecs de connexion consécutifs avant d'interrompre le benchmark
+# (chaque appel est déjà rejoué avec backoff par la session partagée)
+BENCH_MAX_CONNECTION_ERRORS = 2
+
 # Configuration des modèles (4 tailles) - Prix officiels Mistral AI 2025
 # Source : https://mistral.ai/pricing
 MODELES_MISTRAL = {
@@ -133,12 +142,11 @@ ENERGY_LABELS = {
     "E": {"color": "#EF4444", "description": "Très élevé"}
 }
 
-# Couleurs des niveaux de triage
-TRIAGE_COLORS = {
-    "ROUGE": "#DC2626",
-    "JAUNE": "#F59E0B",
-    "VERT": "#10B981",
-    "GRIS": "#6B7280"
+# Seuils des labels énergétiques (Wh) par cas d'usage
+ENERGY_THRESHOLDS = {
+    "extraction": {"A": 0.5, "B": 1.0, "C": 2.0, "D": 5.0},
+    "agent": {"A": 1.0, "B": 2.0, "C": 5.0, "D": 10.0},
+    "simulation": {"A": 0.3, "B": 0.8, "C": 1.5, "D": 3.0}
 }
 
 # Ordre d'affichage des modèles (du plus petit au plus grand)
@@ -165,8 +173,7 @@ def init_benchmark_state():
         "benchmark_results": {},
         "selected_models_extraction": ["ministral-3b-latest", "mistral-small-latest"],
         "selected_models_agent": ["ministral-3b-latest", "mistral-small-latest"],
-        "selected_models_simulation": ["ministral-3b-latest", "mistral-small-latest"],
-        "conversations_cache": None
+        "selected_models_simulation": ["ministral-3b-latest", "mistral-small-latest"]
     }
     for key, value in defaults.items():
         if key not in st.session_state:
@@ -181,39 +188,41 @@ def reset_benchmark_state():
     st.session_state.selected_models_simulation = ["ministral-3b-latest", "mistral-small-latest"]
 
 
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_conversations() -> List[Dict]:
+    """Liste des conversations (partagée entre sessions, les erreurs ne sont pas mises en cache)."""
+    response = get_http_session().get(f"{API_URL}/conversation/list", timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_conversation_content(filename: str) -> Dict:
+    """Contenu d'une conversation de test (fichiers statiques côté backend)."""
+    response = get_http_session().get(f"{API_URL}/conversation/load/{filename}", timeout=10)
+    response.raise_for_status()
+    return parse_json(response)
+
+
 def load_conversations() -> List[Dict]:
     """Charge la liste des conversations depuis l'API."""
-    if st.session_state.conversations_cache:
-        return st.session_state.conversations_cache
     try:
-        response = requests.get(f"{API_URL}/conversation/list", timeout=10)
-        if response.status_code == 200:
-            st.session_state.conversations_cache = response.json()
-            return st.session_state.conversations_cache
+        return fetch_conversations()
     except requests.RequestException:
-        pass
-    return []
+        return []
 
 
 def load_conversation_content(filename: str) -> Optional[Dict]:
     """Charge le contenu d'une conversation."""
     try:
-        response = requests.get(f"{API_URL}/conversation/load/{filename}", timeout=10)
-        if response.status_code == 200:
-            return response.json()
+        return fetch_conversation_content(filename)
     except requests.RequestException:
-        pass
-    return None
+        return None
 
 
 def calculate_energy_label(energy_wh: float, use_case: str) -> str:
     """Calcule le label énergétique (A-E)."""
-    thresholds = {
-        "extraction": {"A": 0.5, "B": 1.0, "C": 2.0, "D": 5.0},
-        "agent": {"A": 1.0, "B": 2.0, "C": 5.0, "D": 10.0},
-        "simulation": {"A": 0.3, "B": 0.8, "C": 1.5, "D": 3.0}
-    }
-    t = thresholds.get(use_case, thresholds["extraction"])
+    t = ENERGY_THRESHOLDS.get(use_case, ENERGY_THRESHOLDS["extraction"])
 
     if energy_wh <= t["A"]:
         return "A"
@@ -226,23 +235,56 @@ def calculate_energy_label(energy_wh: float, use_case: str) -> str:
     return "E"
 
 
-def call_benchmark_api(endpoint: str, payload: Dict) -> Optional[Dict]:
-    """Appelle l'API de benchmark."""
+def call_benchmark_api(endpoint: str, payload: Union[Dict, bytes], session: Optional[requests.Session] = None) -> Optional[Dict]:
+    """
+    Appelle l'API de benchmark (session passée explicitement depuis les threads).
+
+    Le payload peut être un dict ou un corps JSON déjà sérialisé (bytes).
+    """
+    session = session or get_http_session()
     try:
-        response = requests.post(f"{API_URL}/benchmark/{endpoint}", json=payload, timeout=120)
+        if isinstance(payload, bytes):
+            response = session.post(
+                f"{API_URL}/benchmark/{endpoint}",
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=api_timeout(120)
+            )
+        else:
+            response = session.post(f"{API_URL}/benchmark/{endpoint}", json=payload, timeout=api_timeout(120))
         if response.status_code == 200:
-            return response.json()
+            return parse_json(response)
+    except requests.ConnectionError:
+        # Backend injoignable malgré les tentatives de la session
+        return {"success": False, "unreachable": True, "error": "API injoignable"}
     except requests.RequestException:
         pass
     return None
 
 
+def parse_raw_response(raw: Any) -> Any:
+    """Décode une réponse JSON textuelle ; renvoie la valeur telle quelle sinon."""
+    if isinstance(raw, str):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw
+    return raw
+
+
 def process_result(result: Dict, model: str, use_case: str) -> Dict:
-    """Traite le résultat d'un benchmark."""
+    """
+    Traite le résultat d'un benchmark.
+
+    Seuls les champs affichés sont conservés dans session_state, et les
+    réponses JSON (extraction, agent) y sont stockées déjà décodées pour ne
+    pas être re-parsées à chaque rerun.
+    """
     if result and result.get("success"):
         metrics = result.get("metrics", {})
         energy_wh = (metrics.get("energy_kwh", 0) or 0) * 1000
         co2_g = (metrics.get("gwp_kgco2", 0) or 0) * 1000
+        raw = result.get("response") or result.get("analysis") or result.get("extracted_data")
 
         return {
             "model_key": model,
@@ -254,10 +296,7 @@ def process_result(result: Dict, model: str, use_case: str) -> Dict:
             "co2_g": co2_g,
             "energy_wh": energy_wh,
             "energy_label": calculate_energy_label(energy_wh, use_case),
-            "total_tokens": metrics.get("total_tokens", 0),
-            "input_tokens": metrics.get("input_tokens", 0),
-            "output_tokens": metrics.get("output_tokens", 0),
-            "raw_response": result.get("response") or result.get("analysis") or result.get("extracted_data"),
+            "raw_response": raw if use_case == "simulation" else parse_raw_response(raw),
             "google_equiv": co2_g / 0.2 if co2_g > 0 else 0,
             "bulb_minutes": energy_wh
         }
@@ -270,6 +309,16 @@ def process_result(result: Dict, model: str, use_case: str) -> Dict:
     }
 
 
+def toggle_model(key: str, model_key: str):
+    """Ajoute ou retire un modèle de la sélection."""
+    selected = st.session_state.get(f"selected_models_{key}", [])
+    if model_key in selected:
+        selected.remove(model_key)
+    else:
+        selected.append(model_key)
+    st.session_state[f"selected_models_{key}"] = selected
+
+
 def render_model_selector(key: str) -> List[str]:
     """Affiche le sélecteur de modèles avec des boutons toggle."""
     st.markdown("#### Modèles à comparer")
@@ -281,18 +330,15 @@ def render_model_selector(key: str) -> List[str]:
         with cols[idx]:
             is_selected = model_key in selected
 
-            if st.button(
+            # Callback exécuté avant le rerun du clic : pas de st.rerun() supplémentaire
+            st.button(
                 f"{model_info['icon']} {model_info['display_name']}",
                 key=f"btn_{key}_{model_key}",
                 type="primary" if is_selected else "secondary",
-                use_container_width=True
-            ):
-                if is_selected:
-                    selected.remove(model_key)
-                else:
-                    selected.append(model_key)
-                st.session_state[f"selected_models_{key}"] = selected
-                st.rerun()
+                use_container_width=True,
+                on_click=toggle_model,
+                args=(key, model_key)
+            )
 
             st.caption(f"{model_info['description']}")
             st.caption(f"${model_info['input_price']}/M in · ${model_info['output_price']}/M out")
@@ -300,24 +346,43 @@ def render_model_selector(key: str) -> List[str]:
     return selected
 
 
-def render_comparison_chart(results: Dict):
-    """Affiche le graphique comparatif avec tooltips informatifs."""
-    # Tri par taille de modèle : Mini > Small > Medium > Large
-    valid = sort_results_by_model_size({k: v for k, v in results.items() if v.get("success")})
-    if len(valid) < 2:
-        return
+def get_valid_results(results: Dict) -> Dict:
+    """Résultats réussis, triés par taille de modèle : Mini > Small > Medium > Large."""
+    return sort_results_by_model_size({k: v for k, v in results.items() if v.get("success")})
 
-    models = [v["model_name"] for v in valid.values()]
-    colors = ["#10B981", "#3B82F6", "#F59E0B", "#EF4444"][:len(models)]
 
-    # Données pour tooltips enrichis
-    energy_vals = [v["energy_wh"] for v in valid.values()]
-    co2_vals = [v["co2_g"] for v in valid.values()]
-    cost_vals = [v["cost_usd"] for v in valid.values()]
+# Colonnes de la vue comparative (badge du gagnant et graphique)
+COMPARISON_COLUMNS = ("model_name", "energy_wh", "co2_g", "cost_usd", "google_equiv", "bulb_minutes")
+
+
+def get_comparison_columns(valid: Dict) -> Dict[str, List]:
+    """
+    Vue en colonnes des résultats valides : une liste par métrique.
+
+    Construite une seule fois par rendu puis partagée entre le badge et le graphique.
+    """
+    if not valid:
+        return {name: [] for name in COMPARISON_COLUMNS}
+    rows = zip(*([v[name] for name in COMPARISON_COLUMNS] for v in valid.values()))
+    return {name: list(column) for name, column in zip(COMPARISON_COLUMNS, rows)}
 
-    # Calcul des équivalences pour tooltips
-    google_equivs = [v["google_equiv"] for v in valid.values()]
-    bulb_mins = [v["bulb_minutes"] for v in valid.values()]
+
+def render_comparison_chart(columns: Dict[str, List]):
+    """Affiche le graphique comparatif avec tooltips informatifs (colonnes des résultats valides)."""
+    models = columns["model_name"]
+    if len(models) < 2:
+        return
+
+    # Import différé : plotly n'est chargé qu'une fois des résultats à comparer
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    energy_vals = columns["energy_wh"]
+    co2_vals = columns["co2_g"]
+    cost_vals = columns["cost_usd"]
+    google_equivs = columns["google_equiv"]
+    bulb_mins = columns["bulb_minutes"]
+    colors = ["#10B981", "#3B82F6", "#F59E0B", "#EF4444"][:len(models)]
 
     fig = make_subplots(
         rows=1, cols=3,
@@ -373,47 +438,109 @@ def render_comparison_chart(results: Dict):
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_winner_badge(results: Dict):
-    """Affiche le gagnant du benchmark."""
-    valid = {k: v for k, v in results.items() if v.get("success")}
-    if len(valid) < 2:
+def render_winner_badge(columns: Dict[str, List]):
+    """Affiche le gagnant du benchmark (parmi les résultats valides)."""
+    energy = columns["energy_wh"]
+    if len(energy) < 2:
         return
 
-    winner = min(valid.items(), key=lambda x: x[1]["energy_wh"])
+    winner = min(range(len(energy)), key=energy.__getitem__)
+
+    st.success(f"**{columns['model_name'][winner]}** est le plus sobre avec "
+               f"**{energy[winner]:.2f} Wh** et **{columns['co2_g'][winner]:.3f} g CO₂**")
 
-    st.success(f"**{winner[1]['model_name']}** est le plus sobre avec "
-               f"**{winner[1]['energy_wh']:.2f} Wh** et **{winner[1]['co2_g']:.3f} g CO₂**")
+
+def encode_payload(payload: Dict) -> bytes:
+    """Encode un payload de benchmark en JSON."""
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def build_model_bodies(payload: Union[Dict, bytes], models: List[str]) -> Dict[str, bytes]:
+    """
+    Corps JSON de chaque modèle à partir d'un payload commun (dict ou déjà encodé).
+
+    La partie commune (conversation, persona...) n'est encodée qu'une fois ;
+    seul le champ "model" est ajouté à la fin de chaque corps.
+    """
+    shared = payload if isinstance(payload, bytes) else encode_payload(payload)
+    prefix = shared[:-1] + (b'"model":' if shared == b"{}" else b',"model":')
+    return {model: prefix + json.dumps(model).encode("utf-8") + b"}" for model in models}
+
+
+# Corps communs des cas de simulation (données statiques) : encodés une fois à l'import
+SIMULATION_BODIES = {
+    (case_key, question): encode_payload({"persona": case["persona"], "history": [], "nurse_message": question})
+    for case_key, case in SIMULATION_CASES.items()
+    for question in case["questions"]
+}
+
+
+def run_models_in_parallel(endpoint: str, payload: Union[Dict, bytes], models: List[str], use_case: str, progress) -> Dict:
+    """
+    Appelle l'API de benchmark pour tous les modèles en parallèle.
+
+    Les appels LLM étant limités par le réseau, un thread par modèle ramène
+    la durée totale à celle du modèle le plus lent au lieu de la somme.
+    Le nombre d'appels simultanés est borné par BENCH_CONCURRENCY pour ne pas
+    saturer les workers du backend. La barre de progression est mise à jour
+    depuis le thread principal.
+    """
+    raw_results = {}
+    progress.progress(0.0, f"Test de {len(models)} modèles en parallèle...")
+
+    # Corps JSON sérialisés avant le lancement : les workers ne font que de l'I/O
+    bodies = build_model_bodies(payload, models)
+
+    # Session récupérée dans le thread Streamlit puis partagée avec les workers
+    session = get_http_session()
+    workers = max(1, min(len(models), BENCH_CONCURRENCY))
+    # Pool géré hors d'un bloc with : en cas de coupure, on n'attend pas les appels en cours
+    executor = ThreadPoolExecutor(max_workers=workers)
+    interrupted = False
+    try:
+        futures = {
+            executor.submit(call_benchmark_api, endpoint, body, session): model
+            for model, body in bodies.items()
+        }
+        consecutive_errors = 0
+        for done, future in enumerate(as_completed(futures), start=1):
+            model = futures[future]
+            raw_results[model] = future.result()
+            progress.progress(done / len(futures), f"{MODELES_MISTRAL[model]['display_name']} terminé")
+
+            # Coupe-circuit : inutile d'attendre les autres modèles si l'API est tombée
+            if raw_results[model] and raw_results[model].get("unreachable"):
+                consecutive_errors += 1
+                if consecutive_errors >= BENCH_MAX_CONNECTION_ERRORS:
+                    interrupted = True
+                    st.error("API injoignable, benchmark interrompu.")
+                    break
+            else:
+                consecutive_errors = 0
+    finally:
+        # Interruption : appels en attente annulés, appels en cours abandonnés (résultats ignorés)
+        executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
+
+    for model in models:
+        raw_results.setdefault(model, {"success": False, "error": "Benchmark interrompu (API injoignable)"})
+
+    # Ordre des résultats identique à l'ordre de sélection
+    return {model: process_result(raw_results[model], model, use_case) for model in models}
 
 
 def run_extraction_benchmark(models: List[str], text: str, progress) -> Dict:
     """Exécute le benchmark d'extraction."""
-    results = {}
-    for idx, model in enumerate(models):
-        progress.progress((idx + 1) / len(models), f"Test de {MODELES_MISTRAL[model]['display_name']}...")
-        result = call_benchmark_api("extraction", {"text": text, "model": model})
-        results[model] = process_result(result, model, "extraction")
-    return results
+    return run_models_in_parallel("extraction", {"text": text}, models, "extraction", progress)
 
 
 def run_agent_benchmark(models: List[str], conversation: Dict, progress) -> Dict:
     """Exécute le benchmark de l'agent."""
-    results = {}
-    for idx, model in enumerate(models):
-        progress.progress((idx + 1) / len(models), f"Test de {MODELES_MISTRAL[model]['display_name']}...")
-        result = call_benchmark_api("agent", {"conversation": conversation, "model": model})
-        results[model] = process_result(result, model, "agent")
-    return results
+    return run_models_in_parallel("agent", {"conversation": conversation}, models, "agent", progress)
 
 
-def run_simulation_benchmark(models: List[str], case: Dict, nurse_message: str, progress) -> Dict:
-    """Exécute le benchmark de simulation."""
-    results = {}
-    for idx, model in enumerate(models):
-        progress.progress((idx + 1) / len(models), f"Test de {MODELES_MISTRAL[model]['display_name']}...")
-        payload = {"persona": case["persona"], "history": [], "nurse_message": nurse_message, "model": model}
-        result = call_benchmark_api("simulation", payload)
-        results[model] = process_result(result, model, "simulation")
-    return results
+def run_simulation_benchmark(models: List[str], case_key: str, nurse_message: str, progress) -> Dict:
+    """Exécute le benchmark de simulation (corps commun pré-encodé à l'import)."""
+    return run_models_in_parallel("simulation", SIMULATION_BODIES[(case_key, nurse_message)], models, "simulation", progress)
 
 
 def render_compact_metrics(data: Dict):
@@ -444,12 +571,14 @@ def render_extraction_results(results: Dict):
     st.markdown("---")
     st.subheader("Résultats du Benchmark")
 
-    render_winner_badge(results)
-    render_comparison_chart(results)
+    # Filtrage et tri faits une seule fois pour le badge, le graphique et les colonnes
+    valid_results = get_valid_results(results)
+    columns = get_comparison_columns(valid_results)
+    render_winner_badge(columns)
+    render_comparison_chart(columns)
 
     st.markdown("### Analyse par modèle")
 
-    valid_results = sort_results_by_model_size({k: v for k, v in results.items() if v.get("success")})
     cols = st.columns(len(valid_results))
 
     for col_idx, (_, data) in enumerate(valid_results.items()):
@@ -460,13 +589,9 @@ def render_extraction_results(results: Dict):
                 st.markdown("**Données extraites :**")
                 raw = data.get("raw_response")
                 if raw:
-                    try:
-                        if isinstance(raw, str):
-                            parsed = json.loads(raw)
-                        else:
-                            parsed = raw
-                        st.json(parsed)
-                    except (json.JSONDecodeError, TypeError):
+                    if isinstance(raw, (dict, list)):
+                        st.json(raw)
+                    else:
                         st.code(str(raw), language="json")
                 else:
                     st.info("Aucune donnée")
@@ -477,12 +602,14 @@ def render_agent_results(results: Dict):
     st.markdown("---")
     st.subheader("Résultats du Benchmark")
 
-    render_winner_badge(results)
-    render_comparison_chart(results)
+    # Filtrage et tri faits une seule fois pour le badge, le graphique et les colonnes
+    valid_results = get_valid_results(results)
+    columns = get_comparison_columns(valid_results)
+    render_winner_badge(columns)
+    render_comparison_chart(columns)
 
     st.markdown("### Analyse par modèle")
 
-    valid_results = sort_results_by_model_size({k: v for k, v in results.items() if v.get("success")})
     cols = st.columns(len(valid_results))
 
     for col_idx, (_, data) in enumerate(valid_results.items()):
@@ -492,14 +619,9 @@ def render_agent_results(results: Dict):
 
                 raw = data.get("raw_response")
                 if raw:
-                    try:
-                        if isinstance(raw, str):
-                            parsed = json.loads(raw)
-                        else:
-                            parsed = raw
-
+                    if isinstance(raw, dict):
                         # Niveau de criticité
-                        criticity = parsed.get("criticity", parsed.get("gravity_level", ""))
+                        criticity = raw.get("criticity", raw.get("gravity_level", ""))
                         if criticity:
                             color = TRIAGE_COLORS.get(criticity.upper(), "#6B7280")
                             st.markdown(f"""
@@ -512,11 +634,11 @@ def render_agent_results(results: Dict):
                             """, unsafe_allow_html=True)
 
                         # Justification
-                        if parsed.get("justification"):
-                            st.markdown(f"**Justification :** {parsed['justification']}")
+                        if raw.get("justification"):
+                            st.markdown(f"**Justification :** {raw['justification']}")
 
                         # Bloc uniforme pour Infos manquantes
-                        missing = parsed.get("missing_info", [])
+                        missing = raw.get("missing_info", [])
                         if missing:
                             missing_list = "".join([f"<li>{m}</li>" for m in missing])
                             st.markdown(f"""
@@ -530,18 +652,18 @@ def render_agent_results(results: Dict):
                             """, unsafe_allow_html=True)
 
                         # Bloc uniforme pour Alerte protocole
-                        if parsed.get("protocol_alert"):
+                        if raw.get("protocol_alert"):
                             st.markdown(f"""
                                 <div style="
                                     background: #FEE2E2; border-left: 4px solid #DC2626;
                                     padding: 12px; border-radius: 4px; margin: 10px 0;
                                 ">
                                     <strong style="color: #DC2626;">🚨 Alerte protocole :</strong><br>
-                                    {parsed['protocol_alert']}
+                                    {raw['protocol_alert']}
                                 </div>
                             """, unsafe_allow_html=True)
 
-                    except (json.JSONDecodeError, TypeError):
+                    else:
                         st.code(str(raw))
                 else:
                     st.info("Aucune analyse")
@@ -552,13 +674,15 @@ def render_simulation_results(results: Dict, nurse_message: str):
     st.markdown("---")
     st.subheader("Résultats du Benchmark")
 
-    render_winner_badge(results)
-    render_comparison_chart(results)
+    # Filtrage et tri faits une seule fois pour le badge, le graphique et les colonnes
+    valid_results = get_valid_results(results)
+    columns = get_comparison_columns(valid_results)
+    render_winner_badge(columns)
+    render_comparison_chart(columns)
 
     st.markdown("### Réponses des patients simulés")
     st.info(f"**Question de l'infirmier :** {nurse_message}")
 
-    valid_results = sort_results_by_model_size({k: v for k, v in results.items() if v.get("success")})
     cols = st.columns(len(valid_results))
 
     for col_idx, (_, data) in enumerate(valid_results.items()):
@@ -597,9 +721,7 @@ def main():
     # Bouton Réinitialiser en haut à droite
     col_spacer, col_reset = st.columns([5, 1])
     with col_reset:
-        if st.button("🔄 Réinitialiser", type="secondary", use_container_width=True):
-            reset_benchmark_state()
-            st.rerun()
+        st.button("🔄 Réinitialiser", type="secondary", use_container_width=True, on_click=reset_benchmark_state)
 
     tab1, tab2, tab3 = st.tabs(["📋 Extraction", "🤖 Agent Triage", "💬 Simulation"])
 
@@ -645,7 +767,6 @@ def main():
                         results = run_extraction_benchmark(selected_models, full_text, progress)
                         progress.empty()
                         st.session_state.benchmark_results["extraction"] = results
-                        st.rerun()
 
             if btn_disabled:
                 st.info("Sélectionnez au moins 2 modèles pour comparer")
@@ -691,7 +812,6 @@ def main():
                         results = run_agent_benchmark(selected_models, conv_data, progress)
                         progress.empty()
                         st.session_state.benchmark_results["agent"] = results
-                        st.rerun()
 
             if btn_disabled:
                 st.info("Sélectionnez au moins 2 modèles pour comparer")
@@ -739,11 +859,10 @@ def main():
                 key="run_simulation"
             ):
                 progress = st.empty()
-                results = run_simulation_benchmark(selected_models, sim_case, selected_question, progress)
+                results = run_simulation_benchmark(selected_models, selected_sim, selected_question, progress)
                 progress.empty()
                 st.session_state.benchmark_results["simulation"] = results
                 st.session_state.benchmark_results["simulation_question"] = selected_question
-                st.rerun()
 
         if btn_disabled:
             st.info("Sélectionnez au moins 2 modèles pour comparer")
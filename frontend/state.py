@@ -1,45 +1,49 @@
 import streamlit as st
 
-def init_session_state():
-    """Initialise les session states globaux."""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-
-    if "categorie" not in st.session_state:
-        st.session_state.categorie = ""
-        
-    if "triage_color" not in st.session_state:
-        st.session_state.triage_color = None 
-
-    if "edit_mode" not in st.session_state:
-        st.session_state.edit_mode = False
-
-    if "triage_history" not in st.session_state:
-        st.session_state.triage_history = []
-
-    if "metrics_history" not in st.session_state:
-        st.session_state.metrics_history = []
 
+def _current_interactive_session_metrics() -> dict:
+    """Métriques de départ d'une session interactive (nouveau dict à chaque session)."""
+    return {
+        'cost_usd': 0,
+        'gwp_kgco2': 0,
+        'energy_kwh': 0,
+        'nb_calls': 0
+    }
+
+
+# Valeurs initiales des session states globaux : clé -> fabrique de la valeur
+# (une fabrique plutôt qu'une valeur pour ne jamais partager une liste/un dict entre sessions)
+SESSION_DEFAULTS = {
+    "messages": list,
+    "categorie": str,
+    "triage_color": lambda: None,
+    "edit_mode": lambda: False,
+    "triage_history": list,
+    "metrics_history": list,
     # Dernière requête (toutes sources confondues)
-    if "last_request_metrics" not in st.session_state:
-        st.session_state.last_request_metrics = None
-
-    if "last_request_source" not in st.session_state:
-        st.session_state.last_request_source = None
-
+    "last_request_metrics": lambda: None,
+    "last_request_source": lambda: None,
     # Historique Mode Interactif (par triage complété)
-    if "interactive_metrics_history" not in st.session_state:
-        st.session_state.interactive_metrics_history = []
-
+    "interactive_metrics_history": list,
     # Historique des niveaux de triage Mode Interactif (ROUGE, JAUNE, VERT, GRIS)
-    if "interactive_triage_history" not in st.session_state:
-        st.session_state.interactive_triage_history = []
-
+    "interactive_triage_history": list,
     # Métriques de la session interactive en cours (accumulées jusqu'au triage)
-    if "current_interactive_session_metrics" not in st.session_state:
-        st.session_state.current_interactive_session_metrics = {
-            'cost_usd': 0,
-            'gwp_kgco2': 0,
-            'energy_kwh': 0,
-            'nb_calls': 0
-        }
+    "current_interactive_session_metrics": _current_interactive_session_metrics,
+    # Compteur des triages enregistrés dans l'historique par cette session
+    # (les statistiques du Dashboard ne sont re-téléchargées que s'il a changé)
+    "history_version": int,
+    # Accueil : conversation chargée et résultat du copilote
+    "conversation_data": lambda: None,
+    "conversation_body": lambda: None,
+    "analysis_done": lambda: False,
+    "agent_result": lambda: None,
+    "selected_conversation": lambda: None,
+    "selected_conversation_info": lambda: None,
+}
+
+
+def init_session_state(defaults: dict = SESSION_DEFAULTS):
+    """Initialise les session states absents (globaux par défaut, ou ceux d'une page)."""
+    for key, factory in defaults.items():
+        if key not in st.session_state:
+            st.session_state[key] = factory()
@@ -8,6 +8,11 @@ Design professionnel pour application médicale avec:
 - Design responsive et accessible
 """
 
+import re
+import textwrap
+from html import escape
+from typing import Dict, List, Tuple
+
 import streamlit as st
 
 
@@ -32,679 +37,779 @@ def configure_page(page_title: str = "MedTriage-AI", page_icon: str = "🏥"):
         }
     )
 
-def apply_style():
-    """Applique le style CSS moderne à toutes les pages."""
+# Stage MLFlow -> (fond, texte) du badge
+STAGE_BADGE_COLORS = {
+    "Production": ("var(--triage-vert)", "white"),
+    "Staging": ("var(--triage-jaune)", "white"),
+    "Archived": ("var(--triage-gris)", "white"),
+    "None": ("var(--bg-primary)", "var(--text-secondary)")
+}
+
+# Rôle d'un message -> (classe CSS, avatar) dans le replay des conversations
+TRANSCRIPT_ROLES = {
+    "infirmier": ("infirmier", "🧑‍⚕️"),
+    "patient": ("patient", "🤒"),
+}
+
+# Feuille de style de l'application (source lisible, minifiée une fois à l'import)
+_APP_CSS = """
+<style>
+    /* ============================================
+       IMPORTS & VARIABLES
+       ============================================ */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+
+    :root {
+        /* Couleurs principales - Palette médicale professionnelle */
+        --primary-color: #0066CC;
+        --primary-dark: #004999;
+        --primary-light: #E6F0FF;
+
+        /* Couleurs de triage */
+        --triage-rouge: #DC2626;
+        --triage-rouge-bg: #FEE2E2;
+        --triage-jaune: #F59E0B;
+        --triage-jaune-bg: #FEF3C7;
+        --triage-vert: #10B981;
+        --triage-vert-bg: #D1FAE5;
+        --triage-gris: #6B7280;
+        --triage-gris-bg: #F3F4F6;
+
+        /* Neutres */
+        --bg-primary: #F8FAFC;
+        --bg-secondary: #FFFFFF;
+        --bg-sidebar: #0F172A;
+        --text-primary: #1E293B;
+        --text-secondary: #64748B;
+        --text-muted: #94A3B8;
+        --border-color: #E2E8F0;
+
+        /* Ombres */
+        --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
+        --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
+        --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
+        --shadow-xl: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
+
+        /* Transitions */
+        --transition-fast: 150ms ease;
+        --transition-normal: 250ms ease;
+
+        /* Border radius */
+        --radius-sm: 6px;
+        --radius-md: 10px;
+        --radius-lg: 16px;
+        --radius-xl: 24px;
+    }
 
-    # Configuration de la page
-    st.markdown("""
-    <style>
-        /* ============================================
-           IMPORTS & VARIABLES
-           ============================================ */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-        :root {
-            /* Couleurs principales - Palette médicale professionnelle */
-            --primary-color: #0066CC;
-            --primary-dark: #004999;
-            --primary-light: #E6F0FF;
-
-            /* Couleurs de triage */
-            --triage-rouge: #DC2626;
-            --triage-rouge-bg: #FEE2E2;
-            --triage-jaune: #F59E0B;
-            --triage-jaune-bg: #FEF3C7;
-            --triage-vert: #10B981;
-            --triage-vert-bg: #D1FAE5;
-            --triage-gris: #6B7280;
-            --triage-gris-bg: #F3F4F6;
-
-            /* Neutres */
-            --bg-primary: #F8FAFC;
-            --bg-secondary: #FFFFFF;
-            --bg-sidebar: #0F172A;
-            --text-primary: #1E293B;
-            --text-secondary: #64748B;
-            --text-muted: #94A3B8;
-            --border-color: #E2E8F0;
-
-            /* Ombres */
-            --shadow-sm: 0 1px 2px 0 rgba(0, 0, 0, 0.05);
-            --shadow-md: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-            --shadow-lg: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05);
-            --shadow-xl: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-
-            /* Transitions */
-            --transition-fast: 150ms ease;
-            --transition-normal: 250ms ease;
-
-            /* Border radius */
-            --radius-sm: 6px;
-            --radius-md: 10px;
-            --radius-lg: 16px;
-            --radius-xl: 24px;
-        }
+    /* ============================================
+       BASE STYLES
+       ============================================ */
+    html, body, [class*="css"] {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+        color: var(--text-primary);
+    }
 
-        /* ============================================
-           BASE STYLES
-           ============================================ */
-        html, body, [class*="css"] {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            color: var(--text-primary);
-        }
+    .main {
+        background-color: var(--bg-primary);
+    }
 
-        .main {
-            background-color: var(--bg-primary);
-        }
+    .main .block-container {
+        max-width: 100%;
+        padding: 1rem 2rem;
+    }
 
-        .main .block-container {
-            max-width: 100%;
-            padding: 1rem 2rem;
-        }
+    /* ============================================
+       SIDEBAR - Design moderne sombre
+       ============================================ */
+    section[data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #0F172A 0%, #1E293B 100%);
+        border-right: 1px solid rgba(255, 255, 255, 0.1);
+    }
 
-        /* ============================================
-           SIDEBAR - Design moderne sombre
-           ============================================ */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #0F172A 0%, #1E293B 100%);
-            border-right: 1px solid rgba(255, 255, 255, 0.1);
-        }
+    section[data-testid="stSidebar"] > div:first-child {
+        padding-top: 1rem;
+    }
 
-        section[data-testid="stSidebar"] > div:first-child {
-            padding-top: 1rem;
-        }
+    /* Logo/Header dans sidebar */
+    section[data-testid="stSidebar"] [data-testid="stSidebarHeader"] {
+        background: transparent;
+        padding: 1.5rem 1rem;
+        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
+        margin-bottom: 1rem;
+    }
 
-        /* Logo/Header dans sidebar */
-        section[data-testid="stSidebar"] [data-testid="stSidebarHeader"] {
-            background: transparent;
-            padding: 1.5rem 1rem;
-            border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-            margin-bottom: 1rem;
-        }
+    /* Style des liens de navigation */
+    section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a {
+        background: rgba(255, 255, 255, 0.05);
+        border-radius: var(--radius-md);
+        margin: 4px 12px;
+        padding: 12px 16px;
+        transition: all var(--transition-normal);
+        border: 1px solid transparent;
+    }
 
-        /* Style des liens de navigation */
-        section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a {
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: var(--radius-md);
-            margin: 4px 12px;
-            padding: 12px 16px;
-            transition: all var(--transition-normal);
-            border: 1px solid transparent;
-        }
+    section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a:hover {
+        background: rgba(255, 255, 255, 0.1);
+        border-color: rgba(255, 255, 255, 0.2);
+        transform: translateX(4px);
+    }
 
-        section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a:hover {
-            background: rgba(255, 255, 255, 0.1);
-            border-color: rgba(255, 255, 255, 0.2);
-            transform: translateX(4px);
-        }
+    section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a[aria-selected="true"] {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
+        border-color: var(--primary-color);
+        box-shadow: 0 4px 12px rgba(0, 102, 204, 0.4);
+    }
 
-        section[data-testid="stSidebar"] [data-testid="stSidebarNav"] a[aria-selected="true"] {
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
-            border-color: var(--primary-color);
-            box-shadow: 0 4px 12px rgba(0, 102, 204, 0.4);
-        }
+    section[data-testid="stSidebar"] a span {
+        color: rgba(255, 255, 255, 0.9) !important;
+        font-weight: 500;
+        font-size: 0.95rem;
+    }
 
-        section[data-testid="stSidebar"] a span {
-            color: rgba(255, 255, 255, 0.9) !important;
-            font-weight: 500;
-            font-size: 0.95rem;
-        }
+    /* Texte dans la sidebar */
+    section[data-testid="stSidebar"] p,
+    section[data-testid="stSidebar"] span,
+    section[data-testid="stSidebar"] label,
+    section[data-testid="stSidebar"] .stMarkdown {
+        color: rgba(255, 255, 255, 0.85) !important;
+    }
 
-        /* Texte dans la sidebar */
-        section[data-testid="stSidebar"] p,
-        section[data-testid="stSidebar"] span,
-        section[data-testid="stSidebar"] label,
-        section[data-testid="stSidebar"] .stMarkdown {
-            color: rgba(255, 255, 255, 0.85) !important;
-        }
+    section[data-testid="stSidebar"] h1,
+    section[data-testid="stSidebar"] h2,
+    section[data-testid="stSidebar"] h3 {
+        color: white !important;
+        font-weight: 600;
+    }
 
-        section[data-testid="stSidebar"] h1,
-        section[data-testid="stSidebar"] h2,
-        section[data-testid="stSidebar"] h3 {
-            color: white !important;
-            font-weight: 600;
-        }
+    /* Boutons dans sidebar */
+    section[data-testid="stSidebar"] button {
+        background: rgba(255, 255, 255, 0.1) !important;
+        border: 1px solid rgba(255, 255, 255, 0.2) !important;
+        color: white !important;
+        transition: all var(--transition-normal);
+    }
 
-        /* Boutons dans sidebar */
-        section[data-testid="stSidebar"] button {
-            background: rgba(255, 255, 255, 0.1) !important;
-            border: 1px solid rgba(255, 255, 255, 0.2) !important;
-            color: white !important;
-            transition: all var(--transition-normal);
-        }
+    section[data-testid="stSidebar"] button:hover {
+        background: rgba(255, 255, 255, 0.2) !important;
+        border-color: rgba(255, 255, 255, 0.4) !important;
+    }
 
-        section[data-testid="stSidebar"] button:hover {
-            background: rgba(255, 255, 255, 0.2) !important;
-            border-color: rgba(255, 255, 255, 0.4) !important;
-        }
+    /* ============================================
+       HEADER
+       ============================================ */
+    .app-header {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
+        padding: 1.5rem 2rem;
+        margin: -1rem -2rem 2rem -2rem;
+        border-radius: 0 0 var(--radius-xl) var(--radius-xl);
+        box-shadow: var(--shadow-lg);
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+    }
 
-        /* ============================================
-           HEADER
-           ============================================ */
-        .app-header {
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
-            padding: 1.5rem 2rem;
-            margin: -1rem -2rem 2rem -2rem;
-            border-radius: 0 0 var(--radius-xl) var(--radius-xl);
-            box-shadow: var(--shadow-lg);
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
+    .app-header h1 {
+        color: white !important;
+        margin: 0 !important;
+        font-weight: 700;
+        font-size: 1.75rem;
+        display: flex;
+        align-items: center;
+        gap: 12px;
+    }
 
-        .app-header h1 {
-            color: white !important;
-            margin: 0 !important;
-            font-weight: 700;
-            font-size: 1.75rem;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }
+    .app-header .subtitle {
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 0.9rem;
+        margin-top: 4px;
+    }
 
-        .app-header .subtitle {
-            color: rgba(255, 255, 255, 0.8);
-            font-size: 0.9rem;
-            margin-top: 4px;
-        }
+    /* ============================================
+       TITRES ET TYPOGRAPHIE
+       ============================================ */
+    h1 {
+        color: var(--text-primary) !important;
+        font-weight: 700 !important;
+        font-size: 2rem !important;
+        margin-bottom: 0.5rem !important;
+    }
 
-        /* ============================================
-           TITRES ET TYPOGRAPHIE
-           ============================================ */
-        h1 {
-            color: var(--text-primary) !important;
-            font-weight: 700 !important;
-            font-size: 2rem !important;
-            margin-bottom: 0.5rem !important;
-        }
+    h2 {
+        color: var(--text-primary) !important;
+        font-weight: 600 !important;
+        font-size: 1.5rem !important;
+        margin-top: 1.5rem !important;
+    }
 
-        h2 {
-            color: var(--text-primary) !important;
-            font-weight: 600 !important;
-            font-size: 1.5rem !important;
-            margin-top: 1.5rem !important;
-        }
+    h3 {
+        color: var(--text-secondary) !important;
+        font-weight: 600 !important;
+        font-size: 1.1rem !important;
+    }
 
-        h3 {
-            color: var(--text-secondary) !important;
-            font-weight: 600 !important;
-            font-size: 1.1rem !important;
-        }
+    .stCaption {
+        color: var(--text-muted) !important;
+        font-size: 0.9rem !important;
+    }
 
-        .stCaption {
-            color: var(--text-muted) !important;
-            font-size: 0.9rem !important;
-        }
+    /* ============================================
+       CARTES ET CONTENEURS
+       ============================================ */
+    .card {
+        background: var(--bg-secondary);
+        border-radius: var(--radius-lg);
+        padding: 1.5rem;
+        box-shadow: var(--shadow-md);
+        border: 1px solid var(--border-color);
+        transition: all var(--transition-normal);
+    }
 
-        /* ============================================
-           CARTES ET CONTENEURS
-           ============================================ */
-        .card {
-            background: var(--bg-secondary);
-            border-radius: var(--radius-lg);
-            padding: 1.5rem;
-            box-shadow: var(--shadow-md);
-            border: 1px solid var(--border-color);
-            transition: all var(--transition-normal);
-        }
+    .card:hover {
+        box-shadow: var(--shadow-lg);
+        transform: translateY(-2px);
+    }
 
-        .card:hover {
-            box-shadow: var(--shadow-lg);
-            transform: translateY(-2px);
-        }
+    .card-selected {
+        border-color: var(--primary-color);
+        box-shadow: 0 0 0 3px var(--primary-light);
+    }
 
-        .card-selected {
-            border-color: var(--primary-color);
-            box-shadow: 0 0 0 3px var(--primary-light);
-        }
+    /* Expanders */
+    .streamlit-expanderHeader {
+        background: var(--bg-secondary) !important;
+        border-radius: var(--radius-md) !important;
+        border: 1px solid var(--border-color) !important;
+        font-weight: 500 !important;
+        transition: all var(--transition-normal) !important;
+    }
 
-        /* Expanders */
-        .streamlit-expanderHeader {
-            background: var(--bg-secondary) !important;
-            border-radius: var(--radius-md) !important;
-            border: 1px solid var(--border-color) !important;
-            font-weight: 500 !important;
-            transition: all var(--transition-normal) !important;
-        }
+    .streamlit-expanderHeader:hover {
+        background: var(--bg-primary) !important;
+        border-color: var(--primary-color) !important;
+    }
 
-        .streamlit-expanderHeader:hover {
-            background: var(--bg-primary) !important;
-            border-color: var(--primary-color) !important;
-        }
+    .streamlit-expanderContent {
+        background: var(--bg-secondary) !important;
+        border: 1px solid var(--border-color) !important;
+        border-top: none !important;
+        border-radius: 0 0 var(--radius-md) var(--radius-md) !important;
+    }
 
-        .streamlit-expanderContent {
-            background: var(--bg-secondary) !important;
-            border: 1px solid var(--border-color) !important;
-            border-top: none !important;
-            border-radius: 0 0 var(--radius-md) var(--radius-md) !important;
-        }
+    /* ============================================
+       BOUTONS
+       ============================================ */
+    .stButton > button {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
+        color: white !important;
+        border: none;
+        border-radius: var(--radius-md);
+        padding: 0.6rem 1.5rem;
+        font-weight: 600;
+        font-size: 0.95rem;
+        transition: all var(--transition-normal);
+        box-shadow: var(--shadow-sm);
+    }
 
-        /* ============================================
-           BOUTONS
-           ============================================ */
-        .stButton > button {
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%);
-            color: white !important;
-            border: none;
-            border-radius: var(--radius-md);
-            padding: 0.6rem 1.5rem;
-            font-weight: 600;
-            font-size: 0.95rem;
-            transition: all var(--transition-normal);
-            box-shadow: var(--shadow-sm);
-        }
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: var(--shadow-md);
+        filter: brightness(1.1);
+    }
 
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-md);
-            filter: brightness(1.1);
-        }
+    .stButton > button:active {
+        transform: translateY(0);
+    }
 
-        .stButton > button:active {
-            transform: translateY(0);
-        }
+    /* Bouton secondaire */
+    .stButton > button[kind="secondary"],
+    div[data-testid="stButton"] button[kind="secondary"] {
+        background: var(--bg-secondary) !important;
+        color: var(--text-primary) !important;
+        border: 2px solid var(--border-color) !important;
+    }
 
-        /* Bouton secondaire */
-        .stButton > button[kind="secondary"],
-        div[data-testid="stButton"] button[kind="secondary"] {
-            background: var(--bg-secondary) !important;
-            color: var(--text-primary) !important;
-            border: 2px solid var(--border-color) !important;
-        }
+    .stButton > button[kind="secondary"]:hover {
+        border-color: var(--primary-color) !important;
+        color: var(--primary-color) !important;
+    }
 
-        .stButton > button[kind="secondary"]:hover {
-            border-color: var(--primary-color) !important;
-            color: var(--primary-color) !important;
-        }
+    /* Bouton désactivé */
+    .stButton > button:disabled {
+        background: var(--triage-gris-bg) !important;
+        color: var(--text-muted) !important;
+        cursor: not-allowed;
+        transform: none !important;
+        box-shadow: none !important;
+    }
 
-        /* Bouton désactivé */
-        .stButton > button:disabled {
-            background: var(--triage-gris-bg) !important;
-            color: var(--text-muted) !important;
-            cursor: not-allowed;
-            transform: none !important;
-            box-shadow: none !important;
-        }
+    /* ============================================
+       BADGES DE TRIAGE
+       ============================================ */
+    .triage-badge {
+        padding: 1.25rem 1.5rem;
+        border-radius: var(--radius-lg);
+        text-align: center;
+        margin-bottom: 1.5rem;
+        font-weight: 700;
+        font-size: 1.3rem;
+        color: white !important;
+        text-transform: uppercase;
+        letter-spacing: 2px;
+        box-shadow: var(--shadow-lg);
+        position: relative;
+        overflow: hidden;
+    }
 
-        /* ============================================
-           BADGES DE TRIAGE
-           ============================================ */
-        .triage-badge {
-            padding: 1.25rem 1.5rem;
-            border-radius: var(--radius-lg);
-            text-align: center;
-            margin-bottom: 1.5rem;
-            font-weight: 700;
-            font-size: 1.3rem;
-            color: white !important;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            box-shadow: var(--shadow-lg);
-            position: relative;
-            overflow: hidden;
-        }
+    .triage-badge::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: 0;
+        right: 0;
+        bottom: 0;
+        background: linear-gradient(135deg, rgba(255,255,255,0.2) 0%, rgba(255,255,255,0) 100%);
+        pointer-events: none;
+    }
 
-        .triage-badge::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(135deg, rgba(255,255,255,0.2) 0%, rgba(255,255,255,0) 100%);
-            pointer-events: none;
-        }
+    .triage-rouge {
+        background: linear-gradient(135deg, #DC2626 0%, #B91C1C 100%);
+        animation: pulse-red 2s infinite;
+    }
 
-        .triage-rouge {
-            background: linear-gradient(135deg, #DC2626 0%, #B91C1C 100%);
-            animation: pulse-red 2s infinite;
-        }
+    .triage-jaune {
+        background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
+    }
 
-        .triage-jaune {
-            background: linear-gradient(135deg, #F59E0B 0%, #D97706 100%);
-        }
+    .triage-vert {
+        background: linear-gradient(135deg, #10B981 0%, #059669 100%);
+    }
 
-        .triage-vert {
-            background: linear-gradient(135deg, #10B981 0%, #059669 100%);
-        }
+    .triage-gris {
+        background: linear-gradient(135deg, #6B7280 0%, #4B5563 100%);
+    }
 
-        .triage-gris {
-            background: linear-gradient(135deg, #6B7280 0%, #4B5563 100%);
-        }
+    @keyframes pulse-red {
+        0%, 100% { box-shadow: 0 0 0 0 rgba(220, 38, 38, 0.4); }
+        50% { box-shadow: 0 0 0 15px rgba(220, 38, 38, 0); }
+    }
 
-        @keyframes pulse-red {
-            0%, 100% { box-shadow: 0 0 0 0 rgba(220, 38, 38, 0.4); }
-            50% { box-shadow: 0 0 0 15px rgba(220, 38, 38, 0); }
-        }
+    /* ============================================
+       MÉTRIQUES
+       ============================================ */
+    [data-testid="stMetric"] {
+        background: var(--bg-secondary);
+        padding: 1.25rem;
+        border-radius: var(--radius-md);
+        border: 1px solid var(--border-color);
+        box-shadow: var(--shadow-sm);
+        transition: all var(--transition-normal);
+    }
 
-        /* ============================================
-           MÉTRIQUES
-           ============================================ */
-        [data-testid="stMetric"] {
-            background: var(--bg-secondary);
-            padding: 1.25rem;
-            border-radius: var(--radius-md);
-            border: 1px solid var(--border-color);
-            box-shadow: var(--shadow-sm);
-            transition: all var(--transition-normal);
-        }
+    [data-testid="stMetric"]:hover {
+        box-shadow: var(--shadow-md);
+        border-color: var(--primary-light);
+    }
 
-        [data-testid="stMetric"]:hover {
-            box-shadow: var(--shadow-md);
-            border-color: var(--primary-light);
-        }
+    [data-testid="stMetricLabel"] {
+        color: var(--text-secondary) !important;
+        font-weight: 500 !important;
+        font-size: 0.85rem !important;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
 
-        [data-testid="stMetricLabel"] {
-            color: var(--text-secondary) !important;
-            font-weight: 500 !important;
-            font-size: 0.85rem !important;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
+    [data-testid="stMetricValue"] {
+        color: var(--text-primary) !important;
+        font-weight: 700 !important;
+        font-size: 1.75rem !important;
+    }
 
-        [data-testid="stMetricValue"] {
-            color: var(--text-primary) !important;
-            font-weight: 700 !important;
-            font-size: 1.75rem !important;
-        }
+    /* ============================================
+       INPUTS ET FORMULAIRES
+       ============================================ */
+    .stTextInput > div > div > input,
+    .stTextArea > div > div > textarea,
+    .stSelectbox > div > div {
+        border-radius: var(--radius-md) !important;
+        border: 2px solid var(--border-color) !important;
+        transition: all var(--transition-normal) !important;
+    }
 
-        /* ============================================
-           INPUTS ET FORMULAIRES
-           ============================================ */
-        .stTextInput > div > div > input,
-        .stTextArea > div > div > textarea,
-        .stSelectbox > div > div {
-            border-radius: var(--radius-md) !important;
-            border: 2px solid var(--border-color) !important;
-            transition: all var(--transition-normal) !important;
-        }
+    .stTextInput > div > div > input:focus,
+    .stTextArea > div > div > textarea:focus {
+        border-color: var(--primary-color) !important;
+        box-shadow: 0 0 0 3px var(--primary-light) !important;
+    }
 
-        .stTextInput > div > div > input:focus,
-        .stTextArea > div > div > textarea:focus {
-            border-color: var(--primary-color) !important;
-            box-shadow: 0 0 0 3px var(--primary-light) !important;
-        }
+    /* ============================================
+       CHAT
+       ============================================ */
+    .stChatMessage {
+        background: var(--bg-secondary) !important;
+        border-radius: var(--radius-lg) !important;
+        padding: 1rem !important;
+        margin-bottom: 0.75rem !important;
+        border: 1px solid var(--border-color) !important;
+        box-shadow: var(--shadow-sm) !important;
+    }
 
-        /* ============================================
-           CHAT
-           ============================================ */
-        .stChatMessage {
-            background: var(--bg-secondary) !important;
-            border-radius: var(--radius-lg) !important;
-            padding: 1rem !important;
-            margin-bottom: 0.75rem !important;
-            border: 1px solid var(--border-color) !important;
-            box-shadow: var(--shadow-sm) !important;
-        }
+    [data-testid="stChatMessageContent"] {
+        font-size: 0.95rem !important;
+        line-height: 1.6 !important;
+    }
 
-        [data-testid="stChatMessageContent"] {
-            font-size: 0.95rem !important;
-            line-height: 1.6 !important;
-        }
+    /* Chat input */
+    .stChatInputContainer {
+        border-radius: var(--radius-lg) !important;
+        border: 2px solid var(--border-color) !important;
+        background: var(--bg-secondary) !important;
+        padding: 0.5rem !important;
+    }
 
-        /* Chat input */
-        .stChatInputContainer {
-            border-radius: var(--radius-lg) !important;
-            border: 2px solid var(--border-color) !important;
-            background: var(--bg-secondary) !important;
-            padding: 0.5rem !important;
-        }
+    .stChatInputContainer:focus-within {
+        border-color: var(--primary-color) !important;
+        box-shadow: 0 0 0 3px var(--primary-light) !important;
+    }
 
-        .stChatInputContainer:focus-within {
-            border-color: var(--primary-color) !important;
-            box-shadow: 0 0 0 3px var(--primary-light) !important;
-        }
+    /* ============================================
+       ALERTES ET MESSAGES
+       ============================================ */
+    .stAlert {
+        border-radius: var(--radius-md) !important;
+        border-left-width: 4px !important;
+    }
 
-        /* ============================================
-           ALERTES ET MESSAGES
-           ============================================ */
-        .stAlert {
-            border-radius: var(--radius-md) !important;
-            border-left-width: 4px !important;
-        }
+    div[data-testid="stAlert"][data-baseweb="notification"] {
+        background: var(--bg-secondary) !important;
+    }
 
-        div[data-testid="stAlert"][data-baseweb="notification"] {
-            background: var(--bg-secondary) !important;
-        }
+    /* Info */
+    .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentInfo"]) {
+        background: var(--primary-light) !important;
+        border-left-color: var(--primary-color) !important;
+    }
 
-        /* Info */
-        .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentInfo"]) {
-            background: var(--primary-light) !important;
-            border-left-color: var(--primary-color) !important;
-        }
+    /* Success */
+    .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentSuccess"]) {
+        background: var(--triage-vert-bg) !important;
+        border-left-color: var(--triage-vert) !important;
+    }
 
-        /* Success */
-        .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentSuccess"]) {
-            background: var(--triage-vert-bg) !important;
-            border-left-color: var(--triage-vert) !important;
-        }
+    /* Warning */
+    .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentWarning"]) {
+        background: var(--triage-jaune-bg) !important;
+        border-left-color: var(--triage-jaune) !important;
+    }
 
-        /* Warning */
-        .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentWarning"]) {
-            background: var(--triage-jaune-bg) !important;
-            border-left-color: var(--triage-jaune) !important;
-        }
+    /* Error */
+    .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentError"]) {
+        background: var(--triage-rouge-bg) !important;
+        border-left-color: var(--triage-rouge) !important;
+    }
 
-        /* Error */
-        .element-container div[data-testid="stAlert"]:has([data-testid="stNotificationContentError"]) {
-            background: var(--triage-rouge-bg) !important;
-            border-left-color: var(--triage-rouge) !important;
-        }
+    /* ============================================
+       TABS
+       ============================================ */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background: var(--bg-secondary);
+        padding: 8px;
+        border-radius: var(--radius-lg);
+        border: 1px solid var(--border-color);
+    }
 
-        /* ============================================
-           TABS
-           ============================================ */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            background: var(--bg-secondary);
-            padding: 8px;
-            border-radius: var(--radius-lg);
-            border: 1px solid var(--border-color);
-        }
+    .stTabs [data-baseweb="tab"] {
+        border-radius: var(--radius-md);
+        padding: 10px 20px;
+        font-weight: 500;
+        transition: all var(--transition-normal);
+    }
 
-        .stTabs [data-baseweb="tab"] {
-            border-radius: var(--radius-md);
-            padding: 10px 20px;
-            font-weight: 500;
-            transition: all var(--transition-normal);
-        }
+    .stTabs [data-baseweb="tab"]:hover {
+        background: var(--bg-primary);
+    }
 
-        .stTabs [data-baseweb="tab"]:hover {
-            background: var(--bg-primary);
-        }
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%) !important;
+        color: white !important;
+    }
 
-        .stTabs [aria-selected="true"] {
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--primary-dark) 100%) !important;
-            color: white !important;
-        }
+    .stTabs [data-baseweb="tab-highlight"] {
+        display: none;
+    }
 
-        .stTabs [data-baseweb="tab-highlight"] {
-            display: none;
-        }
+    /* ============================================
+       JSON VIEWER
+       ============================================ */
+    .stJson {
+        background: #1E293B !important;
+        border-radius: var(--radius-md) !important;
+        padding: 1rem !important;
+        font-size: 0.85rem !important;
+    }
 
-        /* ============================================
-           JSON VIEWER
-           ============================================ */
-        .stJson {
-            background: #1E293B !important;
-            border-radius: var(--radius-md) !important;
-            padding: 1rem !important;
-            font-size: 0.85rem !important;
-        }
+    /* ============================================
+       PROGRESS BARS
+       ============================================ */
+    .stProgress > div > div {
+        background: var(--border-color) !important;
+        border-radius: var(--radius-sm) !important;
+    }
 
-        /* ============================================
-           PROGRESS BARS
-           ============================================ */
-        .stProgress > div > div {
-            background: var(--border-color) !important;
-            border-radius: var(--radius-sm) !important;
-        }
+    .stProgress > div > div > div {
+        background: linear-gradient(135deg, var(--primary-color) 0%, var(--triage-vert) 100%) !important;
+        border-radius: var(--radius-sm) !important;
+    }
 
-        .stProgress > div > div > div {
-            background: linear-gradient(135deg, var(--primary-color) 0%, var(--triage-vert) 100%) !important;
-            border-radius: var(--radius-sm) !important;
-        }
+    /* ============================================
+       SPINNERS
+       ============================================ */
+    .stSpinner > div {
+        border-top-color: var(--primary-color) !important;
+    }
 
-        /* ============================================
-           SPINNERS
-           ============================================ */
-        .stSpinner > div {
-            border-top-color: var(--primary-color) !important;
-        }
+    /* ============================================
+       PATIENT CARDS (Custom)
+       ============================================ */
+    .patient-card {
+        background: var(--bg-secondary);
+        border-radius: var(--radius-lg);
+        padding: 1.5rem;
+        border: 2px solid var(--border-color);
+        transition: all var(--transition-normal);
+        cursor: pointer;
+        min-height: 140px;
+    }
 
-        /* ============================================
-           PATIENT CARDS (Custom)
-           ============================================ */
-        .patient-card {
-            background: var(--bg-secondary);
-            border-radius: var(--radius-lg);
-            padding: 1.5rem;
-            border: 2px solid var(--border-color);
-            transition: all var(--transition-normal);
-            cursor: pointer;
-            min-height: 140px;
-        }
+    .patient-card:hover {
+        border-color: var(--primary-color);
+        box-shadow: var(--shadow-md);
+        transform: translateY(-4px);
+    }
 
-        .patient-card:hover {
-            border-color: var(--primary-color);
-            box-shadow: var(--shadow-md);
-            transform: translateY(-4px);
-        }
+    .patient-card.selected {
+        border-color: var(--primary-color);
+        background: var(--primary-light);
+        box-shadow: 0 0 0 4px rgba(0, 102, 204, 0.2);
+    }
 
-        .patient-card.selected {
-            border-color: var(--primary-color);
-            background: var(--primary-light);
-            box-shadow: 0 0 0 4px rgba(0, 102, 204, 0.2);
-        }
+    .patient-card-icon {
+        font-size: 2.5rem;
+        text-align: center;
+        margin-bottom: 0.75rem;
+    }
 
-        .patient-card-icon {
-            font-size: 2.5rem;
-            text-align: center;
-            margin-bottom: 0.75rem;
-        }
+    .patient-card-title {
+        font-weight: 600;
+        font-size: 1rem;
+        text-align: center;
+        color: var(--text-primary);
+        margin-bottom: 0.5rem;
+    }
 
-        .patient-card-title {
-            font-weight: 600;
-            font-size: 1rem;
-            text-align: center;
-            color: var(--text-primary);
-            margin-bottom: 0.5rem;
-        }
+    .patient-card-level {
+        font-size: 0.85rem;
+        text-align: center;
+        color: var(--text-secondary);
+        padding: 4px 12px;
+        background: var(--bg-primary);
+        border-radius: var(--radius-sm);
+        display: inline-block;
+    }
 
-        .patient-card-level {
-            font-size: 0.85rem;
-            text-align: center;
-            color: var(--text-secondary);
-            padding: 4px 12px;
-            background: var(--bg-primary);
-            border-radius: var(--radius-sm);
-            display: inline-block;
-        }
+    /* ============================================
+       DATA PANEL (Mode Interactif)
+       ============================================ */
+    .data-panel {
+        background: var(--bg-secondary);
+        border-radius: var(--radius-lg);
+        padding: 1.5rem;
+        border: 1px solid var(--border-color);
+        height: 100%;
+    }
 
-        /* ============================================
-           DATA PANEL (Mode Interactif)
-           ============================================ */
-        .data-panel {
-            background: var(--bg-secondary);
-            border-radius: var(--radius-lg);
-            padding: 1.5rem;
-            border: 1px solid var(--border-color);
-            height: 100%;
-        }
+    .data-panel-header {
+        display: flex;
+        align-items: center;
+        gap: 8px;
+        margin-bottom: 1rem;
+        padding-bottom: 0.75rem;
+        border-bottom: 1px solid var(--border-color);
+    }
 
-        .data-panel-header {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            margin-bottom: 1rem;
-            padding-bottom: 0.75rem;
-            border-bottom: 1px solid var(--border-color);
-        }
+    .data-panel-header h3 {
+        margin: 0 !important;
+        color: var(--text-primary) !important;
+    }
 
-        .data-panel-header h3 {
-            margin: 0 !important;
-            color: var(--text-primary) !important;
-        }
+    /* ============================================
+       METRIC CARDS (Accueil)
+       ============================================ */
+    .metric-row {
+        display: flex;
+        gap: 12px;
+        margin-bottom: 1rem;
+    }
 
-        /* ============================================
-           SCROLLBAR CUSTOM
-           ============================================ */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
+    .metric-card {
+        flex: 1;
+        background: var(--bg-secondary);
+        border: 1px solid var(--border-color);
+        border-radius: var(--radius-md);
+        padding: 0.75rem 1rem;
+    }
 
-        ::-webkit-scrollbar-track {
-            background: var(--bg-primary);
-            border-radius: 4px;
-        }
+    .metric-card-label {
+        color: var(--text-secondary);
+        font-size: 0.85rem;
+    }
 
-        ::-webkit-scrollbar-thumb {
-            background: var(--text-muted);
-            border-radius: 4px;
-        }
+    .metric-card-value {
+        color: var(--text-primary);
+        font-size: 1.5rem;
+        font-weight: 600;
+    }
 
-        ::-webkit-scrollbar-thumb:hover {
-            background: var(--text-secondary);
-        }
+    /* ============================================
+       TRANSCRIPT (Replay Accueil)
+       ============================================ */
+    .transcript-msg {
+        display: flex;
+        gap: 10px;
+        align-items: flex-start;
+        padding: 0.5rem 0.75rem;
+        margin-bottom: 0.5rem;
+        border-radius: var(--radius-md);
+    }
 
-        /* ============================================
-           ANIMATIONS
-           ============================================ */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
+    .transcript-msg.infirmier {
+        background: var(--bg-secondary);
+    }
 
-        .animate-fade-in {
-            animation: fadeIn 0.3s ease-out;
-        }
+    .transcript-msg.patient {
+        background: var(--bg-primary);
+    }
 
-        @keyframes slideIn {
-            from { opacity: 0; transform: translateX(-20px); }
-            to { opacity: 1; transform: translateX(0); }
+    .transcript {
+        border: 1px solid var(--border-color);
+        border-radius: var(--radius-md);
+        padding: 0.5rem 1rem;
+        margin-bottom: 1rem;
+    }
+
+    .transcript summary {
+        cursor: pointer;
+        font-weight: 600;
+        padding: 0.25rem 0;
+    }
+
+    .transcript-body {
+        max-height: 300px;
+        overflow-y: auto;
+        margin-top: 0.5rem;
+    }
+
+    .transcript-avatar {
+        font-size: 1.25rem;
+        line-height: 1.5rem;
+    }
+
+    /* ============================================
+       SCROLLBAR CUSTOM
+       ============================================ */
+    ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+
+    ::-webkit-scrollbar-track {
+        background: var(--bg-primary);
+        border-radius: 4px;
+    }
+
+    ::-webkit-scrollbar-thumb {
+        background: var(--text-muted);
+        border-radius: 4px;
+    }
+
+    ::-webkit-scrollbar-thumb:hover {
+        background: var(--text-secondary);
+    }
+
+    /* ============================================
+       ANIMATIONS
+       ============================================ */
+    @keyframes fadeIn {
+        from { opacity: 0; transform: translateY(10px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+
+    .animate-fade-in {
+        animation: fadeIn 0.3s ease-out;
+    }
+
+    @keyframes slideIn {
+        from { opacity: 0; transform: translateX(-20px); }
+        to { opacity: 1; transform: translateX(0); }
+    }
+
+    .animate-slide-in {
+        animation: slideIn 0.4s ease-out;
+    }
+
+    /* ============================================
+       RESPONSIVE
+       ============================================ */
+    @media (max-width: 768px) {
+        .main .block-container {
+            padding: 0.5rem 1rem;
         }
 
-        .animate-slide-in {
-            animation: slideIn 0.4s ease-out;
+        .app-header {
+            margin: -0.5rem -1rem 1.5rem -1rem;
+            padding: 1rem 1.5rem;
+            flex-direction: column;
+            text-align: center;
         }
 
-        /* ============================================
-           RESPONSIVE
-           ============================================ */
-        @media (max-width: 768px) {
-            .main .block-container {
-                padding: 0.5rem 1rem;
-            }
-
-            .app-header {
-                margin: -0.5rem -1rem 1.5rem -1rem;
-                padding: 1rem 1.5rem;
-                flex-direction: column;
-                text-align: center;
-            }
-
-            h1 {
-                font-size: 1.5rem !important;
-            }
+        h1 {
+            font-size: 1.5rem !important;
         }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Header de l'application
-    st.markdown('''
-    <div class="app-header">
-        <div>
-            <h1>
-                <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                    <path d="M22 12h-4l-3 9L9 3l-3 9H2"/>
-                </svg>
-                MedTriage-AI
-            </h1>
-            <div class="subtitle">Assistance intelligente au triage des urgences</div>
-        </div>
+    }
+</style>
+"""
+
+# Header de l'application
+_APP_HEADER_HTML = """
+<div class="app-header">
+    <div>
+        <h1>
+            <svg width="32" height="32" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
+                <path d="M22 12h-4l-3 9L9 3l-3 9H2"/>
+            </svg>
+            MedTriage-AI
+        </h1>
+        <div class="subtitle">Assistance intelligente au triage des urgences</div>
     </div>
-    ''', unsafe_allow_html=True)
+</div>
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Retire commentaires et espaces superflus d'une feuille de style."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,>])\s*", r"\1", css).strip()
+
+
+# Style + header en un seul élément, construit une fois par process :
+# chaque rerun envoie une feuille de style compacte au lieu de ~700 lignes commentées
+APP_STYLE_HTML = _minify_css(_APP_CSS) + "\n\n" + textwrap.dedent(_APP_HEADER_HTML).strip()
+
+
+def apply_style():
+    """Applique le style CSS moderne à toutes les pages."""
+    st.markdown(APP_STYLE_HTML, unsafe_allow_html=True)
 
 
 def render_triage_badge(level: str, label: str = None) -> str:
@@ -739,13 +844,7 @@ def render_stage_badge(stage: str) -> str:
     Returns:
         Code HTML du badge
     """
-    colors = {
-        "Production": ("var(--triage-vert)", "white"),
-        "Staging": ("var(--triage-jaune)", "white"),
-        "Archived": ("var(--triage-gris)", "white"),
-        "None": ("var(--bg-primary)", "var(--text-secondary)")
-    }
-    bg_color, text_color = colors.get(stage, colors["None"])
+    bg_color, text_color = STAGE_BADGE_COLORS.get(stage, STAGE_BADGE_COLORS["None"])
 
     return f'''
     <div style="
@@ -828,3 +927,72 @@ def render_patient_card(icon: str, title: str, level: str, selected: bool = Fals
         </div>
     </div>
     '''
+
+
+def render_transcript(messages: List[Dict]) -> str:
+    """
+    Génère le HTML d'une conversation infirmier/patient.
+
+    Toute la conversation tient dans un seul élément Markdown au lieu
+    d'un st.chat_message (et d'un st.write) par message.
+
+    Args:
+        messages: Messages {"role", "content"} de la conversation
+
+    Returns:
+        Code HTML de la conversation
+    """
+    rows = []
+    for msg in messages:
+        role_class, avatar = TRANSCRIPT_ROLES.get(msg["role"], TRANSCRIPT_ROLES["patient"])
+        rows.append(
+            f'<div class="transcript-msg {role_class}">'
+            f'<span class="transcript-avatar">{avatar}</span>'
+            f'<span>{escape(str(msg["content"]))}</span>'
+            f'</div>'
+        )
+    return "".join(rows)
+
+
+def render_metric_row(metrics: List[Tuple[str, str]]) -> str:
+    """
+    Génère le HTML d'une rangée de cartes métriques.
+
+    Args:
+        metrics: Couples (libellé, valeur affichée)
+
+    Returns:
+        Code HTML de la rangée
+    """
+    cards = "".join(
+        f'<div class="metric-card">'
+        f'<div class="metric-card-label">{escape(label)}</div>'
+        f'<div class="metric-card-value">{escape(value)}</div>'
+        f'</div>'
+        for label, value in metrics
+    )
+    return f'<div class="metric-row">{cards}</div>'
+
+
+def render_transcript_details(label: str, messages: List[Dict], open_: bool = True) -> str:
+    """
+    Génère le HTML d'une conversation repliable (balise <details>).
+
+    Remplace st.expander + st.container : un seul élément, et le
+    pliage/dépliage se fait dans le navigateur sans rerun.
+
+    Args:
+        label: Titre affiché dans l'en-tête
+        messages: Messages {"role", "content"} de la conversation
+        open_: Si la conversation est dépliée à l'affichage
+
+    Returns:
+        Code HTML de la conversation
+    """
+    open_attr = " open" if open_ else ""
+    return (
+        f'<details class="transcript"{open_attr}>'
+        f'<summary>{escape(label)}</summary>'
+        f'<div class="transcript-body">{render_transcript(messages)}</div>'
+        f'</details>'
+    )